@@ -0,0 +1,58 @@
+"""
+Compare single stream and parallel range downloads against a fake storage
+service with injected latency and per-connection bandwidth.
+
+Run from the repository root::
+
+    python -m benchmarks.download --size-mb 64 --bandwidth-mb 32 --latency 0.05
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from tekdrive import TekDrive
+from tekdrive.models import File
+from tests.unit.fakes import FakeAPI, FakeStorage, FakeTransfers
+
+MB = 1024 * 1024
+
+
+def run(label, storage, file, path, size, **kwargs):
+    storage.calls.clear()
+    started = time.perf_counter()
+    file.download(path, **kwargs)
+    elapsed = time.perf_counter() - started
+    print(
+        f"{label:<16} {len(storage.calls):>5} requests "
+        f"{elapsed:>8.2f}s {size / MB / elapsed:>10.1f} MB/s"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size-mb", type=int, default=64)
+    parser.add_argument("--bandwidth-mb", type=float, default=32)
+    parser.add_argument("--latency", type=float, default=0.05)
+    args = parser.parse_args()
+
+    api = FakeAPI()
+    storage = FakeStorage(latency=args.latency, bandwidth=args.bandwidth_mb * MB)
+    FakeTransfers(api, storage)
+    tekdrive = TekDrive(access_key="benchmark")
+    tekdrive._session._request_wrapper._http = api
+    tekdrive._storage._http = storage
+    file = File(tekdrive, _data=dict(id="benchmark"))
+    size = args.size_mb * MB
+    storage.objects["/benchmark"] = os.urandom(size)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "capture.bin")
+        open(path, "wb").close()
+        run("single stream", storage, file, path, size)
+        for parallel in (2, 4, 8):
+            run(f"parallel={parallel}", storage, file, path, size, parallel=parallel)
+
+
+if __name__ == "__main__":
+    main()
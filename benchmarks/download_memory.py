@@ -0,0 +1,79 @@
+"""
+Compare peak memory of downloading the whole contents at once with streaming
+them to disk in chunks.
+
+Each mode runs in its own process so peak RSS is not shared between modes.
+Run from the repository root::
+
+    python -m benchmarks.download_memory --size-mb 256
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from tekdrive import TekDrive
+from tekdrive.models import File
+from tests.unit.fakes import FakeAPI, FakeStorage, FakeTransfers
+
+from .upload_memory import MB, peak_rss_mb
+
+MODES = ["contents", "stream"]
+
+
+def run(mode, size):
+    api = FakeAPI()
+    storage = FakeStorage()
+    FakeTransfers(api, storage)
+    tekdrive = TekDrive(access_key="benchmark")
+    tekdrive._session._request_wrapper._http = api
+    tekdrive._storage._http = storage
+    file = File(tekdrive, _data=dict(id="benchmark"))
+    storage.objects["/benchmark"] = os.urandom(size)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "capture.bin")
+        open(path, "wb").close()
+        baseline_rss = peak_rss_mb()
+
+        tracemalloc.start()
+        started = time.perf_counter()
+        if mode == "contents":
+            with open(path, "wb") as local_file:
+                local_file.write(file.download())
+        else:
+            file.download(path)
+        elapsed = time.perf_counter() - started
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    print(
+        f"{mode:<12} {peak / MB:>10.1f} MB traced "
+        f"{peak_rss_mb() - baseline_rss:>10.1f} MB RSS growth "
+        f"{size / MB / elapsed:>10.0f} MB/s"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size-mb", type=int, default=256)
+    parser.add_argument("--mode", choices=MODES)
+    args = parser.parse_args()
+
+    if args.mode:
+        run(args.mode, args.size_mb * MB)
+        return
+
+    for mode in MODES:
+        subprocess.run(
+            [sys.executable, "-m", "benchmarks.download_memory", "--mode", mode]
+            + ["--size-mb", str(args.size_mb)],
+            check=True,
+        )
+
+
+if __name__ == "__main__":
+    main()
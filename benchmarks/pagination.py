@@ -0,0 +1,79 @@
+"""
+Compare sequential, prefetched and concurrent pagination against a fake API
+with injected latency. The consumer hashes ``--work-kb`` KB for every item, so it
+does real work that fetching the next pages can overlap with.
+
+Run from the repository root::
+
+    python -m benchmarks.pagination --pages 100 --latency 0.05 --work-kb 256
+"""
+import argparse
+import hashlib
+import time
+
+from tekdrive import TekDrive
+from tekdrive.models.paginator import PaginatedListGenerator
+from tekdrive.routing import Route, ENDPOINTS
+from tests.unit.fakes import FakeAPI, make_files, paginated_handler
+
+
+def consume(item, work_kb):
+    payload = item.id.encode() * (work_kb * 1024 // len(item.id))
+    return hashlib.sha256(payload).digest()
+
+
+def run(label, api, tekdrive, work_kb, **kwargs):
+    api.calls.clear()
+    route = Route("GET", ENDPOINTS["search"])
+    started = time.perf_counter()
+    count = 0
+    for item in PaginatedListGenerator(tekdrive, route, limit=None, **kwargs):
+        consume(item, work_kb)
+        count += 1
+    elapsed = time.perf_counter() - started
+    print(
+        f"{label:<24} {count:>8} items {len(api.calls):>5} requests "
+        f"{elapsed:>8.2f}s {count / elapsed:>10.0f} items/s"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pages", type=int, default=100)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument(
+        "--work-kb", type=int, default=256, help="bytes hashed per item, in KB"
+    )
+    args = parser.parse_args()
+
+    api = FakeAPI(latency=args.latency)
+    items = make_files(args.pages * args.page_size - 1)
+    api.route("GET", ENDPOINTS["search"], paginated_handler(items))
+    tekdrive = TekDrive(access_key="benchmark")
+    tekdrive._session._request_wrapper._http = api
+
+    options = dict(limit_per_page=args.page_size)
+    run("sequential", api, tekdrive, args.work_kb, **options)
+    run("prefetch=4", api, tekdrive, args.work_kb, prefetch=4, **options)
+    run(
+        "adaptive page size",
+        api,
+        tekdrive,
+        args.work_kb,
+        adaptive_page_size=True,
+        **options,
+    )
+    for workers in (4, 8, 16):
+        run(
+            f"workers={workers}",
+            api,
+            tekdrive,
+            args.work_kb,
+            workers=workers,
+            **options,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Compare reading a header and a window of a large file with ``file.open``
+against downloading the whole file, using a fake storage service with
+injected latency and bandwidth.
+
+Run from the repository root::
+
+    python -m benchmarks.reader --size-mb 64 --bandwidth-mb 32 --latency 0.05
+"""
+import argparse
+import io
+import os
+import time
+
+from tekdrive import TekDrive
+from tekdrive.models import File
+from tests.unit.fakes import FakeAPI, FakeStorage, FakeTransfers
+
+MB = 1024 * 1024
+
+
+def run(label, storage, read):
+    storage.calls.clear()
+    started = time.perf_counter()
+    read()
+    elapsed = time.perf_counter() - started
+    print(f"{label:<24} {len(storage.calls):>5} requests {elapsed:>8.2f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size-mb", type=int, default=64)
+    parser.add_argument("--bandwidth-mb", type=float, default=32)
+    parser.add_argument("--latency", type=float, default=0.05)
+    args = parser.parse_args()
+
+    api = FakeAPI()
+    storage = FakeStorage(latency=args.latency, bandwidth=args.bandwidth_mb * MB)
+    FakeTransfers(api, storage)
+    tekdrive = TekDrive(access_key="benchmark")
+    tekdrive._session._request_wrapper._http = api
+    tekdrive._storage._http = storage
+    file = File(tekdrive, _data=dict(id="benchmark"))
+    size = args.size_mb * MB
+    storage.objects["/benchmark"] = os.urandom(size)
+
+    def header_from_download():
+        return file.download()[:4096]
+
+    def header_from_open():
+        with file.open() as f:
+            return f.read(4096)
+
+    def window_from_open():
+        with file.open() as f:
+            f.seek(size // 2)
+            return f.read(MB)
+
+    def sequential_from_open():
+        with file.open() as f:
+            while f.read(io.DEFAULT_BUFFER_SIZE):
+                pass
+
+    run("header, download", storage, header_from_download)
+    run("header, open", storage, header_from_open)
+    run("1 MB window, open", storage, window_from_open)
+    run("sequential, open", storage, sequential_from_open)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Compare single request and multipart uploads against a fake storage service
+with injected latency and per-connection bandwidth. Multipart uploads use the
+experimental MultipartUpload, which File.upload does not use until the TekDrive
+API supports upload sessions.
+
+Run from the repository root::
+
+    python -m benchmarks.upload --size-mb 64 --bandwidth-mb 32 --latency 0.05
+"""
+import argparse
+import io
+import os
+import time
+
+from tekdrive import TekDrive
+from tekdrive.models import File
+from tekdrive.transfer.multipart import MultipartUpload
+from tests.unit.fakes import FakeAPI, FakeStorage, FakeTransfers
+
+MB = 1024 * 1024
+
+
+def run(label, storage, upload, contents):
+    storage.calls.clear()
+    started = time.perf_counter()
+    upload(io.BytesIO(contents))
+    elapsed = time.perf_counter() - started
+    print(
+        f"{label:<28} {len(storage.calls):>5} requests "
+        f"{elapsed:>8.2f}s {len(contents) / MB / elapsed:>10.1f} MB/s"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size-mb", type=int, default=64)
+    parser.add_argument("--bandwidth-mb", type=float, default=32)
+    parser.add_argument("--latency", type=float, default=0.05)
+    args = parser.parse_args()
+
+    api = FakeAPI()
+    storage = FakeStorage(latency=args.latency, bandwidth=args.bandwidth_mb * MB)
+    FakeTransfers(api, storage)
+    tekdrive = TekDrive(access_key="benchmark")
+    tekdrive._session._request_wrapper._http = api
+    tekdrive._storage._http = storage
+    file = File(tekdrive, _data=dict(id="benchmark"))
+    contents = os.urandom(args.size_mb * MB)
+
+    run("single request", storage, file.upload, contents)
+    for part_size in (8 * MB, 16 * MB):
+        for workers in (1, 4, 8):
+            label = f"multipart {part_size // MB}MB x{workers}"
+            upload = MultipartUpload(file, part_size=part_size, workers=workers).upload
+            run(label, storage, upload, contents)
+
+
+if __name__ == "__main__":
+    main()
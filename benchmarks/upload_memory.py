@@ -0,0 +1,121 @@
+"""
+Compare peak memory and throughput of uploads from a copied stream, a buffer
+and a memory-mapped file, in a single request and in parts. Parts are sent by
+the experimental MultipartUpload, which File.upload does not use until the
+TekDrive API supports upload sessions.
+
+Each mode runs in its own process so peak RSS is not shared between modes.
+Pages of a memory-mapped file count towards RSS while they are sent, but they
+are backed by the file and are reclaimed by the OS under memory pressure; the
+traced column shows memory allocated by Python.
+Run from the repository root::
+
+    python -m benchmarks.upload_memory --size-mb 256
+"""
+import argparse
+import io
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from tekdrive import TekDrive
+from tekdrive.models import File
+from tekdrive.transfer.multipart import MultipartUpload
+from tekdrive.transfer.streams import map_file
+from tests.unit.fakes import FakeAPI, FakeStorage, FakeTransfers
+
+MB = 1024 * 1024
+MODES = [
+    "bytesio",
+    "buffer",
+    "path",
+    "bytesio multipart",
+    "buffer multipart",
+    "path multipart",
+]
+
+
+def peak_rss_mb():
+    try:
+        import resource
+    except ImportError:
+        return float("nan")
+    # kilobytes on Linux, bytes on macOS
+    scale = 1 if sys.platform == "darwin" else 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale / MB
+
+
+def run(mode, path, size):
+    api = FakeAPI()
+    storage = FakeStorage(store=False)
+    FakeTransfers(api, storage)
+    tekdrive = TekDrive(access_key="benchmark")
+    tekdrive._session._request_wrapper._http = api
+    tekdrive._storage._http = storage
+    file = File(tekdrive, _data=dict(id="benchmark"))
+    kind, _, multipart = mode.partition(" ")
+
+    if kind == "path":
+        contents = path
+    else:
+        with open(path, "rb") as local_file:
+            contents = bytearray(local_file.read())
+    baseline_rss = peak_rss_mb()
+
+    tracemalloc.start()
+    started = time.perf_counter()
+    if not multipart:
+        file.upload(io.BytesIO(contents) if kind == "bytesio" else contents)
+    elif kind == "path":
+        with map_file(contents) as mapped:
+            MultipartUpload(file, part_size=8 * MB, workers=4).upload(mapped)
+    else:
+        readable = io.BytesIO(contents) if kind == "bytesio" else memoryview(contents)
+        MultipartUpload(file, part_size=8 * MB, workers=4).upload(readable)
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(
+        f"{mode:<20} {peak / MB:>10.1f} MB traced "
+        f"{peak_rss_mb() - baseline_rss:>10.1f} MB RSS growth "
+        f"{size / MB / elapsed:>10.0f} MB/s"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size-mb", type=int, default=256)
+    parser.add_argument("--mode", choices=MODES)
+    parser.add_argument("--path")
+    args = parser.parse_args()
+
+    if args.mode:
+        run(args.mode, args.path, os.path.getsize(args.path))
+        return
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "capture.bin")
+        with open(path, "wb") as local_file:
+            for _ in range(args.size_mb):
+                local_file.write(os.urandom(MB))
+        for mode in MODES:
+            subprocess.run(
+                [
+                    sys.executable,
+                    "-m",
+                    "benchmarks.upload_memory",
+                    "--mode",
+                    mode,
+                    "--path",
+                    path,
+                ],
+                check=True,
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -52,6 +52,6 @@ setup(
     keywords="tektronix tekdrive tekcloud",
     long_description=README,
     long_description_content_type='text/markdown',
-    packages=find_packages(exclude=["tests", "tests.*"]),
+    packages=find_packages(exclude=["benchmarks", "benchmarks.*", "tests", "tests.*"]),
     version=VERSION,
 )
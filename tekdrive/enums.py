@@ -19,6 +19,14 @@ class FolderType(Enum):
     PERSONAL = "PERSONAL"
 
 
+class ChangeType(Enum):
+    CREATED = "CREATED"
+    DELETED = "DELETED"
+    MOVED = "MOVED"
+    RENAMED = "RENAMED"
+    MODIFIED = "MODIFIED"
+
+
 class ErrorCode(Enum):
     ARTIFACT_NOT_FOUND = "ARTIFACT_NOT_FOUND"
     FILE_GONE = "FILE_GONE"
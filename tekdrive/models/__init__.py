@@ -5,12 +5,18 @@ from .drive.member import Member, MembersList  # noqa
 from .drive.plan import Plan  # noqa
 from .drive.trash import Trash  # noqa
 from .drive.user import PartialUser, DriveUser  # noqa
+from .compact_tree import CompactTree  # noqa
+from .disk_usage import DiskUsage  # noqa
+from .drive_index import DriveIndex  # noqa
 from .helpers import FileHelper, FolderHelper  # noqa
-from .paginator import PaginatedList, TrashPaginatedList  # noqa
+from .paginator import PaginatedList, PaginatedListGenerator, TrashPaginatedList  # noqa
 from .parser import Parser  # noqa
+from .path_index import PathIndex  # noqa
 from .permissions import Permissions  # noqa
 from .search import Search  # noqa
 from .trashcan import Trashcan  # noqa
+from .snapshot import SnapshotDiff, TreeSnapshot  # noqa
 from .tree import Tree  # noqa
 from .usage import Usage  # noqa
 from .user import User  # noqa
+from .watcher import Watcher, WatchEvent  # noqa
@@ -0,0 +1,227 @@
+"""Provides the CompactTree class."""
+from array import array
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Union
+
+from .drive.file import File
+from .drive.folder import Folder
+from ..enums import ObjectType
+
+if TYPE_CHECKING:
+    from .. import TekDrive
+
+NO_PARENT = -1
+FOLDER, FILE = 0, 1
+
+
+class CompactTree:
+    """
+    An array-backed tree of files and folders for very large drives.
+
+    Instead of one model object per node, nodes are stored column-wise: parent
+    indexes, sizes and types live in arrays, and ids, names and file types in
+    string tables. A pre-order numbering is built once so that ancestor checks,
+    descendant listings and subtree byte totals do not walk the tree. Nodes are
+    only converted to :ref:`file` or :ref:`folder` models when accessed.
+
+    Examples:
+        Build a compact tree of a silo and query it::
+
+            tree = td.tree.compact(silo="PERSONAL", depth=50)
+            total = tree.subtree_bytes(folder_id)
+            paths = [tree.path(id) for id in tree.descendants(folder_id)]
+            folder = tree[folder_id]
+    """
+
+    @classmethod
+    def from_folder(cls, tekdrive: "TekDrive", folder: Folder) -> "CompactTree":
+        """
+        Build a compact tree from a :ref:`folder` returned by :meth:`.Tree.get`.
+        """
+
+        def nodes(current):
+            for child in current._children or []:
+                if isinstance(child, Folder):
+                    yield from nodes(child)
+                else:
+                    yield vars(child)
+            yield vars(current)
+
+        return cls(tekdrive, nodes(folder))
+
+    def __init__(self, tekdrive: "TekDrive", nodes: Iterable[Dict[str, Any]]):
+        """
+        Initialize a CompactTree instance.
+
+        Args:
+            tekdrive: An instance of :class:`.TekDrive`.
+            nodes: File and folder data in either API (camel case) or model
+                (snake case) form, in any order.
+        """
+        self._tekdrive = tekdrive
+        self._ids: List[str] = []
+        self._index: Dict[str, int] = {}
+        self._strings: List[str] = []
+        self._string_index: Dict[str, int] = {}
+        self._name = array("l")
+        self._file_type = array("l")
+        self._kind = array("b")
+        self._bytes = array("q")
+        self._parent = array("l")
+
+        parent_ids = []
+        for node in nodes:
+            self._index[node["id"]] = len(self._ids)
+            self._ids.append(node["id"])
+            self._name.append(self._intern(node.get("name")))
+            file_type = node.get("file_type", node.get("fileType"))
+            self._file_type.append(self._intern(file_type))
+            kind = node.get("type")
+            is_file = kind in (ObjectType.FILE, ObjectType.FILE.value)
+            self._kind.append(FILE if is_file else FOLDER)
+            self._bytes.append(int(node.get("bytes") or 0))
+            parent_ids.append(node.get("parent_folder_id", node.get("parentFolderId")))
+
+        for parent_id in parent_ids:
+            self._parent.append(self._index.get(parent_id, NO_PARENT))
+        self._build_order()
+
+    def _intern(self, value: Optional[str]) -> int:
+        if value is None:
+            return -1
+        idx = self._string_index.get(value)
+        if idx is None:
+            idx = self._string_index[value] = len(self._strings)
+            self._strings.append(value)
+        return idx
+
+    def _build_order(self):
+        count = len(self._ids)
+
+        # children of each node as contiguous slices of one array
+        self._child_start = array("l", [0]) * (count + 1)
+        for parent in self._parent:
+            if parent != NO_PARENT:
+                self._child_start[parent + 1] += 1
+        for idx in range(count):
+            self._child_start[idx + 1] += self._child_start[idx]
+        self._children = array("l", [0]) * count
+        fill = array("l", self._child_start[:count])
+        for idx, parent in enumerate(self._parent):
+            if parent != NO_PARENT:
+                self._children[fill[parent]] = idx
+                fill[parent] += 1
+
+        # pre-order numbering, subtree sizes and prefix sums of bytes
+        self._order = array("l")
+        self._pre = array("l", [0]) * count
+        self._size = array("l", [1]) * count
+        stack = [
+            idx for idx in reversed(range(count)) if self._parent[idx] == NO_PARENT
+        ]
+        while stack:
+            idx = stack.pop()
+            self._pre[idx] = len(self._order)
+            self._order.append(idx)
+            stack.extend(
+                reversed(
+                    self._children[self._child_start[idx] : self._child_start[idx + 1]]
+                )
+            )
+        for idx in reversed(self._order):
+            parent = self._parent[idx]
+            if parent != NO_PARENT:
+                self._size[parent] += self._size[idx]
+        self._prefix_bytes = array("q", [0])
+        for idx in self._order:
+            self._prefix_bytes.append(self._prefix_bytes[-1] + self._bytes[idx])
+
+    def __contains__(self, id: str) -> bool:
+        return id in self._index
+
+    def __getitem__(self, id: str) -> Union[File, Folder]:
+        """Return a lazy :ref:`file` or :ref:`folder` for the node."""
+        idx = self._index[id]
+        data = dict(
+            name=self.name(id),
+            parent_folder_id=self.parent(id),
+            type=ObjectType.FILE.value
+            if self._kind[idx] == FILE
+            else ObjectType.FOLDER.value,
+        )
+        if self._kind[idx] == FILE:
+            data.update(bytes=str(self._bytes[idx]), file_type=self.file_type(id))
+            return File(self._tekdrive, id, _data=data)
+        return Folder(self._tekdrive, id, _data=data)
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over node ids in pre-order."""
+        return (self._ids[idx] for idx in self._order)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    @property
+    def root(self) -> Optional[str]:
+        """Id of the starting folder of the tree."""
+        return self._ids[self._order[0]] if self._order else None
+
+    def _string(self, idx: int) -> Optional[str]:
+        return None if idx == -1 else self._strings[idx]
+
+    def name(self, id: str) -> Optional[str]:
+        return self._string(self._name[self._index[id]])
+
+    def file_type(self, id: str) -> Optional[str]:
+        return self._string(self._file_type[self._index[id]])
+
+    def is_file(self, id: str) -> bool:
+        return self._kind[self._index[id]] == FILE
+
+    def bytes(self, id: str) -> int:
+        return self._bytes[self._index[id]]
+
+    def parent(self, id: str) -> Optional[str]:
+        parent = self._parent[self._index[id]]
+        return None if parent == NO_PARENT else self._ids[parent]
+
+    def children(self, id: str) -> List[str]:
+        idx = self._index[id]
+        start, end = self._child_start[idx], self._child_start[idx + 1]
+        return [self._ids[child] for child in self._children[start:end]]
+
+    def ancestors(self, id: str) -> List[str]:
+        """Return the ids of the node's ancestors, nearest first."""
+        ancestors = []
+        parent = self._parent[self._index[id]]
+        while parent != NO_PARENT:
+            ancestors.append(self._ids[parent])
+            parent = self._parent[parent]
+        return ancestors
+
+    def is_ancestor(self, ancestor_id: str, id: str) -> bool:
+        """Is ``ancestor_id`` a (strict) ancestor of ``id``?"""
+        ancestor, idx = self._index[ancestor_id], self._index[id]
+        return (
+            self._pre[ancestor]
+            < self._pre[idx]
+            < self._pre[ancestor] + self._size[ancestor]
+        )
+
+    def descendants(self, id: str) -> List[str]:
+        """Return the ids of every node below ``id``, in pre-order."""
+        idx = self._index[id]
+        start = self._pre[idx] + 1
+        end = self._pre[idx] + self._size[idx]
+        return [self._ids[node] for node in self._order[start:end]]
+
+    def subtree_bytes(self, id: str) -> int:
+        """Return the total bytes of the node and everything below it."""
+        idx = self._index[id]
+        start = self._pre[idx]
+        return self._prefix_bytes[start + self._size[idx]] - self._prefix_bytes[start]
+
+    def path(self, id: str) -> str:
+        """Return the node's path from the root of the tree, such as ``/a/b.wfm``."""
+        names = [self.name(id)] if self._parent[self._index[id]] != NO_PARENT else []
+        names.extend(self.name(ancestor) for ancestor in self.ancestors(id)[:-1])
+        return "/" + "/".join(reversed(names))
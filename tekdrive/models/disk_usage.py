@@ -0,0 +1,62 @@
+"""Provides the DiskUsage dataclass."""
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, Optional
+
+
+@dataclass
+class DiskUsage:
+    """
+    Storage totals of a folder and everything below it.
+
+    Attributes:
+        folder_id (str): Unique ID of the folder.
+        name (str, optional): Name of the folder.
+        bytes (int): Total size of the files in bytes.
+        file_count (int): Number of files.
+        folder_count (int): Number of folders, not counting this one.
+        bytes_by_file_type (dict): Total bytes per file type such as ``"WFM"``.
+        files_by_file_type (dict): Number of files per file type.
+        subfolders (dict): :class:`DiskUsage` of each direct subfolder, by id.
+            Empty unless usage was computed recursively.
+    """
+
+    folder_id: str
+    name: Optional[str] = None
+    bytes: int = 0
+    file_count: int = 0
+    folder_count: int = 0
+    bytes_by_file_type: Dict[Optional[str], int] = field(default_factory=dict)
+    files_by_file_type: Dict[Optional[str], int] = field(default_factory=dict)
+    subfolders: Dict[str, "DiskUsage"] = field(default_factory=dict, repr=False)
+
+    def _add_file(self, file_type: Optional[str], size: int):
+        self.bytes += size
+        self.file_count += 1
+        self.bytes_by_file_type[file_type] = (
+            self.bytes_by_file_type.get(file_type, 0) + size
+        )
+        self.files_by_file_type[file_type] = (
+            self.files_by_file_type.get(file_type, 0) + 1
+        )
+
+    def _add_subfolder(self, other: "DiskUsage"):
+        self.subfolders[other.folder_id] = other
+        self.bytes += other.bytes
+        self.file_count += other.file_count
+        self.folder_count += other.folder_count + 1
+        for file_type, size in other.bytes_by_file_type.items():
+            self.bytes_by_file_type[file_type] = (
+                self.bytes_by_file_type.get(file_type, 0) + size
+            )
+        for file_type, count in other.files_by_file_type.items():
+            self.files_by_file_type[file_type] = (
+                self.files_by_file_type.get(file_type, 0) + count
+            )
+
+    def walk(self) -> Iterator["DiskUsage"]:
+        """Iterate over this folder's usage and that of every folder below it."""
+        stack = [self]
+        while stack:
+            usage = stack.pop()
+            yield usage
+            stack.extend(reversed(list(usage.subfolders.values())))
@@ -1,11 +1,18 @@
 """Provide the DriveBase class."""
 import os
-import requests
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any, Dict, IO, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, IO, Iterator, Optional, Union
 
 from ..base import TekDriveBase
-from ...exceptions import ClientException, TekDriveStorageException
+from ...exceptions import ClientException
+from ...settings import (
+    DOWNLOAD_CHUNK_SIZE,
+    READER_BLOCK_SIZE,
+    READER_CACHE_BLOCKS,
+    READER_READ_AHEAD,
+)
+from ...transfer import RangedDownload, RangeReader, ResumableDownload
+from ...transfer.streams import atomic_writer
 
 if TYPE_CHECKING:
     from ... import TekDrive
@@ -69,6 +76,18 @@ class DriveBase(TekDriveBase):
     def _fetch(self):
         self._fetched = True
 
+    def _known_parent_id(self) -> Optional[str]:
+        """Return the parent folder id if known, without fetching."""
+        if "parent_folder_id" in self.__dict__:
+            return self.__dict__["parent_folder_id"]
+        return self._tekdrive._path_index.parent(self.id)
+
+    def _invalidate_listings(self, *folder_ids: Optional[str]):
+        """Drop the cached children of the given folders."""
+        for folder_id in folder_ids:
+            if folder_id is not None:
+                self._tekdrive._children_cache.pop(folder_id)
+
     def _reset_attributes(self, *attributes):
         for attribute in attributes:
             if attribute in self.__dict__:
@@ -85,25 +104,46 @@ class Downloadable(ABC):
 
     def _download_from_storage(self):
         download_url = self._fetch_download_url()
+        return self._tekdrive._storage.get(download_url).content
+
+    def _iter_download(self, chunk_size: int) -> Iterator[bytes]:
+        download_url = self._fetch_download_url()
+        response = self._tekdrive._storage.get(download_url, stream=True)
         try:
-            r = requests.get(
-                download_url,
-            )
-            r.raise_for_status()
-            return r.content
-        except requests.exceptions.HTTPError as exception:
-            raise TekDriveStorageException("Download failed") from exception
-
-    def download(self, path_or_writable: Union[str, IO] = None) -> None:
+            yield from response.iter_content(chunk_size)
+        finally:
+            response.close()
+
+    def download(
+        self,
+        path_or_writable: Union[str, IO] = None,
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+        parallel: int = 1,
+        resume: bool = False,
+    ) -> None:
         """
         Download contents.
 
+        Contents are streamed to the path or writable in chunks, so memory use
+        does not grow with the size of the file. Downloads to a path are written
+        to a temporary file next to it first, and only replace the file once
+        complete.
+
         Args:
             path_or_writable: Path to a local file or a writable stream
                 where contents will be written.
+            chunk_size: Number of bytes read and written at a time.
+            parallel: Number of byte ranges to download at once when writing to
+                a path. Falls back to a single stream if storage does not
+                support ranges.
+            resume: Download to a ``.tekdrive-part`` file next to the path, and
+                continue an earlier interrupted download from where it stopped
+                if the contents have not changed since. Requires a path.
 
         Raises:
-            ClientException: If invalid file path is given.
+            ClientException: If invalid file path is given, ``resume`` is used
+                with a writable stream, or both ``resume`` and ``parallel`` are
+                given.
 
         Examples:
             Download to local file using path::
@@ -116,7 +156,20 @@ class Downloadable(ABC):
 
                 with open("./download.csv", "wb") as f:
                     file.download(f)
+
+            Download a large capture over 8 connections::
+
+                file.download("./capture.wfm", parallel=8)
+
+            Download over an unreliable link, continuing after interruptions::
+
+                file.download("./capture.wfm", resume=True)
         """
+        if resume and parallel > 1:
+            raise ClientException("Only supply one of: 'resume', 'parallel'.")
+        if resume and not isinstance(path_or_writable, str):
+            raise ClientException("Resuming a download requires a file path.")
+
         if path_or_writable is None:
             # return content directly
             return self._download_from_storage()
@@ -127,8 +180,63 @@ class Downloadable(ABC):
             if not os.path.exists(file_path):
                 raise ClientException(f"File '{file_path}' does not exist.")
 
-            with open(file_path, "wb") as file:
-                file.write(self._download_from_storage())
+            if resume:
+                ResumableDownload(self, file_path, chunk_size=chunk_size).download()
+                return
+
+            with atomic_writer(file_path) as file:
+                ranged = parallel > 1 and RangedDownload(
+                    self, workers=parallel, chunk_size=chunk_size
+                ).download(file)
+                if not ranged:
+                    self.download(file, chunk_size=chunk_size)
         else:
             writable = path_or_writable
-            writable.write(self._download_from_storage())
+            for chunk in self._iter_download(chunk_size):
+                writable.write(chunk)
+
+    def open(
+        self,
+        block_size: int = READER_BLOCK_SIZE,
+        cache_blocks: int = READER_CACHE_BLOCKS,
+        read_ahead: int = READER_READ_AHEAD,
+    ) -> RangeReader:
+        """
+        Open contents for reading without downloading them.
+
+        Returns a read-only, seekable binary file that fetches only the blocks
+        of contents that are read, so a parser can read a header or a small
+        window of a large file.
+
+        Args:
+            block_size: Number of bytes fetched per block.
+            cache_blocks: Number of recently read blocks kept in memory.
+            read_ahead: Maximum number of blocks fetched ahead of the one being
+                read when reading sequentially. ``0`` disables read-ahead.
+
+        Returns:
+            :class:`.RangeReader`
+
+        Examples:
+            Read the header of a large waveform::
+
+                with file.open() as f:
+                    header = f.read(512)
+
+            Read a window from the end::
+
+                with file.open(block_size=64 * 1024) as f:
+                    f.seek(-4096, os.SEEK_END)
+                    trailer = f.read()
+
+            Wrap for buffered or text reads::
+
+                with io.TextIOWrapper(io.BufferedReader(file.open())) as f:
+                    first_line = f.readline()
+        """
+        return RangeReader(
+            self,
+            block_size=block_size,
+            cache_blocks=cache_blocks,
+            read_ahead=read_ahead,
+        )
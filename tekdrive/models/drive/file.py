@@ -1,17 +1,17 @@
 """Provides the File class."""
 import os
-import requests
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, Dict, IO, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, IO, Iterable, Optional, Union
 
 from ...routing import Route, ENDPOINTS
-from ...exceptions import ClientException, TekDriveStorageException
+from ...exceptions import ClientException
 from ...utils.casing import to_snake_case, to_camel_case
 from .base import DriveBase, Downloadable
 from .artifact import Artifact, ArtifactsList
 from .member import Member, MembersList
 from .user import PartialUser
 from ...enums import ObjectType
+from ...transfer.streams import is_seekable, iter_chunks, map_file, to_buffer
 from ..permissions import Permissions
 
 if TYPE_CHECKING:
@@ -63,6 +63,7 @@ class File(DriveBase, Downloadable):
         self._upload_url = None
 
         super().__init__(tekdrive, _data=_data, _fetched=fetched)
+        tekdrive._path_index.add_item(self)
 
     def __setattr__(
         self,
@@ -104,22 +105,26 @@ class File(DriveBase, Downloadable):
         route = Route("PUT", ENDPOINTS["file_details"], file_id=self.id)
         return self._tekdrive.request(route, json=data)
 
-    def _upload_to_storage(self, file: IO):
+    def _upload_to_storage(self, file: Union[IO, Iterable[bytes], memoryview]):
         # we may already have upload url from file creation
         if self._upload_url is None:
             self._upload_url = self._fetch_upload_url()
 
-        try:
-            r = requests.put(
-                self._upload_url,
-                data=file,
-                headers={
-                    "Content-Type": "application/octet-stream",
-                },
-            )
-            r.raise_for_status()
-        except requests.exceptions.HTTPError as exception:
-            raise TekDriveStorageException("Upload failed") from exception
+        if hasattr(file, "read"):
+            if not is_seekable(file):
+                # the size of pipes and sockets is unknown, send them chunked
+                file = iter_chunks(file)
+        elif not isinstance(file, (bytes, bytearray, memoryview)):
+            # requests would encode a list or tuple of chunks as form fields
+            file = iter(file)
+
+        self._tekdrive._storage.put(
+            self._upload_url,
+            file,
+            headers={
+                "Content-Type": "application/octet-stream",
+            },
+        )
 
     @staticmethod
     def _create(
@@ -138,12 +143,23 @@ class File(DriveBase, Downloadable):
         data = dict(name=name, parentFolderId=parent_folder_id)
         route = Route("POST", ENDPOINTS["file_create"])
         new_file = _tekdrive.request(route, json=data)
+        new_file._invalidate_listings(parent_folder_id, new_file._known_parent_id())
 
         if path_or_readable:
             new_file.upload(path_or_readable)
 
         return new_file
 
+    @property
+    def path(self) -> str:
+        """
+        Path of the file from the top of its silo, such as ``"/Lab3/scope7/2026-10/run42.wfm"``.
+
+        Parent folders are looked up in the client's path index, so only folders
+        the client has not seen yet cost a request.
+        """
+        return self._tekdrive._path_index.path(self)
+
     def artifacts(self, flat: bool = False) -> ArtifactsList:
         """
         Get a list of file artifacts.
@@ -219,6 +235,7 @@ class File(DriveBase, Downloadable):
         """
         route = Route("POST", ENDPOINTS["file_restore"], file_id=self.id)
         self._tekdrive.request(route)
+        self._invalidate_listings(self._known_parent_id())
 
     def delete(self, hard_delete: bool = False) -> None:
         """
@@ -240,14 +257,27 @@ class File(DriveBase, Downloadable):
 
         route = Route("DELETE", ENDPOINTS["file_delete"], file_id=self.id)
         self._tekdrive.request(route, params=params)
+        self._invalidate_listings(self._known_parent_id())
+        self._tekdrive._path_index.discard(self.id)
 
-    def upload(self, path_or_readable: Union[str, IO]) -> None:
+    def upload(
+        self,
+        path_or_readable: Union[str, IO, Iterable[bytes], bytes, bytearray, memoryview],
+    ) -> None:
         """
         Upload file contents. This will overwrite existing content, if any.
 
+        The contents are sent in a single request to the file's upload URL.
+        Uploads in separate parts, and resuming interrupted uploads, are not
+        available until the TekDrive API supports upload sessions.
+
         Args:
-            path_or_readable: Path to a local file or a readable stream
-                representing the contents to upload.
+            path_or_readable: Path to a local file, a readable stream, an
+                iterable of bytes chunks or a buffer such as ``bytes``,
+                ``memoryview`` or a NumPy array representing the contents to
+                upload. Streams such as pipes and sockets, and iterables, are
+                read while they are being uploaded. Local files are memory
+                mapped, and files and buffers are sent without being copied.
 
         Raises:
             ClientException: If invalid file path is given.
@@ -263,19 +293,31 @@ class File(DriveBase, Downloadable):
 
                 with open("./test_file.txt", "rb") as f:
                     new_file.upload(f)
+
+            Upload a NumPy array of samples without copying it::
+
+                file.upload(samples)
+
+            Upload a live capture while it is being produced::
+
+                file.upload(scope.stream_chunks())
         """
-        # TODO: multipart upload support
         if isinstance(path_or_readable, str):
             file_path = path_or_readable
 
             if not os.path.exists(file_path):
                 raise ClientException(f"File '{file_path}' does not exist.")
 
-            with open(file_path, "rb") as file:
-                self._upload_to_storage(file)
-        else:
-            readable = path_or_readable
-            self._upload_to_storage(readable)
+            with map_file(file_path) as contents:
+                self.upload(contents)
+            return
+
+        contents = path_or_readable
+        if not hasattr(contents, "read"):
+            buffer = to_buffer(contents)
+            if buffer is not None:
+                contents = buffer
+        self._upload_to_storage(contents)
 
     def move(self, parent_folder_id: str) -> None:
         """
@@ -297,7 +339,10 @@ class File(DriveBase, Downloadable):
         """
         data = dict(parentFolderId=parent_folder_id)
         self._update_details(data)
+        self._invalidate_listings(self._known_parent_id(), parent_folder_id)
         self.parent_folder_id = parent_folder_id
+        self._tekdrive._path_index.discard(self.id)
+        self._tekdrive._path_index.add_item(self)
 
     def save(self) -> None:
         """
@@ -311,6 +356,9 @@ class File(DriveBase, Downloadable):
         """
         data = dict(name=self.name)
         self._update_details(data)
+        self._invalidate_listings(self._known_parent_id())
+        self._tekdrive._path_index.discard(self.id)
+        self._tekdrive._path_index.add_item(self)
 
     def add_member(
         self, username: str = None, user_id: str = None, edit_access: bool = False
@@ -1,6 +1,7 @@
 """Provides the Folder class."""
+import os
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, Dict, IO, Optional, List, Union
+from typing import TYPE_CHECKING, Any, Dict, IO, Iterator, Optional, List, Union
 
 from ...routing import Route, ENDPOINTS
 from ...utils.casing import to_snake_case, to_camel_case
@@ -8,9 +9,11 @@ from .base import DriveBase
 from ...exceptions import ClientException
 from ...enums import FolderType, ObjectType
 from .member import Member
+from ..disk_usage import DiskUsage
 from ..permissions import Permissions
 from .user import PartialUser
 from .file import File
+from ...transfer import TreeUpload, UploadResult
 
 if TYPE_CHECKING:
     from .. import TekDrive
@@ -56,6 +59,7 @@ class Folder(DriveBase):
             fetched = True
         self._children = None
         super().__init__(tekdrive, _data=_data, _fetched=fetched)
+        tekdrive._path_index.add_item(self)
 
     def __setattr__(
         self,
@@ -106,27 +110,122 @@ class Folder(DriveBase):
         data = dict(name=name, parentFolderId=parent_folder_id)
         route = Route("POST", ENDPOINTS["folder_create"])
         new_folder = _tekdrive.request(route, json=data)
+        new_folder._invalidate_listings(parent_folder_id, new_folder._known_parent_id())
         return new_folder
 
+    @property
+    def path(self) -> str:
+        """
+        Path of the folder from the top of its silo, such as ``"/Lab3/scope7"``.
+
+        Parent folders are looked up in the client's path index, so only folders
+        the client has not seen yet cost a request.
+        """
+        return self._tekdrive._path_index.path(self)
+
     def children(self) -> List[Union[File, "Folder"]]:
         """
         Get a list of child files and folders for the given folder.
 
+        Listings are cached per client for ``CHILDREN_CACHE_TTL`` seconds,
+        including the listings of every folder returned by :meth:`.Tree.get`.
+        Creating, moving and deleting items through the client drops the
+        affected listings.
+
         Examples:
             Iterate over all folder children::
 
                 for child in folder.children():
                     print(child.id)
-        
+
         Returns:
             List [ Union [:ref:`file` , :ref:`folder`] ]
         """
         if self._children is not None:
             return self._children
 
-        params = to_camel_case({"folder_id": self.id})
-        route = Route("GET", ENDPOINTS["tree"])
-        return self._tekdrive.request(route, params=params)._children
+        children = self._tekdrive._children_cache.get(self.id)
+        if children is None:
+            children = self._tekdrive.tree.get(folder_id=self.id)._children
+        return list(children)
+
+    def iter_children(self) -> Iterator[Union[File, "Folder"]]:
+        """
+        Iterate over child files and folders while the listing is downloading.
+
+        Use this instead of :meth:`children` for folders with tens of thousands
+        of entries: a listing that is not cached is parsed incrementally and
+        never held in memory as a whole.
+
+        Examples:
+            Count the WFM files in a large folder::
+
+                count = sum(
+                    1 for child in folder.iter_children() if child.file_type == "WFM"
+                )
+
+        Returns:
+            Iterator [ Union [:ref:`file` , :ref:`folder`] ]
+        """
+        children = self._children
+        if children is None:
+            children = self._tekdrive._children_cache.get(self.id)
+        if children is not None:
+            yield from children
+            return
+
+        for item in self._tekdrive.tree.stream(folder_id=self.id, depth=1):
+            # the folder itself comes last
+            if item.id != self.id:
+                yield item
+
+    def disk_usage(self, recursive: bool = True, workers: int = 4) -> DiskUsage:
+        """
+        Get the total size and file counts of the folder.
+
+        The folder tree is walked with :meth:`.Tree.walk`, so subtrees are fetched
+        concurrently and cached listings are not requested again. Totals for
+        every folder below this one are computed in the same pass.
+
+        Args:
+            recursive: Include everything below the folder? If ``False``, only
+                files directly in the folder are counted.
+            workers: Maximum number of concurrent requests.
+
+        Examples:
+            Report storage per top level folder::
+
+                usage = folder.disk_usage(workers=8)
+                for subfolder in usage.subfolders.values():
+                    print(subfolder.name, subfolder.bytes, subfolder.bytes_by_file_type)
+
+        Returns:
+            :class:`.DiskUsage`
+        """
+        usages = {}
+        parents = {}
+        walk = self._tekdrive.tree.walk(
+            folder_id=self.id, max_depth=None if recursive else 1, workers=workers
+        )
+        for folder, subfolders, files in walk:
+            name = vars(folder).get("name")
+            if name is None and folder.id == self.id:
+                name = vars(self).get("name")
+            usage = usages[folder.id] = DiskUsage(folder.id, name)
+            for file in files:
+                data = vars(file)
+                usage._add_file(data.get("file_type"), int(data.get("bytes") or 0))
+            if not recursive:
+                usage.folder_count = len(subfolders)
+            for subfolder in subfolders:
+                parents[subfolder.id] = folder.id
+
+        # parents are walked before their subfolders
+        for folder_id in reversed(list(usages)):
+            parent_id = parents.get(folder_id)
+            if parent_id in usages:
+                usages[parent_id]._add_subfolder(usages[folder_id])
+        return usages[self.id]
 
     def members(self) -> List[Member]:
         """
@@ -157,6 +256,7 @@ class Folder(DriveBase):
         """
         route = Route("POST", ENDPOINTS["folder_restore"], folder_id=self.id)
         self._tekdrive.request(route)
+        self._invalidate_listings(self._known_parent_id())
 
     def delete(self, hard_delete: bool = False) -> None:
         """
@@ -178,6 +278,8 @@ class Folder(DriveBase):
 
         route = Route("DELETE", ENDPOINTS["folder_delete"], folder_id=self.id)
         self._tekdrive.request(route, params=params)
+        self._invalidate_listings(self._known_parent_id(), self.id)
+        self._tekdrive._path_index.discard(self.id)
 
     def move(self, parent_folder_id: str) -> None:
         """
@@ -199,7 +301,10 @@ class Folder(DriveBase):
         """
         data = dict(parentFolderId=parent_folder_id)
         self._update_details(data)
+        self._invalidate_listings(self._known_parent_id(), parent_folder_id)
         self.parent_folder_id = parent_folder_id
+        self._tekdrive._path_index.discard(self.id)
+        self._tekdrive._path_index.add_item(self)
 
     def save(self) -> None:
         """
@@ -213,6 +318,9 @@ class Folder(DriveBase):
         """
         data = dict(name=self.name)
         self._update_details(data)
+        self._invalidate_listings(self._known_parent_id())
+        self._tekdrive._path_index.discard(self.id)
+        self._tekdrive._path_index.add_item(self)
 
     def add_member(
         self, username: str = None, user_id: str = None, edit_access: bool = False
@@ -319,3 +427,37 @@ class Folder(DriveBase):
         return self._tekdrive.file.create(
             path_or_readable, name=file_name, parent_folder_id=self.id
         )
+
+    def upload_tree(self, local_dir: str, workers: int = 8) -> List[UploadResult]:
+        """
+        Upload the contents of a local directory into this folder, recreating its
+        subdirectories as folders.
+
+        Folders are created as soon as their parent exists and files are created
+        and uploaded concurrently, so thousands of small files do not wait on one
+        another. A failure only affects that file, or everything below that
+        directory, and is reported in the results. Files and directories below a
+        directory whose folder could not be created are reported as skipped.
+
+        Args:
+            local_dir: Path to the local directory.
+            workers: Maximum number of concurrent creations and uploads.
+
+        Raises:
+            ClientException: If invalid directory path is given.
+
+        Examples:
+            Upload a day of captures and report failures::
+
+                results = folder.upload_tree("./captures/2026-10-19", workers=16)
+                for result in results:
+                    if not result.ok:
+                        print(result.path, result.error)
+
+        Returns:
+            List [ :class:`.UploadResult` ] for every local file and directory, by path.
+        """
+        if not os.path.isdir(local_dir):
+            raise ClientException(f"Directory '{local_dir}' does not exist.")
+
+        return TreeUpload(self, local_dir, workers=workers).run()
@@ -0,0 +1,319 @@
+"""Provides the DriveIndex class."""
+import sqlite3
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from .base import TekDriveBase
+from .drive.file import File
+from .drive.folder import Folder
+from .snapshot import SnapshotDiff, SnapshotEntry, TreeSnapshot
+from ..enums import ObjectType
+
+if TYPE_CHECKING:
+    from .. import TekDrive
+
+DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%S.%fZ"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    id TEXT PRIMARY KEY,
+    parent_id TEXT,
+    name TEXT,
+    type TEXT NOT NULL,
+    file_type TEXT,
+    bytes INTEGER NOT NULL DEFAULT 0,
+    created_at TEXT,
+    updated_at TEXT
+);
+CREATE INDEX IF NOT EXISTS items_parent_id ON items (parent_id);
+CREATE INDEX IF NOT EXISTS items_name ON items (name);
+CREATE INDEX IF NOT EXISTS items_file_type_bytes ON items (file_type, bytes);
+CREATE INDEX IF NOT EXISTS items_updated_at ON items (updated_at);
+"""
+
+# every item below the folder given as the first parameter
+SUBTREE = """
+WITH RECURSIVE subtree(id) AS (
+    SELECT id FROM items WHERE parent_id = ?
+    UNION ALL
+    SELECT items.id FROM items JOIN subtree ON items.parent_id = subtree.id
+)
+"""
+
+COLUMNS = (
+    "id",
+    "parent_id",
+    "name",
+    "type",
+    "file_type",
+    "bytes",
+    "created_at",
+    "updated_at",
+)
+
+
+def _format_datetime(value: Optional[Union[datetime, str]]) -> Optional[str]:
+    if isinstance(value, datetime):
+        return value.strftime(DATETIME_FORMAT)
+    return value
+
+
+def _row(item: Union[File, Folder]) -> Tuple[Any, ...]:
+    data = vars(item)
+    return (
+        item.id,
+        data.get("parent_folder_id"),
+        data.get("name"),
+        ObjectType.FOLDER.value if isinstance(item, Folder) else ObjectType.FILE.value,
+        data.get("file_type"),
+        int(data.get("bytes") or 0),
+        _format_datetime(data.get("created_at")),
+        _format_datetime(data.get("updated_at")),
+    )
+
+
+class DriveIndex(TekDriveBase):
+    """
+    A local SQLite copy of file and folder metadata for offline queries.
+
+    The index is filled by :meth:`refresh`, which walks a tree concurrently and
+    only writes the rows that changed since the previous refresh, or by
+    :meth:`add` with the results of searches and listings. Queries run against
+    the local database and make no requests.
+
+    Examples:
+        Find large WFM files modified this month under a folder::
+
+            index = DriveIndex(td, "drive.sqlite")
+            index.refresh(silo="PERSONAL", workers=8)
+            files = index.query(
+                file_type="WFM",
+                min_bytes=100 * 1024 * 1024,
+                updated_after=datetime(2026, 10, 1),
+                under=folder_id,
+            )
+    """
+
+    def __init__(self, tekdrive: "TekDrive", path: str = ":memory:"):
+        """
+        Initialize a DriveIndex instance.
+
+        Args:
+            tekdrive: An instance of :class:`.TekDrive`.
+            path: Path of the SQLite database. Default: ``":memory:"``.
+        """
+        super().__init__(tekdrive, _data=None)
+        self._connection = sqlite3.connect(path)
+        self._connection.executescript(SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_args):
+        self.close()
+
+    def __len__(self) -> int:
+        return self._connection.execute("SELECT COUNT(*) FROM items").fetchone()[0]
+
+    def close(self):
+        self._connection.close()
+
+    def _upsert(self, rows: Iterable[Tuple[Any, ...]]):
+        placeholders = ", ".join("?" for _ in COLUMNS)
+        self._connection.executemany(
+            f"INSERT OR REPLACE INTO items ({', '.join(COLUMNS)}) "
+            f"VALUES ({placeholders})",
+            rows,
+        )
+
+    def add(self, items: Iterable[Union[File, Folder]]):
+        """
+        Add or update files and folders, such as :class:`.Search` results.
+
+        Args:
+            items: Files and folders to store.
+        """
+        with self._connection:
+            self._upsert(_row(item) for item in items)
+
+    def _snapshot(self, folder_id: str) -> TreeSnapshot:
+        rows = self._connection.execute(
+            """
+            WITH RECURSIVE subtree(id) AS (
+                SELECT ?
+                UNION ALL
+                SELECT items.id FROM items JOIN subtree ON items.parent_id = subtree.id
+            )
+            SELECT items.id, parent_id, name, bytes, updated_at, type
+            FROM items JOIN subtree ON items.id = subtree.id
+            """,
+            (folder_id,),
+        )
+        return TreeSnapshot(
+            {
+                id: SnapshotEntry(
+                    parent_id, name, size, updated_at, kind == ObjectType.FOLDER.value
+                )
+                for id, parent_id, name, size, updated_at, kind in rows
+            }
+        )
+
+    def refresh(
+        self,
+        *,
+        folder_id: Optional[str] = None,
+        silo: Optional[str] = None,
+        workers: int = 4,
+        skip_unchanged_folders: bool = False,
+    ) -> SnapshotDiff:
+        """
+        Bring the index up to date with a folder tree.
+
+        The whole tree is walked concurrently and compared with the indexed
+        copy as a :class:`.TreeSnapshot`, so only created, moved, renamed,
+        modified and deleted items are written.
+
+        Args:
+            folder_id: Unique ID of the folder to index.
+            silo: Index the provided silo. Values: ``"SHARES"`` or ``"PERSONAL"``.
+            workers: Maximum number of concurrent requests.
+            skip_unchanged_folders: Do not walk into folders whose
+                ``updated_at`` matches the indexed copy, and keep their indexed
+                subtrees as they are? Default: ``False``. This is unsafe: the
+                API does not move a folder's ``updated_at`` forward when items
+                below it change, so changes inside a skipped folder are missed.
+                Only use it when such changes are known not to matter.
+
+        Returns:
+            :class:`.SnapshotDiff` of the changes that were applied.
+        """
+        indexed_folders = {}
+        if skip_unchanged_folders:
+            indexed_folders = dict(
+                self._connection.execute(
+                    "SELECT id, updated_at FROM items "
+                    "WHERE type = ? AND updated_at IS NOT NULL",
+                    (ObjectType.FOLDER.value,),
+                )
+            )
+
+        rows: Dict[str, Tuple[Any, ...]] = {}
+        unchanged: List[str] = []
+        root_id = None
+        walk = self._tekdrive.tree.walk(
+            folder_id=folder_id, silo=silo, workers=workers, use_cache=False
+        )
+        for folder, subfolders, files in walk:
+            if root_id is None:
+                root_id = folder.id
+            for item in [folder, *subfolders, *files]:
+                rows[item.id] = _row(item)
+
+            walked = []
+            for subfolder in subfolders:
+                updated_at = rows[subfolder.id][7]
+                if (
+                    updated_at is not None
+                    and indexed_folders.get(subfolder.id) == updated_at
+                ):
+                    unchanged.append(subfolder.id)
+                else:
+                    walked.append(subfolder)
+            subfolders[:] = walked
+
+        entries = {}
+        for unchanged_id in unchanged:
+            # everything below an unchanged folder stays as indexed
+            entries.update(self._snapshot(unchanged_id).entries)
+        entries.update(
+            (
+                id,
+                SnapshotEntry(
+                    row[1], row[2], row[5], row[7], row[3] == ObjectType.FOLDER.value
+                ),
+            )
+            for id, row in rows.items()
+        )
+        changes = TreeSnapshot(entries).diff(self._snapshot(root_id))
+        with self._connection:
+            self._connection.executemany(
+                "DELETE FROM items WHERE id = ?", ((id,) for id in changes.deleted)
+            )
+            changed = set(
+                changes.created + changes.moved + changes.renamed + changes.modified
+            )
+            self._upsert(rows[id] for id in changed)
+        return changes
+
+    def query(
+        self,
+        *,
+        name: Optional[str] = None,
+        file_type: Optional[str] = None,
+        type: Optional[ObjectType] = None,
+        min_bytes: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        updated_after: Optional[datetime] = None,
+        updated_before: Optional[datetime] = None,
+        under: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[Union[File, Folder]]:
+        """
+        Find indexed files and folders without making requests.
+
+        Args:
+            name: Match names with an SQL ``LIKE`` pattern such as ``"run%"``.
+            file_type: File type such as ``"WFM"``.
+            type: Only return :class:`.ObjectType` ``FILE`` or ``FOLDER`` items.
+            min_bytes: Smallest size to include.
+            max_bytes: Largest size to include.
+            updated_after: Only items updated at or after this time (UTC).
+            updated_before: Only items updated before this time (UTC).
+            under: Only items anywhere below the folder with this id.
+            limit: Maximum number of items to return.
+
+        Returns:
+            List [ Union [ :ref:`file` , :ref:`folder` ] ]
+        """
+        conditions = []
+        params: List[Any] = []
+        for condition, value in (
+            ("name LIKE ?", name),
+            ("file_type = ?", file_type),
+            ("type = ?", type.value if type else None),
+            ("bytes >= ?", min_bytes),
+            ("bytes <= ?", max_bytes),
+            ("updated_at >= ?", _format_datetime(updated_after)),
+            ("updated_at < ?", _format_datetime(updated_before)),
+        ):
+            if value is not None:
+                conditions.append(condition)
+                params.append(value)
+
+        if under is not None:
+            conditions.insert(0, "id IN subtree")
+            params.insert(0, under)
+
+        sql = f"SELECT {', '.join(COLUMNS)} FROM items"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        if under is not None:
+            sql = SUBTREE + sql
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        items = []
+        rows = self._connection.execute(sql, params)
+        for id, parent_id, name, kind, file_type, size, created_at, updated_at in rows:
+            data = dict(name=name, parent_folder_id=parent_id, type=kind)
+            if created_at:
+                data["created_at"] = created_at
+            if updated_at:
+                data["updated_at"] = updated_at
+            if kind == ObjectType.FILE.value:
+                data.update(file_type=file_type, bytes=str(size))
+                items.append(File(self._tekdrive, id, _data=data))
+            else:
+                items.append(Folder(self._tekdrive, id, _data=data))
+        return items
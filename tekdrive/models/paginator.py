@@ -1,10 +1,20 @@
-from copy import deepcopy
+import math
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from copy import copy, deepcopy
+from dataclasses import dataclass
 from .base import TekDriveBase
+from ..exceptions import ClientException, RequestException, ServerError
+from ..routing import Route
+from ..settings import STREAM_CHUNK_SIZE
+from ..status_codes import RETRY_EXCEPTIONS
+from ..utils.json_stream import JSONStream, iter_list
 from typing import TYPE_CHECKING, Any, Dict, Iterator, Optional, Union
 
 if TYPE_CHECKING:
     from .. import TekDrive
-    from ..routing import Route
 
 
 class PaginatedList(TekDriveBase):
@@ -19,6 +29,10 @@ class PaginatedList(TekDriveBase):
         """Return the item at position index in the list."""
         return getattr(self, self.LIST_ATTRIBUTE)[index]
 
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over the items in the list."""
+        return iter(getattr(self, self.LIST_ATTRIBUTE))
+
     def __setattr__(self, attribute: str, value: Any):
         """Parse the LIST_ATTRIBUTE attribute."""
         if attribute == self.LIST_ATTRIBUTE:
@@ -39,7 +53,211 @@ class TrashPaginatedList(PaginatedList):
     META_ATTRIBUTE = "meta"
 
 
+def _is_overloaded(exception: Exception) -> bool:
+    """Did a request fail because the API timed out or returned a server error?"""
+    for exc in (exception, exception.__cause__):
+        if isinstance(exc, ServerError):
+            return True
+        if isinstance(exc, RequestException) and isinstance(
+            exc.original_exception, RETRY_EXCEPTIONS
+        ):
+            return True
+    return False
+
+
+@dataclass
+class PageSizeTuner:
+    """
+    Adjust the page size of a paginated listing from observed responses.
+
+    The page size doubles while pages come back within half of ``target_latency``
+    and halves when a page is slower than ``target_latency``, times out or fails
+    with a server error. Only sizes that evenly divide the current offset are
+    chosen so page numbers stay aligned with the results already fetched.
+    """
+
+    limit: int
+    min_limit: int = 10
+    max_limit: int = 1000
+    target_latency: float = 2.0
+
+    def page_for(self, offset: int) -> int:
+        return offset // self.limit + 1
+
+    def _largest_aligned(self, offset: int, upper: int, lower: int) -> Optional[int]:
+        for candidate in range(upper, lower - 1, -1):
+            if offset % candidate == 0:
+                return candidate
+        return None
+
+    def cap(self, offset: int, limit: int):
+        """Respect a page size limit enforced by the API."""
+        self.max_limit = limit
+        self.limit = self._largest_aligned(offset, min(self.limit, limit), 1)
+
+    def grow(self, offset: int) -> bool:
+        candidate = min(self.limit * 2, self.max_limit)
+        if candidate <= self.limit or offset % candidate:
+            return False
+        self.limit = candidate
+        return True
+
+    def shrink(self, offset: int) -> bool:
+        candidate = self._largest_aligned(offset, self.limit // 2, self.min_limit)
+        if candidate is None:
+            return False
+        self.limit = candidate
+        return True
+
+    def observe(self, offset: int, elapsed: float):
+        """
+        Update the page size after a page was fetched successfully.
+
+        Args:
+            offset: Offset of the next page to fetch.
+            elapsed: Seconds the last page took to fetch.
+        """
+        if elapsed * 2 <= self.target_latency:
+            self.grow(offset)
+        elif elapsed > self.target_latency:
+            self.shrink(offset)
+
+
+def _fetch_tuned_page(
+    tekdrive: "TekDrive",
+    route: Route,
+    tuner: PageSizeTuner,
+    params: Dict[str, Union[str, int]],
+    offset: int,
+) -> PaginatedList:
+    while True:
+        params["limit"] = tuner.limit
+        params["page"] = tuner.page_for(offset)
+        started = time.monotonic()
+        try:
+            page = tekdrive.request(route, params=params)
+        except Exception as exception:
+            if _is_overloaded(exception) and tuner.shrink(offset):
+                continue
+            raise
+
+        if page.limit_per_page < params["limit"]:
+            # the API enforces a smaller page size, so this page is misaligned
+            tuner.cap(offset, page.limit_per_page)
+            continue
+
+        tuner.observe(offset + len(page), time.monotonic() - started)
+        return page
+
+
+def _iter_pages(
+    tekdrive: "TekDrive",
+    route: Route,
+    params: Dict[str, Union[str, int]],
+    remaining: Optional[int],
+    tuner: Optional[PageSizeTuner],
+) -> Iterator[PaginatedList]:
+    """
+    Fetch pages one at a time. Holds no reference to the generator it serves,
+    so a prefetch thread running it does not keep a dropped generator alive.
+    """
+    offset = (params.get("page", 1) - 1) * params["limit"]
+    while True:
+        if tuner is None:
+            page = tekdrive.request(route, params=params)
+        else:
+            page = _fetch_tuned_page(tekdrive, route, tuner, params, offset)
+        yield page
+
+        if len(page) != page.limit_per_page:
+            return
+        offset += len(page)
+        if remaining is not None:
+            remaining -= len(page)
+            if remaining <= 0:
+                return
+        # go to next page
+        params["page"] = page.page + 1
+
+
+class _PagePrefetcher:
+    """Read pages ahead on a background thread into a bounded buffer."""
+
+    _DONE = object()
+
+    def __init__(self, pages: Iterator[PaginatedList], depth: int):
+        self._pages = pages
+        self._buffer = queue.Queue(maxsize=depth)
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="tekdrive-prefetch", daemon=True
+        )
+        self._thread.start()
+
+    def __iter__(self) -> Iterator[PaginatedList]:
+        while True:
+            item = self._buffer.get()
+            if item is self._DONE:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+
+    def _put(self, item: Any) -> bool:
+        while not self._stopped.is_set():
+            try:
+                self._buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _run(self):
+        try:
+            for page in self._pages:
+                if not self._put(page):
+                    return
+        except BaseException as exception:
+            self._put(exception)
+            return
+        self._put(self._DONE)
+
+    def stop(self):
+        self._stopped.set()
+
+
 class PaginatedListGenerator(TekDriveBase, Iterator):
+    @classmethod
+    def from_cursor(
+        cls, tekdrive: "TekDrive", cursor: Dict[str, Any], **kwargs
+    ) -> "PaginatedListGenerator":
+        """
+        Rebuild a generator from a previously saved :attr:`cursor`.
+
+        Args:
+            tekdrive: An instance of :class:`.TekDrive`.
+            cursor: The cursor of the generator to resume.
+            kwargs: Additional options such as ``prefetch`` or ``workers``.
+
+        Examples:
+            Resume a long running search::
+
+                results = PaginatedListGenerator.from_cursor(td, json.load(f))
+        """
+        params = deepcopy(cursor["params"])
+        params["page"] = cursor["page"]
+        generator = cls(
+            tekdrive,
+            Route(cursor["method"], cursor["path"]),
+            limit=cursor["limit"],
+            limit_per_page=params["limit"],
+            params=params,
+            **kwargs,
+        )
+        generator.yielded = cursor["yielded"]
+        generator._skip = cursor["index"]
+        return generator
+
     def __init__(
         self,
         tekdrive: "TekDrive",
@@ -47,6 +265,10 @@ class PaginatedListGenerator(TekDriveBase, Iterator):
         limit: int = 100,
         limit_per_page: int = 100,
         params: Optional[Dict[str, Union[str, int]]] = None,
+        prefetch: int = 0,
+        workers: int = 1,
+        adaptive_page_size: bool = False,
+        stream: bool = False,
     ):
         """
         Initialize a PaginatedListGenerator instance.
@@ -55,19 +277,75 @@ class PaginatedListGenerator(TekDriveBase, Iterator):
             tekdrive: An instance of :class:`.TekDrive`.
             route: A Route for an API endpoint returning a paginated list.
             limit: Number of total results to fetch.
+            limit_per_page: Number of results to request per page.
             params: A dictionary containing additional query string parameters to
                 send with the request.
+            prefetch: Number of upcoming pages to fetch on a background thread while
+                the current page is being consumed. Requests made in the background
+                go through the same session and honor its rate limit. Default: ``0``
+                (fetch each page only when it is needed).
+            workers: Number of pages to request concurrently. Pages are still
+                yielded in order; the end of results is detected when a page comes
+                back short, so up to ``workers - 1`` requests past the last page may
+                be wasted. Default: ``1`` (one page at a time).
+            adaptive_page_size: Tune ``limit_per_page`` while paginating. See
+                :class:`.PageSizeTuner`. Not supported together with ``workers``.
+            stream: Parse each page incrementally and yield results while the page
+                is still downloading. Not supported together with ``prefetch``,
+                ``workers`` or ``adaptive_page_size``.
+
+        Raises:
+            ClientException: If ``workers`` is combined with ``prefetch`` or
+                ``adaptive_page_size``, or if ``stream`` is combined with any of them.
         """
+        if prefetch and workers > 1:
+            raise ClientException("Only supply one of: 'prefetch', 'workers'.")
+        if adaptive_page_size and workers > 1:
+            raise ClientException(
+                "Only supply one of: 'adaptive_page_size', 'workers'."
+            )
+        if stream and (prefetch or workers > 1 or adaptive_page_size):
+            raise ClientException(
+                "Streaming does not support 'prefetch', 'workers' or "
+                "'adaptive_page_size'."
+            )
+
         super().__init__(tekdrive, _data=None)
-        self._exhausted = False
         self._list = None
         self._list_index = None
+        self._pages = None
+        self._prefetcher = None
+        self._skip = 0  # items of the first page that were already yielded
+        self._items = None
+        self._stream_position = None
         self.limit = limit  # total results limit
         self.params = deepcopy(params) if params else {}
-        self.params["limit"] = min(limit, limit_per_page)  # limit for a single page
+        # limit for a single page
+        self.params["limit"] = (
+            limit_per_page if limit is None else min(limit, limit_per_page)
+        )
+        self.prefetch = prefetch
+        self.workers = workers
+        self.stream = stream
+        self.tuner = (
+            PageSizeTuner(limit=self.params["limit"]) if adaptive_page_size else None
+        )
         self.route = route
         self.yielded = 0
 
+    def __del__(self):
+        # a generator dropped before it was exhausted must not leave its
+        # prefetch thread running
+        prefetcher = self.__dict__.get("_prefetcher")
+        if prefetcher is not None:
+            prefetcher.stop()
+
+    def __enter__(self) -> "PaginatedListGenerator":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
     def __iter__(self) -> Iterator[Any]:
         """Permit ListingGenerator to operate as an iterator."""
         return self
@@ -75,27 +353,222 @@ class PaginatedListGenerator(TekDriveBase, Iterator):
     def __next__(self) -> Any:
         """Permit ListingGenerator to operate as a generator."""
         if self.limit is not None and self.yielded >= self.limit:
+            self.close()
             raise StopIteration()
 
-        if self._list is None or self._list_index >= len(self._list):
+        if self.stream:
+            if self._items is None:
+                self._items = self._stream_items()
+            try:
+                item = next(self._items)
+            except StopIteration:
+                self.close()
+                raise
+            self.yielded += 1
+            return item
+
+        while self._list is None or self._list_index >= len(self._list):
             self._next_batch()
 
         self._list_index += 1
         self.yielded += 1
         return self._list[self._list_index - 1]
 
+    def iter_pages(self) -> Iterator[PaginatedList]:
+        """
+        Iterate over whole pages of results instead of single items.
+
+        Each page is a :class:`.PaginatedList` carrying its page metadata (``page``,
+        ``limit_per_page`` and ``meta``). If single items were already taken from
+        the current page, the first page only contains the remaining items, and the
+        last page is trimmed to the total ``limit``. Progress is reflected in
+        :attr:`yielded` and :attr:`cursor` as usual.
+
+        Examples:
+            Store search results in batches::
+
+                for page in td.search.files(file_type="WFM", limit=None).iter_pages():
+                    db.insert_many(file.id for file in page)
+        """
+        if self.stream:
+            raise ClientException("Pages are not available when streaming.")
+
+        while self.limit is None or self.yielded < self.limit:
+            if self._list is None or self._list_index >= len(self._list):
+                try:
+                    self._next_batch()
+                except StopIteration:
+                    return
+
+            page = self._list
+            start = self._list_index
+            end = len(page)
+            if self.limit is not None:
+                end = min(end, start + self.limit - self.yielded)
+            if start or end < len(page):
+                items = getattr(page, page.LIST_ATTRIBUTE)
+                page = copy(page)
+                setattr(page, page.LIST_ATTRIBUTE, items[start:end])
+
+            self._list_index = end
+            self.yielded += end - start
+            yield page
+        self.close()
+
+    @property
+    def cursor(self) -> Dict[str, Any]:
+        """
+        JSON serializable position of the generator.
+
+        The cursor holds the route, query parameters, page, position within the
+        page and number of results yielded so far. Pass it to :meth:`from_cursor`
+        to continue from the next unyielded result without re-fetching earlier
+        pages.
+
+        Examples:
+            Checkpoint a search::
+
+                results = td.search.files(file_type="WFM", limit=None)
+                for idx, file in enumerate(results):
+                    process(file)
+                    if idx % 1000 == 0:
+                        with open("checkpoint.json", "w") as f:
+                            json.dump(results.cursor, f)
+        """
+        params = deepcopy(self.params)
+        page = params.pop("page", 1)
+        index = self._skip
+        if self._stream_position is not None:
+            page, index, params["limit"] = self._stream_position
+        elif self._list is not None:
+            params["limit"] = self._list.limit_per_page
+            if self._list_index < len(self._list):
+                page, index = self._list.page, self._list_index
+            else:
+                page, index = self._list.page + 1, 0
+
+        return dict(
+            method=self.route.method,
+            path=self.route.path,
+            params=params,
+            page=page,
+            index=index,
+            yielded=self.yielded,
+            limit=self.limit,
+        )
+
+    def close(self):
+        """
+        Stop any background page fetching.
+
+        Called once the results are exhausted or the limit is reached. When
+        stopping early, use the generator as a context manager or call this
+        directly.
+
+        Examples:
+            Stop a prefetching search at the first match::
+
+                with td.search.files(name="capture", limit=None, prefetch=4) as results:
+                    first = next(file for file in results if file.name.endswith(".wfm"))
+        """
+        if self._prefetcher is not None:
+            self._prefetcher.stop()
+        if self._pages is not None:
+            self._pages.close()
+        if self._items is not None:
+            self._items.close()
+
+    def _fetch_page(
+        self, params: Dict[str, Union[str, int]], page: int
+    ) -> PaginatedList:
+        return self._tekdrive.request(self.route, params={**params, "page": page})
+
+    def _stream_items(self) -> Iterator[Any]:
+        params = deepcopy(self.params)
+        page = params.get("page", 1)
+        skip = self._skip
+        self._skip = 0
+        while True:
+            params["page"] = page
+            other = {}
+            count = 0
+            response = self._tekdrive._request(self.route, params=params, stream=True)
+            try:
+                items = iter_list(
+                    JSONStream(response.iter_content(STREAM_CHUNK_SIZE)), other
+                )
+                for item in items:
+                    count += 1
+                    if count > skip:
+                        self._stream_position = (page, count, params["limit"])
+                        yield self._tekdrive._parser.parse(item)
+            finally:
+                response.close()
+
+            skip = 0
+            if count != other.get("meta", {}).get("limit", params["limit"]):
+                return
+            page += 1
+
+    def _fetch_pages(self) -> Iterator[PaginatedList]:
+        remaining = None
+        if self.limit is not None:
+            remaining = self.limit - self.yielded + self._skip
+        return _iter_pages(
+            self._tekdrive, self.route, deepcopy(self.params), remaining, self.tuner
+        )
+
+    def _fan_out_pages(self) -> Iterator[PaginatedList]:
+        params = deepcopy(self.params)
+        page_number = params.pop("page", 1)
+        last_page = None
+        if self.limit is not None:
+            remaining = self.limit - self.yielded + self._skip
+            pages_needed = math.ceil(remaining / params["limit"])
+            last_page = page_number + pages_needed - 1
+
+        executor = ThreadPoolExecutor(max_workers=self.workers)
+        pending = {}
+        next_page = page_number
+        try:
+            while last_page is None or page_number <= last_page:
+                while len(pending) < self.workers and (
+                    last_page is None or next_page <= last_page
+                ):
+                    pending[next_page] = executor.submit(
+                        self._fetch_page, params, next_page
+                    )
+                    next_page += 1
+
+                page = pending.pop(page_number).result()
+                yield page
+
+                if len(page) != page.limit_per_page:
+                    return
+                page_number += 1
+        finally:
+            for future in pending.values():
+                future.cancel()
+            executor.shutdown(wait=False)
+
     def _next_batch(self):
-        if self._exhausted:
-            raise StopIteration()
+        if self._pages is None:
+            if self.workers > 1:
+                self._pages = self._fan_out_pages()
+            elif self.prefetch:
+                self._prefetcher = _PagePrefetcher(self._fetch_pages(), self.prefetch)
+                self._pages = iter(self._prefetcher)
+            else:
+                self._pages = self._fetch_pages()
 
-        self._list = self._tekdrive.request(self.route, params=self.params)
-        self._list_index = 0
+        try:
+            self._list = next(self._pages)
+        except StopIteration:
+            self.close()
+            raise
+        self._list_index = self._skip
+        self._skip = 0
 
         if not self._list:
+            self.close()
             raise StopIteration()
-
-        if len(self._list) == self._list.limit_per_page:
-            # go to next page
-            self.params["page"] = self._list.page + 1
-        else:
-            self._exhausted = True
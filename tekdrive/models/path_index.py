@@ -0,0 +1,151 @@
+"""Provides the PathIndex class."""
+import threading
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple, Union
+
+from .base import TekDriveBase
+from .drive.file import File
+from .drive.folder import Folder
+from ..exceptions import ClientException
+from ..settings import PATH_INDEX_SIZE
+from ..utils.cache import LRUCache
+
+if TYPE_CHECKING:
+    from .. import TekDrive
+
+
+class PathIndex(TekDriveBase):
+    """
+    Per-client index between paths and ids.
+
+    Every file and folder the client sees is recorded as ``(parent id, name)``,
+    so a path is resolved one cached lookup per level and a path is rebuilt by
+    following parent ids. Entries are filled from API responses such as tree
+    listings, evicted least recently used first, and dropped when an item is
+    moved, renamed or deleted through this client.
+    """
+
+    def __init__(self, tekdrive: "TekDrive", maxsize: int = PATH_INDEX_SIZE):
+        super().__init__(tekdrive, _data=None)
+        # id -> (parent id, name, is folder)
+        self._entries = LRUCache(maxsize)
+        # (parent id, name) -> id
+        self._ids = LRUCache(maxsize)
+        self._roots: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def add(self, id: str, parent_id: Optional[str], name: str, is_folder: bool):
+        with self._lock:
+            previous = self._entries.get(id)
+            if previous and previous[:2] != (parent_id, name):
+                self._discard_name(id, previous)
+            self._entries.put(id, (parent_id, name, is_folder))
+            if parent_id is not None:
+                self._ids.put((parent_id, name), id)
+
+    def add_item(self, item: Union[File, Folder]):
+        """Record a file or folder if its name and parent are known."""
+        data = vars(item)
+        if "name" in data and "parent_folder_id" in data:
+            self.add(
+                item.id,
+                data["parent_folder_id"],
+                data["name"],
+                isinstance(item, Folder),
+            )
+
+    def _discard_name(self, id: str, entry: Tuple[Optional[str], str, bool]):
+        key = entry[:2]
+        if self._ids.get(key) == id:
+            self._ids.pop(key)
+
+    def discard(self, id: str):
+        """Forget a file or folder, e.g. after it was moved, renamed or deleted."""
+        with self._lock:
+            entry = self._entries.pop(id)
+            if entry:
+                self._discard_name(id, entry)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._ids.clear()
+            self._roots.clear()
+
+    def lookup(self, parent_id: str, name: str) -> Optional[Tuple[str, bool]]:
+        """Return the ``(id, is folder)`` of a cached child, if any."""
+        id = self._ids.get((parent_id, name))
+        entry = self._entries.get(id) if id else None
+        if entry is None or entry[:2] != (parent_id, name):
+            return None
+        return id, entry[2]
+
+    def details(self, id: str) -> Optional[Dict[str, Any]]:
+        """Return the cached name and parent id of an item as model data, if any."""
+        entry = self._entries.get(id)
+        if entry is None:
+            return None
+        return dict(name=entry[1], parent_folder_id=entry[0])
+
+    def parent(self, id: str) -> Optional[str]:
+        """Return the cached parent id of an item, if any."""
+        entry = self._entries.get(id)
+        return entry[0] if entry else None
+
+    def _root(self, silo: str) -> str:
+        root_id = self._roots.get(silo)
+        if root_id is None:
+            # also records the children of the root
+            root_id = self._roots[silo] = self._tekdrive.tree.get(silo=silo).id
+        return root_id
+
+    def resolve(self, path: str, silo: str = "PERSONAL") -> Union[File, Folder]:
+        names = [name for name in path.split("/") if name not in ("", ".")]
+        id, is_folder = self._root(silo), True
+        for name in names:
+            if not is_folder:
+                raise ClientException(f"Path '{path}' does not exist.")
+            parent_id = id
+            found = self.lookup(parent_id, name)
+            if found is None:
+                self._tekdrive.tree.get(folder_id=parent_id)
+                found = self.lookup(parent_id, name)
+            if found is None:
+                raise ClientException(f"Path '{path}' does not exist.")
+            id, is_folder = found
+
+        data = None
+        if names:
+            data = dict(name=names[-1], parent_folder_id=parent_id)
+        model = Folder if is_folder else File
+        return model(self._tekdrive, id, _data=data)
+
+    def path(self, item: Union[File, Folder]) -> str:
+        data = vars(item)
+        if not ("name" in data and "parent_folder_id" in data) and not item._fetched:
+            item._fetch()
+        if data.get("parent_folder_id") is None:
+            return "/"
+        self.add_item(item)
+
+        names = [data["name"]]
+        parent_id = data["parent_folder_id"]
+        while parent_id not in self._roots.values():
+            entry = self._entries.get(parent_id)
+            if entry is None:
+                # records the folder while initializing it from its details
+                Folder(self._tekdrive, parent_id)._fetch()
+                entry = self._entries.get(parent_id) or (None, None, True)
+            parent_id, name, _ = entry
+            if parent_id is None:
+                break
+            names.append(name)
+        return "/" + "/".join(reversed(names))
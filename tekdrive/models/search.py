@@ -32,6 +32,11 @@ class Search(TekDriveBase):
         upload_state: Optional[List[str]] = None,
         order_by: Optional[List[str]] = None,
         include_trashed: bool = False,
+        limit_per_page: int = 100,
+        adaptive_page_size: bool = False,
+        prefetch: int = 0,
+        workers: int = 1,
+        stream: bool = False,
     ) -> Iterator[File]:
         """
         Convenience method for files search.
@@ -44,6 +49,11 @@ class Search(TekDriveBase):
             depth: How many levels deep to perform search when specifying a ``folder_id`` or ``silo``.
             file_type: Limit results to files matching the given file type(s).
             upload_state: Limit results to files in the given upload state(s).
+            limit_per_page: Number of results to request per page.
+            adaptive_page_size: Tune the page size to the API's response times?
+            prefetch: Number of upcoming result pages to fetch in the background.
+            workers: Number of result pages to request concurrently.
+            stream: Yield results while each page is still downloading?
 
         Examples:
             Get up to 50 WFM files::
@@ -66,6 +76,11 @@ class Search(TekDriveBase):
             name=name,
             order_by=order_by,
             include_trashed=include_trashed,
+            limit_per_page=limit_per_page,
+            adaptive_page_size=adaptive_page_size,
+            prefetch=prefetch,
+            workers=workers,
+            stream=stream,
         )
 
     def folders(
@@ -78,6 +93,11 @@ class Search(TekDriveBase):
         depth: Optional[int] = 1,
         order_by: Optional[List[str]] = None,
         include_trashed: bool = False,
+        limit_per_page: int = 100,
+        adaptive_page_size: bool = False,
+        prefetch: int = 0,
+        workers: int = 1,
+        stream: bool = False,
     ) -> Iterator[Folder]:
         """
         Convenience method for folders search.
@@ -88,6 +108,11 @@ class Search(TekDriveBase):
             name: Folder name to match on. Case insensitive.
             folder_id: Unique ID of folder to perform search within.
             depth: How many levels deep to perform search when specifying a ``folder_id`` or ``silo``.
+            limit_per_page: Number of results to request per page.
+            adaptive_page_size: Tune the page size to the API's response times?
+            prefetch: Number of upcoming result pages to fetch in the background.
+            workers: Number of result pages to request concurrently.
+            stream: Yield results while each page is still downloading?
 
         Examples:
             Get up to 10 folders with a name like ``"team_"``::
@@ -107,6 +132,11 @@ class Search(TekDriveBase):
             name=name,
             order_by=order_by,
             include_trashed=include_trashed,
+            limit_per_page=limit_per_page,
+            adaptive_page_size=adaptive_page_size,
+            prefetch=prefetch,
+            workers=workers,
+            stream=stream,
         )
 
     def query(
@@ -123,6 +153,11 @@ class Search(TekDriveBase):
         upload_state: Optional[List[str]] = None,
         order_by: Optional[List[str]] = None,
         include_trashed: bool = False,
+        limit_per_page: int = 100,
+        adaptive_page_size: bool = False,
+        prefetch: int = 0,
+        workers: int = 1,
+        stream: bool = False,
     ) -> Iterator[Union[File, Folder]]:
         """
         Execute search for files and/or folders matching the provided criteria. A global search will
@@ -139,6 +174,16 @@ class Search(TekDriveBase):
             include_folders: Include folders in the search results? Default: ``True``.
             upload_state: Limit results to files in the given upload state(s).
             include_trashed: Include files and folders in the trashcan.
+            limit_per_page: Number of results to request per page. Default: ``100``.
+            adaptive_page_size: Grow the page size while responses are fast and shrink
+                it on slow responses, timeouts or server errors. Default: ``False``.
+            prefetch: Number of upcoming result pages to fetch in the background while
+                the current page is being consumed.
+            workers: Number of result pages to request concurrently. Results are
+                still returned in order. Cannot be combined with ``prefetch``.
+            stream: Parse each page incrementally, yielding results while the page
+                is still downloading. Cannot be combined with ``prefetch``, ``workers``
+                or ``adaptive_page_size``.
 
         Examples:
             Get files with name like ``"project1"``::
@@ -172,4 +217,14 @@ class Search(TekDriveBase):
                 include_trashed=include_trashed,
             )
         )
-        return PaginatedListGenerator(self._tekdrive, route, limit=limit, params=params)
+        return PaginatedListGenerator(
+            self._tekdrive,
+            route,
+            limit=limit,
+            params=params,
+            limit_per_page=limit_per_page,
+            adaptive_page_size=adaptive_page_size,
+            prefetch=prefetch,
+            workers=workers,
+            stream=stream,
+        )
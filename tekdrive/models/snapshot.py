@@ -0,0 +1,267 @@
+"""Provides the TreeSnapshot class."""
+import gzip
+import hashlib
+import json
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+from .drive.file import File
+from .drive.folder import Folder
+from ..enums import ObjectType
+
+SNAPSHOT_VERSION = 1
+DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%S.%fZ"
+
+
+class SnapshotEntry(NamedTuple):
+    parent_id: Optional[str]
+    name: Optional[str]
+    bytes: int
+    updated_at: Optional[str]
+    is_folder: bool
+
+
+@dataclass
+class SnapshotDiff:
+    """
+    Changes between two :class:`.TreeSnapshot` objects, as lists of ids.
+
+    Attributes:
+        created (list): Items only in the newer snapshot.
+        deleted (list): Items only in the older snapshot.
+        moved (list): Items with a different parent folder.
+        renamed (list): Items with a different name.
+        modified (list): Items with a different size or update time.
+    """
+
+    created: List[str] = field(default_factory=list)
+    deleted: List[str] = field(default_factory=list)
+    moved: List[str] = field(default_factory=list)
+    renamed: List[str] = field(default_factory=list)
+    modified: List[str] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return any(
+            (self.created, self.deleted, self.moved, self.renamed, self.modified)
+        )
+
+
+def _timestamp(value: Optional[Union[datetime, str]]) -> Optional[str]:
+    """
+    Format an update time with microseconds, whether it was parsed into a
+    ``datetime`` or kept as the API's string with milliseconds.
+    """
+    if isinstance(value, datetime):
+        return value.strftime(DATETIME_FORMAT)
+    if value and value.endswith("Z") and "." in value:
+        seconds, _, fraction = value[:-1].rpartition(".")
+        return f"{seconds}.{fraction[:6].ljust(6, '0')}Z"
+    return value
+
+
+def _entry(item: Union[File, Folder]) -> Tuple[str, SnapshotEntry]:
+    data = vars(item)
+    entry = SnapshotEntry(
+        data.get("parent_folder_id"),
+        data.get("name"),
+        int(data.get("bytes") or 0),
+        _timestamp(data.get("updated_at")),
+        isinstance(item, Folder),
+    )
+    return item.id, entry
+
+
+class TreeSnapshot:
+    """
+    The ids, parents, names, sizes and update times of a folder tree at one
+    point in time.
+
+    Snapshots are saved to disk as gzip compressed JSON columns. Every item is
+    given a hash of itself and everything below it, so :meth:`diff` skips
+    subtrees that did not change.
+
+    Examples:
+        Find what changed in a silo since the last run::
+
+            snapshot = td.tree.snapshot(silo="PERSONAL", workers=8)
+            changes = snapshot.diff(TreeSnapshot.load("personal.snapshot"))
+            for file_id in changes.modified:
+                print(snapshot.path(file_id))
+            snapshot.save("personal.snapshot")
+    """
+
+    @classmethod
+    def from_folder(cls, folder: Folder) -> "TreeSnapshot":
+        """Build a snapshot from a :ref:`folder` returned by :meth:`.Tree.get`."""
+        entries = dict([_entry(folder)])
+        stack = [folder]
+        while stack:
+            for child in stack.pop()._children or []:
+                id, entry = _entry(child)
+                entries[id] = entry
+                if isinstance(child, Folder):
+                    stack.append(child)
+        return cls(entries)
+
+    @classmethod
+    def from_walk(
+        cls, walk: Iterable[Tuple[Folder, List[Folder], List[File]]]
+    ) -> "TreeSnapshot":
+        """Build a snapshot from the results of :meth:`.Tree.walk`."""
+        entries = {}
+        for folder, subfolders, files in walk:
+            if folder.id not in entries:
+                id, entry = _entry(folder)
+                entries[id] = entry
+            for child in subfolders + files:
+                id, entry = _entry(child)
+                entries[id] = entry
+        return cls(entries)
+
+    @classmethod
+    def from_nodes(cls, nodes: Iterable[Dict[str, Any]]) -> "TreeSnapshot":
+        """Build a snapshot from raw API node data, such as streamed tree nodes."""
+        entries = {
+            node["id"]: SnapshotEntry(
+                node.get("parentFolderId"),
+                node.get("name"),
+                int(node.get("bytes") or 0),
+                _timestamp(node.get("updatedAt")),
+                node.get("type") == ObjectType.FOLDER.value,
+            )
+            for node in nodes
+        }
+        return cls(entries)
+
+    @classmethod
+    def load(cls, path: str) -> "TreeSnapshot":
+        """Load a snapshot saved with :meth:`save`."""
+        with gzip.open(path, "rt", encoding="utf-8") as file:
+            columns = json.load(file)
+        ids = columns["ids"]
+        entries = {
+            id: SnapshotEntry(
+                ids[parent] if parent >= 0 else None,
+                name,
+                size,
+                _timestamp(updated_at),
+                bool(is_folder),
+            )
+            for id, parent, name, size, updated_at, is_folder in zip(
+                ids,
+                columns["parents"],
+                columns["names"],
+                columns["bytes"],
+                columns["updated_at"],
+                columns["folders"],
+            )
+        }
+        return cls(entries)
+
+    def __init__(self, entries: Dict[str, SnapshotEntry]):
+        self.entries = entries
+        self._children: Optional[Dict[Optional[str], List[str]]] = None
+        self._hashes: Optional[Dict[str, bytes]] = None
+
+    def __contains__(self, id: str) -> bool:
+        return id in self.entries
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def save(self, path: str):
+        """Save the snapshot to ``path``."""
+        ids = list(self.entries)
+        index = {id: idx for idx, id in enumerate(ids)}
+        entries = self.entries.values()
+        columns = dict(
+            version=SNAPSHOT_VERSION,
+            ids=ids,
+            parents=[index.get(entry.parent_id, -1) for entry in entries],
+            names=[entry.name for entry in entries],
+            bytes=[entry.bytes for entry in entries],
+            updated_at=[entry.updated_at for entry in entries],
+            folders=[int(entry.is_folder) for entry in entries],
+        )
+        with gzip.open(path, "wt", encoding="utf-8") as file:
+            json.dump(columns, file, separators=(",", ":"))
+
+    def children(self, id: Optional[str]) -> List[str]:
+        """Return the ids of the items in a folder. ``None`` lists the top items."""
+        if self._children is None:
+            children = {}
+            for child_id, entry in self.entries.items():
+                parent_id = entry.parent_id if entry.parent_id in self.entries else None
+                children.setdefault(parent_id, []).append(child_id)
+            self._children = children
+        return self._children.get(id, [])
+
+    def path(self, id: str) -> str:
+        """Return the path of an item relative to the top of the snapshot."""
+        names = []
+        entry = self.entries[id]
+        while entry.parent_id in self.entries:
+            names.append(entry.name)
+            entry = self.entries[entry.parent_id]
+        return "/" + "/".join(reversed(names))
+
+    def _hash(self, id: str) -> bytes:
+        if self._hashes is None:
+            self._hashes = {}
+            # children are hashed before their parents
+            order = []
+            stack = list(self.children(None))
+            while stack:
+                current = stack.pop()
+                order.append(current)
+                stack.extend(self.children(current))
+            for current in reversed(order):
+                digest = hashlib.blake2b(digest_size=16)
+                digest.update(
+                    json.dumps([current, *self.entries[current]]).encode("utf-8")
+                )
+                for child_hash in sorted(
+                    self._hashes[c] for c in self.children(current)
+                ):
+                    digest.update(child_hash)
+                self._hashes[current] = digest.digest()
+        return self._hashes[id]
+
+    def _changed(self, other: "TreeSnapshot") -> List[str]:
+        """Ids of items in this snapshot whose subtree differs in ``other``."""
+        changed = []
+        stack = list(self.children(None))
+        while stack:
+            id = stack.pop()
+            if id in other.entries and other._hash(id) == self._hash(id):
+                continue
+            changed.append(id)
+            stack.extend(self.children(id))
+        return changed
+
+    def diff(self, older: "TreeSnapshot") -> SnapshotDiff:
+        """
+        Compare with an older snapshot.
+
+        Args:
+            older: The snapshot to compare against.
+
+        Returns:
+            :class:`.SnapshotDiff`
+        """
+        changes = SnapshotDiff()
+        for id in self._changed(older):
+            entry = self.entries[id]
+            previous = older.entries.get(id)
+            if previous is None:
+                changes.created.append(id)
+                continue
+            if entry.parent_id != previous.parent_id:
+                changes.moved.append(id)
+            if entry.name != previous.name:
+                changes.renamed.append(id)
+            if (entry.bytes, entry.updated_at) != (previous.bytes, previous.updated_at):
+                changes.modified.append(id)
+        changes.deleted = [id for id in older._changed(self) if id not in self.entries]
+        return changes
@@ -37,10 +37,25 @@ class Trashcan(TekDriveBase):
         *,
         order_by: List[str] = ["-trashedAt"],
         limit: Optional[int] = 100,
+        limit_per_page: int = 100,
+        adaptive_page_size: bool = False,
+        prefetch: int = 0,
+        workers: int = 1,
     ):
         """
         Get items currently in the trash.
 
+        Args:
+            order_by: Sort order for the returned items.
+            limit: Total limit for returned items.
+            limit_per_page: Number of items to request per page. Default: ``100``.
+            adaptive_page_size: Grow the page size while responses are fast and shrink
+                it on slow responses, timeouts or server errors. Default: ``False``.
+            prefetch: Number of upcoming pages to fetch in the background while
+                the current page is being consumed.
+            workers: Number of pages to request concurrently. Items are still
+                returned in order. Cannot be combined with ``prefetch``.
+
         Examples:
             Get the first 10 items in the trashcan::
 
@@ -52,4 +67,13 @@ class Trashcan(TekDriveBase):
                 order_by=order_by,
             )
         )
-        return PaginatedListGenerator(self._tekdrive, route, limit=limit, params=params)
+        return PaginatedListGenerator(
+            self._tekdrive,
+            route,
+            limit=limit,
+            params=params,
+            limit_per_page=limit_per_page,
+            adaptive_page_size=adaptive_page_size,
+            prefetch=prefetch,
+            workers=workers,
+        )
@@ -1,15 +1,79 @@
 """Provides the Tree class."""
-from typing import TYPE_CHECKING, Optional
+import math
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING, Iterator, List, Optional, Tuple, Union
 
 from ..routing import Route, ENDPOINTS
+from ..settings import STREAM_CHUNK_SIZE
 from .base import TekDriveBase
-from . import Folder
+from . import CompactTree, File, Folder, TreeSnapshot
 from ..utils.casing import to_camel_case
+from ..utils.json_stream import JSONStream, iter_nested
 
 if TYPE_CHECKING:
+    from requests import Response
     from .. import TekDrive
 
 
+MAX_REQUEST_DEPTH = 8
+
+
+def _count_nodes(folder: Folder) -> int:
+    """Count the nodes below ``folder`` that were returned in the same payload."""
+    count = 0
+    stack = [folder]
+    while stack:
+        children = stack.pop()._children or []
+        count += len(children)
+        stack.extend(child for child in children if isinstance(child, Folder))
+    return count
+
+
+def _boundary_folders(folder: Folder) -> Iterator[Tuple[Folder, int]]:
+    """
+    Yield folders below ``folder`` whose listing was not part of the payload,
+    along with how many levels below ``folder`` they are.
+    """
+    stack = [(folder, 0)]
+    while stack:
+        current, level = stack.pop()
+        if current._children is None:
+            if level:
+                yield current, level
+            continue
+        stack.extend(
+            (child, level + 1)
+            for child in current._children
+            if isinstance(child, Folder)
+        )
+
+
+def _choose_depth(node_count: int, depth: int, nodes_per_request: int) -> int:
+    """
+    Pick the request depth for subtrees below a payload of ``node_count`` nodes
+    fetched with ``depth`` levels, aiming for ``nodes_per_request`` nodes each.
+    """
+    branching = node_count ** (1 / depth) if node_count else 1
+    if branching <= 1.5:
+        return MAX_REQUEST_DEPTH
+    next_depth = int(math.log(nodes_per_request) / math.log(branching))
+    return max(1, min(next_depth, MAX_REQUEST_DEPTH))
+
+
+def _iter_tree_nodes(response: "Response") -> Iterator[dict]:
+    """Parse a streamed ``/tree`` response into node dicts, children first."""
+    try:
+        stream = JSONStream(response.iter_content(STREAM_CHUNK_SIZE))
+        for key in stream.iter_object():
+            if key == "tree":
+                yield from iter_nested(stream)
+            else:
+                stream.value()
+    finally:
+        response.close()
+
+
 class Tree(TekDriveBase):
     """
     Provides directory listing.
@@ -18,6 +82,111 @@ class Tree(TekDriveBase):
     def __init__(self, tekdrive: "TekDrive"):
         super().__init__(tekdrive=tekdrive, _data=None)
 
+    def _params(
+        self,
+        folder_id: Optional[str],
+        silo: Optional[str],
+        depth: Optional[int],
+        folders_only: bool,
+        include_trashed: bool,
+    ):
+        return to_camel_case(
+            dict(
+                folder_id=folder_id,
+                silo=silo,
+                depth=depth,
+                folders_only=folders_only,
+                include_trashed=include_trashed,
+            )
+        )
+
+    def _fetch(
+        self,
+        folder_id: Optional[str],
+        silo: Optional[str],
+        depth: Optional[int],
+        folders_only: bool,
+        include_trashed: bool,
+        cache: bool = True,
+    ) -> Folder:
+        route = Route("GET", ENDPOINTS["tree"])
+        params = self._params(folder_id, silo, depth, folders_only, include_trashed)
+        folder = self._tekdrive.request(route, params=params)
+        if cache and not (folders_only or include_trashed):
+            self._cache_listings(folder)
+        return folder
+
+    def _cache_listings(self, folder: Folder):
+        """Cache the children of every folder that was listed in the payload."""
+        cache = self._tekdrive._children_cache
+        stack = [folder]
+        while stack:
+            current = stack.pop()
+            if current._children is not None:
+                cache.put(current.id, current._children)
+                stack.extend(
+                    child for child in current._children if isinstance(child, Folder)
+                )
+
+    def _stream_nodes(
+        self,
+        folder_id: Optional[str],
+        silo: Optional[str],
+        depth: Optional[int],
+        folders_only: bool,
+        include_trashed: bool,
+    ) -> Iterator[dict]:
+        route = Route("GET", ENDPOINTS["tree"])
+        params = self._params(folder_id, silo, depth, folders_only, include_trashed)
+        response = self._tekdrive._request(route, params=params, stream=True)
+        return _iter_tree_nodes(response)
+
+    def _fetch_split(
+        self,
+        folder_id: Optional[str],
+        silo: Optional[str],
+        depth: int,
+        split_depth: int,
+        workers: int,
+        folders_only: bool,
+        include_trashed: bool,
+    ) -> Folder:
+        def fetch(folder_id: str, depth: int) -> Folder:
+            return self._fetch(folder_id, None, depth, folders_only, include_trashed)
+
+        def split(folder: Folder, remaining: int):
+            # queue the subtrees that still need ``remaining`` more levels
+            for boundary, level in _boundary_folders(folder):
+                if remaining - level > 0:
+                    to_fetch.append((boundary, remaining - level))
+
+        root = self._fetch(folder_id, silo, split_depth, folders_only, include_trashed)
+        to_fetch = deque()
+        split(root, depth)
+
+        executor = ThreadPoolExecutor(max_workers=workers)
+        pending = {}
+        try:
+            while to_fetch or pending:
+                # bounded so that fetched subtrees are merged as they arrive
+                while to_fetch and len(pending) < workers * 2:
+                    folder, remaining = to_fetch.popleft()
+                    future = executor.submit(
+                        fetch, folder.id, min(remaining, split_depth)
+                    )
+                    pending[future] = (folder, remaining)
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    folder, remaining = pending.pop(future)
+                    folder._children = future.result()._children
+                    split(folder, remaining)
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
+        return root
+
     def get(
         self,
         *,
@@ -26,6 +195,8 @@ class Tree(TekDriveBase):
         depth: Optional[int] = 1,
         folders_only: bool = False,
         include_trashed: bool = False,
+        split_depth: Optional[int] = None,
+        workers: int = 4,
     ) -> Folder:
         """
         Get the tree representation from a starting folder.
@@ -36,6 +207,11 @@ class Tree(TekDriveBase):
             silo: Get tree for the provided silo. Values: ``"SHARES"`` or ``"PERSONAL"``.
             folders_only: Only include folders in the tree results? Default: ``False``.
             include_trashed: Include files and folders that are in the trashcan.
+            split_depth: Split requests deeper than this many levels. The top levels
+                are fetched first, then the remaining subtrees are fetched in
+                parallel and merged into the same structure a single request would
+                return. Default: ``None`` (always use a single request).
+            workers: Maximum number of concurrent requests when splitting.
 
         Examples:
             Get tree from starting folder by id::
@@ -46,18 +222,271 @@ class Tree(TekDriveBase):
 
                 tree = td.tree.get(silo="SHARES", folders_only=True)
 
+            Get a deep tree using requests of at most 2 levels each::
+
+                tree = td.tree.get(silo="PERSONAL", depth=10, split_depth=2, workers=8)
+
         Returns:
             :ref:`folder`
         """
-
-        route = Route("GET", ENDPOINTS["tree"])
-        params = to_camel_case(
-            dict(
-                folder_id=folder_id,
-                silo=silo,
-                depth=depth,
-                folders_only=folders_only,
-                include_trashed=include_trashed,
+        if split_depth and depth and depth > split_depth:
+            return self._fetch_split(
+                folder_id,
+                silo,
+                depth,
+                split_depth,
+                workers,
+                folders_only,
+                include_trashed,
             )
+        return self._fetch(folder_id, silo, depth, folders_only, include_trashed)
+
+    def stream(
+        self,
+        *,
+        folder_id: Optional[str] = None,
+        silo: Optional[str] = None,
+        depth: Optional[int] = 1,
+        folders_only: bool = False,
+        include_trashed: bool = False,
+    ) -> Iterator[Union[File, Folder]]:
+        """
+        Stream every file and folder of a tree while the response is downloading.
+
+        The response is parsed incrementally, so the first items are available
+        before the whole body has arrived and the full tree is never held in
+        memory. Items are yielded children first, ending with the starting folder.
+        Folders are yielded without their children; use ``parent_folder_id`` to
+        relate items to each other.
+
+        Args:
+            folder_id: Unique ID of starting folder to start the tree from.
+            depth: How many nested levels to return.
+            silo: Get tree for the provided silo. Values: ``"SHARES"`` or ``"PERSONAL"``.
+            folders_only: Only include folders in the tree results? Default: ``False``.
+            include_trashed: Include files and folders that are in the trashcan.
+
+        Examples:
+            Collect WFM files from a large silo::
+
+                wfm_files = [
+                    item
+                    for item in td.tree.stream(silo="PERSONAL", depth=20)
+                    if item.type == ObjectType.FILE and item.file_type == "WFM"
+                ]
+
+        Returns:
+            Iterator [ Union [ :ref:`file` , :ref:`folder` ] ]
+        """
+        nodes = self._stream_nodes(
+            folder_id, silo, depth, folders_only, include_trashed
+        )
+        for node in nodes:
+            yield self._tekdrive._parser.parse(node)
+
+    def compact(
+        self,
+        *,
+        folder_id: Optional[str] = None,
+        silo: Optional[str] = None,
+        depth: Optional[int] = 1,
+        folders_only: bool = False,
+        include_trashed: bool = False,
+    ) -> CompactTree:
+        """
+        Get the tree representation from a starting folder as a :class:`.CompactTree`.
+
+        The response is streamed straight into arrays, so no model objects are
+        created until nodes are accessed. Prefer this over :meth:`get` for trees
+        with hundreds of thousands of nodes.
+
+        Args:
+            folder_id: Unique ID of starting folder to start the tree from.
+            depth: How many nested levels to return.
+            silo: Get tree for the provided silo. Values: ``"SHARES"`` or ``"PERSONAL"``.
+            folders_only: Only include folders in the tree results? Default: ``False``.
+            include_trashed: Include files and folders that are in the trashcan.
+
+        Examples:
+            Total the bytes below each top level folder::
+
+                tree = td.tree.compact(silo="PERSONAL", depth=50)
+                for id in tree.children(tree.root):
+                    print(tree.path(id), tree.subtree_bytes(id))
+
+        Returns:
+            :class:`.CompactTree`
+        """
+        nodes = self._stream_nodes(
+            folder_id, silo, depth, folders_only, include_trashed
         )
-        return self._tekdrive.request(route, params=params)
+        return CompactTree(self._tekdrive, nodes)
+
+    def snapshot(
+        self,
+        *,
+        folder_id: Optional[str] = None,
+        silo: Optional[str] = None,
+        workers: int = 4,
+        include_trashed: bool = False,
+    ) -> TreeSnapshot:
+        """
+        Record the ids, parents, names, sizes and update times of a whole tree.
+
+        The tree is fetched concurrently with :meth:`walk`, bypassing cached
+        listings. Compare two snapshots
+        with :meth:`.TreeSnapshot.diff` to find what changed between them.
+
+        Args:
+            folder_id: Unique ID of the folder to start from.
+            silo: Snapshot the provided silo. Values: ``"SHARES"`` or ``"PERSONAL"``.
+            workers: Maximum number of concurrent requests.
+            include_trashed: Include files and folders that are in the trashcan.
+
+        Examples:
+            Save a snapshot of the ``PERSONAL`` silo::
+
+                td.tree.snapshot(silo="PERSONAL").save("personal.snapshot")
+
+        Returns:
+            :class:`.TreeSnapshot`
+        """
+        walk = self.walk(
+            folder_id=folder_id,
+            silo=silo,
+            workers=workers,
+            include_trashed=include_trashed,
+            use_cache=False,
+        )
+        return TreeSnapshot.from_walk(walk)
+
+    def walk(
+        self,
+        *,
+        folder_id: Optional[str] = None,
+        silo: Optional[str] = None,
+        max_depth: Optional[int] = None,
+        workers: int = 4,
+        depth: int = 2,
+        nodes_per_request: int = 1000,
+        folders_only: bool = False,
+        include_trashed: bool = False,
+        use_cache: bool = True,
+    ) -> Iterator[Tuple[Folder, List[Folder], List[File]]]:
+        """
+        Walk the folder tree like :func:`os.walk`, fetching subtrees concurrently.
+
+        Subtrees are requested breadth-first on a pool of ``workers`` threads. The
+        ``depth`` of each request is chosen from the size of the payload its parent
+        subtree came back with, aiming for about ``nodes_per_request`` nodes per
+        response. A ``(folder, subfolders, files)`` tuple is yielded for every
+        folder as soon as its listing arrives, so folders are not yielded in a
+        fixed order. As with ``os.walk``, removing entries from ``subfolders``
+        skips walking into them. Folders whose listing is in the client's
+        children cache are not requested again, unless ``use_cache`` is ``False``,
+        in which case listings are neither read from nor stored in the cache.
+
+        Args:
+            folder_id: Unique ID of the folder to start walking from.
+            silo: Walk the provided silo. Values: ``"SHARES"`` or ``"PERSONAL"``.
+            max_depth: How many levels below the starting folder to list. Default:
+                ``None`` (the whole tree).
+            workers: Maximum number of concurrent requests.
+            depth: How many nested levels to request for the starting folder.
+            nodes_per_request: Target number of nodes per response.
+            folders_only: Only include folders in the tree results? Default: ``False``.
+            include_trashed: Include files and folders that are in the trashcan.
+            use_cache: Use and fill the client's children cache? Default: ``True``.
+
+        Examples:
+            Print every file in the ``PERSONAL`` silo::
+
+                for folder, subfolders, files in td.tree.walk(silo="PERSONAL", workers=8):
+                    for file in files:
+                        print(folder.name, file.name)
+
+            Skip walking into folders named ``"archive"``::
+
+                for folder, subfolders, files in td.tree.walk(folder_id=folder_id):
+                    subfolders[:] = [f for f in subfolders if f.name != "archive"]
+
+        Returns:
+            Iterator [ Tuple [ :ref:`folder`, List [ :ref:`folder` ], List [ :ref:`file` ] ] ]
+        """
+
+        def request_depth(level: int, wanted: int) -> int:
+            if max_depth is None:
+                return wanted
+            return max(1, min(wanted, max_depth - level))
+
+        def fetch(folder_id: Optional[str], level: int, fetch_depth: int):
+            folder = self._fetch(
+                folder_id,
+                silo if folder_id is None else None,
+                fetch_depth,
+                folders_only,
+                include_trashed,
+                cache=use_cache,
+            )
+            return folder, level, fetch_depth
+
+        def listing(folder: Folder) -> Optional[List[Union[File, Folder]]]:
+            if (
+                folder._children is not None
+                or not use_cache
+                or folders_only
+                or include_trashed
+            ):
+                return folder._children
+            return self._tekdrive._children_cache.get(folder.id)
+
+        def expand(root: Folder, root_level: int, next_depth: int):
+            levels = deque([(root, root_level)])
+            while levels:
+                folder, level = levels.popleft()
+                children = listing(folder)
+                if children is None:
+                    # listing was beyond the depth of this request
+                    to_fetch.append(
+                        (folder.id, level, request_depth(level, next_depth))
+                    )
+                    continue
+
+                subfolders = [c for c in children if isinstance(c, Folder)]
+                files = [c for c in children if isinstance(c, File)]
+                yield folder, subfolders, files
+
+                if max_depth is None or level + 1 < max_depth:
+                    levels.extend((sub, level + 1) for sub in subfolders)
+
+        executor = ThreadPoolExecutor(max_workers=workers)
+        to_fetch = deque()
+        pending = set()
+        try:
+            if folder_id is None or not use_cache:
+                to_fetch.append((folder_id, 0, request_depth(0, depth)))
+            else:
+                # starts from cached listings when they are fresh, with the
+                # root's name and parent as far as they are known
+                root = Folder(
+                    self._tekdrive,
+                    folder_id,
+                    _data=self._tekdrive._path_index.details(folder_id),
+                )
+                yield from expand(root, 0, depth)
+
+            while to_fetch or pending:
+                while to_fetch and len(pending) < workers * 2:
+                    pending.add(executor.submit(fetch, *to_fetch.popleft()))
+
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    root, root_level, fetch_depth = future.result()
+                    next_depth = _choose_depth(
+                        _count_nodes(root), fetch_depth, nodes_per_request
+                    )
+                    yield from expand(root, root_level, next_depth)
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
@@ -0,0 +1,124 @@
+"""Provides the Watcher class."""
+import threading
+from typing import TYPE_CHECKING, Iterator, List, NamedTuple, Optional
+
+from .base import TekDriveBase
+from .snapshot import SnapshotEntry, TreeSnapshot
+from .tree import _iter_tree_nodes
+from ..enums import ChangeType
+from ..routing import Route, ENDPOINTS
+from ..settings import WATCH_MAX_INTERVAL, WATCH_MIN_INTERVAL
+from ..status_codes import NOT_MODIFIED
+
+if TYPE_CHECKING:
+    from .. import TekDrive
+
+
+class WatchEvent(NamedTuple):
+    """
+    A change to an item in a watched folder.
+
+    Attributes:
+        type (:class:`.ChangeType`): What changed.
+        id (str): Unique ID of the file or folder.
+        entry (:class:`.SnapshotEntry`): Parent, name, size and update time of the
+            item, as last seen before it was deleted or after any other change.
+    """
+
+    type: ChangeType
+    id: str
+    entry: SnapshotEntry
+
+
+class Watcher(TekDriveBase):
+    """
+    Polls a folder and yields :class:`WatchEvent` objects as its contents change.
+
+    Each poll is a conditional ``/tree`` request: the ``ETag`` of the previous
+    response is sent as ``If-None-Match`` so an unchanged tree costs no body at
+    all. Changed responses are parsed incrementally into a
+    :class:`.TreeSnapshot` and diffed against the previous one. The interval
+    between polls drops to ``min_interval`` after a change and doubles while
+    nothing changes, up to ``max_interval``.
+
+    Examples:
+        Process new captures as they arrive::
+
+            for event in td.watch(folder_id):
+                if event.type == ChangeType.CREATED and not event.entry.is_folder:
+                    process(td.file(event.id))
+    """
+
+    def __init__(
+        self,
+        tekdrive: "TekDrive",
+        folder_id: str,
+        depth: int = 1,
+        min_interval: float = WATCH_MIN_INTERVAL,
+        max_interval: float = WATCH_MAX_INTERVAL,
+    ):
+        super().__init__(tekdrive, _data=None)
+        self.folder_id = folder_id
+        self.depth = depth
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.interval = min_interval
+        self.snapshot: Optional[TreeSnapshot] = None
+        self._etag: Optional[str] = None
+        self._stopped = threading.Event()
+
+    def __iter__(self) -> Iterator[WatchEvent]:
+        while not self._stopped.is_set():
+            yield from self.poll()
+            self._stopped.wait(self.interval)
+
+    def _fetch(self) -> Optional[TreeSnapshot]:
+        route = Route("GET", ENDPOINTS["tree"])
+        params = self._tekdrive.tree._params(
+            self.folder_id, None, self.depth, False, False
+        )
+        headers = {"If-None-Match": self._etag} if self._etag else None
+        response = self._tekdrive._request(
+            route, params=params, headers=headers, stream=True
+        )
+        if response.status_code == NOT_MODIFIED:
+            response.close()
+            return None
+        self._etag = response.headers.get("ETag")
+        return TreeSnapshot.from_nodes(_iter_tree_nodes(response))
+
+    def poll(self) -> List[WatchEvent]:
+        """
+        Check the folder once and return the changes since the previous poll. The
+        first poll records the current contents and returns no events.
+        """
+        snapshot = self._fetch()
+        if snapshot is None:
+            self.interval = min(self.interval * 2, self.max_interval)
+            return []
+
+        previous, self.snapshot = self.snapshot, snapshot
+        if previous is None:
+            return []
+
+        changes = snapshot.diff(previous)
+        events = [
+            WatchEvent(change_type, id, entries[id])
+            for change_type, ids, entries in (
+                (ChangeType.CREATED, changes.created, snapshot.entries),
+                (ChangeType.DELETED, changes.deleted, previous.entries),
+                (ChangeType.MOVED, changes.moved, snapshot.entries),
+                (ChangeType.RENAMED, changes.renamed, snapshot.entries),
+                (ChangeType.MODIFIED, changes.modified, snapshot.entries),
+            )
+            for id in ids
+        ]
+        if events:
+            self.interval = self.min_interval
+        else:
+            self.interval = min(self.interval * 2, self.max_interval)
+        return events
+
+    def stop(self):
+        """Stop iterating, waking up a pending wait."""
+        self._stopped.set()
@@ -33,6 +33,11 @@ ENDPOINTS = {
     "file_members": "/file/{file_id}/members",
     "file_member": "/file/{file_id}/members/{member_id}",
     "file_upload": "/file/{file_id}/uploadUrl",
+    # upload sessions are not part of the documented TekDrive API yet, they are
+    # only used by the experimental MultipartUpload
+    "file_uploads": "/file/{file_id}/uploads",
+    "file_upload_session": "/file/{file_id}/uploads/{upload_id}",
+    "file_upload_part": "/file/{file_id}/uploads/{upload_id}/parts/{part_number}",
     "folder_create": "/folder",
     "folder_details": "/folder/{folder_id}",
     "folder_delete": "/folder/{folder_id}",
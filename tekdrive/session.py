@@ -17,6 +17,7 @@ from .exceptions import (
 from .status_codes import (
     EXCEPTION_STATUS_CODES,
     NO_CONTENT,
+    NOT_MODIFIED,
     RETRY_EXCEPTIONS,
     RETRY_STATUS_CODES,
     STATUS_TO_EXCEPTION_MAPPING,
@@ -65,9 +66,10 @@ class Session(object):
         headers,
         retry_policy,
         timeout,
+        stream,
     ) -> Tuple[Optional["Response"], Optional[Exception]]:
-        if not headers:
-            headers = self._authorizer._get_auth_header()
+        auth_headers = self._authorizer._get_auth_header()
+        headers = {**auth_headers, **dict(headers)} if headers else auth_headers
 
         seconds_to_sleep = self._rate_limit.seconds_to_sleep()
         if seconds_to_sleep:
@@ -83,6 +85,7 @@ class Session(object):
                 params=params,
                 headers=headers,
                 timeout=timeout,
+                stream=stream,
             )
             log.debug(f"Response status: {response.status_code}")
 
@@ -108,6 +111,7 @@ class Session(object):
         params,
         headers,
         timeout,
+        stream=False,
     ):
         retry_policy = RetryPolicy()
         self._log_request(method, url, params, data, json)
@@ -123,11 +127,15 @@ class Session(object):
                 headers=headers,
                 retry_policy=retry_policy,
                 timeout=timeout,
+                stream=stream,
             )
             if response is None or response.status_code not in RETRY_STATUS_CODES:
                 break
 
             retry_policy.decrement_retries()
+            if stream and retry_policy.retries_remaining:
+                # release the connection of a response that will not be read
+                response.close()
             sleep_seconds = retry_policy.seconds_to_sleep()
             if sleep_seconds > 0:
                 sleep(sleep_seconds)
@@ -137,9 +145,15 @@ class Session(object):
             raise STATUS_TO_EXCEPTION_MAPPING[response.status_code](response)
         elif status_code == NO_CONTENT:
             return
+        elif status_code == NOT_MODIFIED:
+            # conditional request; the caller checks the status
+            return response if stream else None
         elif status_code not in SUCCESS_STATUS_CODES:
             raise Exception(f"Unknown status code: {status_code}")
 
+        if stream:
+            return response
+
         try:
             return response.json()
         except ValueError:
@@ -164,6 +178,7 @@ class Session(object):
         params: Optional[Union[str, Dict[str, Union[str, int]]]] = None,
         headers: dict = None,
         timeout: float = TIMEOUT,
+        stream: bool = False,
     ):
         """
         Return the json content from the resource at ``path``.
@@ -178,7 +193,9 @@ class Session(object):
             json: Object to be serialized to JSON in the body of the
                 request.
             params: The query parameters to send with the request.
-            headers: Overwrite all headers for the request.
+            headers: Additional headers for the request, such as ``If-None-Match``.
+            stream: Return the response without reading its body so it can be
+                consumed incrementally. The caller must close the response.
         """
         params = deepcopy(params) or {}
         data = self.safe_copy_dict(data, sort=True)
@@ -194,6 +211,7 @@ class Session(object):
             params=params,
             headers=headers,
             timeout=timeout,
+            stream=stream,
         )
 
 
@@ -5,3 +5,21 @@ __version__ = "1.1.0"
 RATELIMIT_SECONDS = 1
 TIMEOUT = 15
 BASE_URL = "https://drive.api.tekcloud.com"
+STREAM_CHUNK_SIZE = 64 * 1024
+PATH_INDEX_SIZE = 100_000
+CHILDREN_CACHE_SIZE = 10_000
+CHILDREN_CACHE_TTL = 30
+WATCH_MIN_INTERVAL = 1
+WATCH_MAX_INTERVAL = 60
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+DOWNLOAD_PART_SIZE = 8 * 1024 * 1024
+DOWNLOAD_RETRIES = 3
+DOWNLOAD_PARTIAL_SUFFIX = ".tekdrive-part"
+READER_BLOCK_SIZE = 256 * 1024
+READER_CACHE_BLOCKS = 32
+READER_READ_AHEAD = 8
+MULTIPART_PART_SIZE = 8 * 1024 * 1024
+MULTIPART_RETRIES = 3
+UPLOAD_CHECKPOINT_SUFFIX = ".tekdrive-upload"
+TRANSFER_MAX_BYTES_IN_FLIGHT = 256 * 1024 * 1024
+TRANSFER_MAX_API_REQUESTS = 8
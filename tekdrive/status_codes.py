@@ -17,6 +17,7 @@ from .exceptions import (
 )
 
 NO_CONTENT = http_codes.NO_CONTENT
+NOT_MODIFIED = http_codes.NOT_MODIFIED
 SUCCESS_STATUS_CODES = (http_codes.CREATED, http_codes.OK)
 RETRY_STATUS_CODES = (
     http_codes.BAD_GATEWAY,
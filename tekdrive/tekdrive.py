@@ -4,15 +4,24 @@ from typing import TYPE_CHECKING, IO, Any, Dict, Optional, Union
 
 from .authorizer import AccessKeyAuthorizer
 from .session import create_session
+from .transfer import StorageClient
 
 from . import models
-from .settings import TIMEOUT, BASE_URL
+from .settings import (
+    BASE_URL,
+    CHILDREN_CACHE_SIZE,
+    CHILDREN_CACHE_TTL,
+    TIMEOUT,
+    WATCH_MAX_INTERVAL,
+    WATCH_MIN_INTERVAL,
+)
 from .exceptions import (
     ClientException,
     ResponseException,
     TekDriveAPIException,
 )
 from .models.parser import Parser
+from .utils.cache import LRUCache
 from .utils.casing import to_snake_case
 
 if TYPE_CHECKING:
@@ -42,11 +51,14 @@ class TekDrive:
         # create authorizer and session
         self._authorizer = AccessKeyAuthorizer(access_key=access_key)
         self._session = create_session(authorizer=self._authorizer, base_url=base_url)
+        self._storage = StorageClient()
 
         # prepare parser
         self._parser = Parser(self, self._create_model_map())
 
         # models and helpers
+        self._path_index = models.PathIndex(self)
+        self._children_cache = LRUCache(CHILDREN_CACHE_SIZE, ttl=CHILDREN_CACHE_TTL)
         self.file = models.FileHelper(self, None)
         self.folder = models.FolderHelper(self, None)
         self.search = models.Search(self)
@@ -77,6 +89,67 @@ class TekDrive:
         }
         return model_map
 
+    def resolve(
+        self, path: str, silo: str = "PERSONAL"
+    ) -> Union["models.File", "models.Folder"]:
+        """
+        Return the file or folder at ``path``.
+
+        Paths start at the top of the silo, e.g. ``"/Lab3/scope7/run42.wfm"``. Ids
+        are looked up in a per-client path index filled from earlier responses,
+        so only folders that have not been listed yet cost a request.
+
+        Args:
+            path: Slash separated names of the folders leading to the item.
+            silo: Silo the path starts in. Values: ``"SHARES"`` or ``"PERSONAL"``.
+
+        Raises:
+            ClientException: If nothing exists at the path.
+
+        Examples:
+            Download a file by path::
+
+                file = td.resolve("/Lab3/scope7/2026-10/run42.wfm")
+                file.download("run42.wfm")
+
+        Returns:
+            Union [ :ref:`file` , :ref:`folder` ]
+        """
+        return self._path_index.resolve(path, silo=silo)
+
+    def watch(
+        self,
+        folder_id: str,
+        depth: int = 1,
+        min_interval: float = WATCH_MIN_INTERVAL,
+        max_interval: float = WATCH_MAX_INTERVAL,
+    ) -> "models.Watcher":
+        """
+        Watch a folder for changes.
+
+        Args:
+            folder_id: Unique ID of the folder to watch.
+            depth: How many nested levels to watch.
+            min_interval: Seconds between polls right after a change.
+            max_interval: Longest number of seconds between polls while idle.
+
+        Examples:
+            Print changes as they happen::
+
+                for event in td.watch(folder_id, depth=2):
+                    print(event.type, event.entry.name)
+
+        Returns:
+            :class:`.Watcher`
+        """
+        return models.Watcher(
+            self,
+            folder_id,
+            depth=depth,
+            min_interval=min_interval,
+            max_interval=max_interval,
+        )
+
     def _request(
         self,
         route: "Route",
@@ -85,6 +158,7 @@ class TekDrive:
         headers: Optional[Dict[str, Union[str, Any]]] = None,
         files: Optional[Dict[str, IO]] = None,
         json=None,
+        stream: bool = False,
     ):
         if data and json:
             raise ClientException("Only supply one of: 'json', 'data'.")
@@ -97,6 +171,7 @@ class TekDrive:
                 headers=headers,
                 timeout=TIMEOUT,
                 json=json,
+                stream=stream,
             )
         except ResponseException as exception:
             try:
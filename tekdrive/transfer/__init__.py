@@ -0,0 +1,9 @@
+"""Transfers of file contents to and from storage."""
+from .bulk import TreeUpload, UploadResult  # noqa
+from .checkpoint import DownloadCheckpoint  # noqa
+from .ranged import RangedDownload  # noqa
+from .reader import RangeReader  # noqa
+from .resumable import ResumableDownload  # noqa
+from .scheduler import TransferScheduler  # noqa
+from .storage import StorageClient  # noqa
+from .streams import IterableReader  # noqa
@@ -0,0 +1,155 @@
+"""Provide the TreeUpload class."""
+import logging
+import os
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, List, Optional, Tuple, Union
+
+from ..exceptions import ClientException
+
+if TYPE_CHECKING:
+    from ..models import File, Folder
+
+log = logging.getLogger(__name__)
+
+
+@dataclass
+class UploadResult:
+    """
+    Outcome of uploading one local file or creating one local directory.
+
+    Items below a directory whose folder could not be created are skipped. Their
+    error is a :class:`.ClientException` caused by the folder's error.
+
+    Attributes:
+        path (str): Local path of the file or directory.
+        item (:ref:`file` or :ref:`folder`, optional): The created item, if it
+            was created.
+        error (Exception, optional): Why the item could not be created, its
+            contents could not be uploaded or, for a directory, its entries
+            could not be listed.
+    """
+
+    path: str
+    item: Optional[Union["File", "Folder"]] = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class TreeUpload:
+    """
+    Mirrors a local directory tree into a folder.
+
+    Folders and files are created on a pool of ``workers`` threads as soon as
+    their parent folder exists, so folder creation, file creation and content
+    transfers of different items overlap. Every file is created together with
+    its upload URL, and its contents are sent to that URL without another
+    request.
+    """
+
+    def __init__(self, folder: "Folder", local_dir: str, workers: int = 8):
+        self.folder = folder
+        self.local_dir = local_dir
+        self.workers = workers
+
+    @property
+    def _tekdrive(self):
+        return self.folder._tekdrive
+
+    def _create_folder(self, local_path: str, parent_id: str) -> "Folder":
+        return self._tekdrive.folder.create(
+            name=os.path.basename(local_path), parent_folder_id=parent_id
+        )
+
+    def _create_file(self, local_path: str, parent_id: str) -> UploadResult:
+        file = self._tekdrive.file.create(
+            name=os.path.basename(local_path), parent_folder_id=parent_id
+        )
+        try:
+            file.upload(local_path)
+        except Exception as exception:
+            return UploadResult(local_path, file, exception)
+        return UploadResult(local_path, file)
+
+    @staticmethod
+    def _scan(local_dir: str) -> List[Tuple[str, bool]]:
+        """Return ``(path, is directory)`` of the entries to upload, by name."""
+        with os.scandir(local_dir) as entries:
+            return [
+                (entry.path, entry.is_dir(follow_symlinks=False))
+                for entry in sorted(entries, key=lambda entry: entry.name)
+                if entry.is_dir(follow_symlinks=False) or entry.is_file()
+            ]
+
+    def _skip_tree(self, local_dir: str, cause: Exception) -> List[UploadResult]:
+        """Report everything below a directory whose folder could not be created."""
+        error = ClientException(
+            f"Skipped, folder for '{local_dir}' could not be created."
+        )
+        error.__cause__ = cause
+        results = []
+        directories = [local_dir]
+        while directories:
+            try:
+                entries = self._scan(directories.pop())
+            except OSError:
+                continue
+            for local_path, is_directory in entries:
+                results.append(UploadResult(local_path, error=error))
+                if is_directory:
+                    directories.append(local_path)
+        return results
+
+    def run(self) -> List[UploadResult]:
+        """
+        Upload the tree and return a result for every file and directory, by path.
+
+        A directory that can not be listed gets its error as its result, and
+        the upload continues with the rest of the tree.
+        """
+        results = []
+        executor = ThreadPoolExecutor(max_workers=self.workers)
+        # future -> (local path, is directory)
+        pending = {}
+
+        def submit_children(local_dir: str, parent_id: str) -> Optional[OSError]:
+            try:
+                entries = self._scan(local_dir)
+            except OSError as exception:
+                log.debug(f"Listing {local_dir} failed", exc_info=True)
+                return exception
+            for local_path, is_directory in entries:
+                create = self._create_folder if is_directory else self._create_file
+                future = executor.submit(create, local_path, parent_id)
+                pending[future] = (local_path, is_directory)
+            return None
+
+        try:
+            error = submit_children(self.local_dir, self.folder.id)
+            if error is not None:
+                results.append(UploadResult(self.local_dir, self.folder, error))
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    local_path, is_directory = pending.pop(future)
+                    try:
+                        result = future.result()
+                    except Exception as exception:
+                        log.debug(f"Uploading {local_path} failed", exc_info=True)
+                        results.append(UploadResult(local_path, error=exception))
+                        if is_directory:
+                            results.extend(self._skip_tree(local_path, exception))
+                        continue
+                    if is_directory:
+                        error = submit_children(local_path, result.id)
+                        results.append(UploadResult(local_path, result, error))
+                    else:
+                        results.append(result)
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
+        return sorted(results, key=lambda result: result.path)
@@ -0,0 +1,121 @@
+"""Provide the UploadCheckpoint and DownloadCheckpoint classes."""
+import hashlib
+import json
+import os
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, Optional, Type, TypeVar
+
+CHECKPOINT_VERSION = 1
+FINGERPRINT_SAMPLE_SIZE = 64 * 1024
+
+C = TypeVar("C", bound="Checkpoint")
+
+
+def fingerprint(path: str) -> str:
+    """
+    Return a cheap fingerprint of a local file's contents.
+
+    The size, modification time and samples from the start, middle and end of
+    the file are hashed, so large files are not read in full.
+    """
+    stat = os.stat(path)
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{stat.st_size}:{stat.st_mtime_ns}".encode("ascii"))
+    with open(path, "rb") as file:
+        for offset in (0, stat.st_size // 2, stat.st_size - FINGERPRINT_SAMPLE_SIZE):
+            file.seek(max(offset, 0))
+            digest.update(file.read(FINGERPRINT_SAMPLE_SIZE))
+    return digest.hexdigest()
+
+
+class Checkpoint:
+    """Transfer progress saved as JSON next to the data it describes."""
+
+    @classmethod
+    def _decode(cls, data: Dict[str, Any]) -> Dict[str, Any]:
+        return data
+
+    @classmethod
+    def load(cls: Type[C], path: str) -> Optional[C]:
+        """Load a checkpoint saved with :meth:`save`, or ``None`` if there is none."""
+        try:
+            with open(path, "r", encoding="utf-8") as file:
+                data = json.load(file)
+        except (OSError, ValueError):
+            return None
+        if data.pop("version", None) != CHECKPOINT_VERSION:
+            return None
+        return cls(**cls._decode(data))
+
+    def save(self, path: str):
+        """Write the checkpoint atomically, so a crash never leaves a partial file."""
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump(dict(version=CHECKPOINT_VERSION, **asdict(self)), file)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_path, path)
+
+    @staticmethod
+    def remove(path: str):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+@dataclass
+class UploadCheckpoint(Checkpoint):
+    """
+    Progress of a multipart upload, saved so an interrupted upload can resume.
+
+    Attributes:
+        file_id (str): Unique ID of the file being uploaded.
+        upload_id (str): Unique ID of the multipart upload session.
+        part_size (int): Size in bytes of each part.
+        size (int): Size in bytes of the contents.
+        fingerprint (str): :func:`fingerprint` of the local file.
+        parts (dict): Part number -> ETag of the stored parts.
+    """
+
+    file_id: str
+    upload_id: str
+    part_size: int
+    size: int
+    fingerprint: str
+    parts: Dict[int, str] = field(default_factory=dict)
+
+    @classmethod
+    def _decode(cls, data: Dict[str, Any]) -> Dict[str, Any]:
+        # JSON object keys are strings
+        data["parts"] = {
+            int(part_number): etag for part_number, etag in data["parts"].items()
+        }
+        return data
+
+    def matches(
+        self, file_id: str, part_size: int, size: int, fingerprint: str
+    ) -> bool:
+        return (self.file_id, self.part_size, self.size, self.fingerprint) == (
+            file_id,
+            part_size,
+            size,
+            fingerprint,
+        )
+
+
+@dataclass
+class DownloadCheckpoint(Checkpoint):
+    """
+    Identifies the version of a file or artifact being downloaded to a partial
+    file, so a later download only continues it if the contents did not change.
+
+    Attributes:
+        id (str): Unique ID of the file or artifact.
+        bytes (int, optional): Size in bytes of the contents.
+        updated_at (str, optional): When the contents were last updated.
+    """
+
+    id: str
+    bytes: Optional[int]
+    updated_at: Optional[str]
@@ -0,0 +1,266 @@
+"""Provide the MultipartUpload class."""
+import logging
+import os
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Container,
+    Dict,
+    Iterable,
+    Iterator,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from ..exceptions import TekDriveAPIException
+from ..routing import Route, ENDPOINTS
+from ..settings import MULTIPART_PART_SIZE, MULTIPART_RETRIES, UPLOAD_CHECKPOINT_SUFFIX
+from .checkpoint import UploadCheckpoint, fingerprint
+from .storage import with_retries
+from .streams import is_seekable, map_file, read_exactly
+
+if TYPE_CHECKING:
+    from ..models import File
+
+log = logging.getLogger(__name__)
+
+
+def iter_parts(
+    readable: IO, part_size: int, skip: Container[int] = ()
+) -> Iterator[Tuple[int, bytes]]:
+    """
+    Split a readable into numbered parts of ``part_size`` bytes, leaving out the
+    part numbers in ``skip``. Skipped parts are seeked over when possible.
+    """
+    part_number = 1
+    while True:
+        if part_number in skip:
+            if is_seekable(readable):
+                readable.seek(part_size, os.SEEK_CUR)
+            else:
+                read_exactly(readable, part_size)
+            part_number += 1
+            continue
+        data = read_exactly(readable, part_size)
+        if not data and part_number > 1:
+            return
+        yield part_number, data
+        if not data:
+            # empty contents are sent as a single empty part
+            return
+        part_number += 1
+
+
+def iter_buffer_parts(
+    buffer: memoryview, part_size: int, skip: Container[int] = ()
+) -> Iterator[Tuple[int, memoryview]]:
+    """Split a byte view into numbered parts without copies, like :func:`iter_parts`."""
+    part_count = max(1, -(-len(buffer) // part_size))
+    for part_number in range(1, part_count + 1):
+        if part_number not in skip:
+            offset = (part_number - 1) * part_size
+            yield part_number, buffer[offset : offset + part_size]
+
+
+class MultipartUpload:
+    """
+    Uploads file contents as separately stored parts.
+
+    .. warning::
+
+        Experimental. The ``/file/{id}/uploads`` session endpoints this class
+        relies on are not part of the documented TekDrive API, so the upload
+        fails against the service until they are. :meth:`.File.upload` and
+        :class:`.TransferScheduler` do not use it and send contents in a single
+        request to the file's upload URL instead.
+
+    An upload session is created for the file, then parts are sent to their
+    own presigned URLs by a pool of ``workers`` threads. Each part is retried
+    on its own, and the parts are committed in order once all of them are
+    stored. At most ``workers`` parts are in flight and one more is being read,
+    which bounds memory use to about ``(workers + 1) * part_size`` bytes.
+
+    Uploads of local files can be checkpointed with :meth:`upload_resumable`,
+    which records the session and every stored part in an
+    :class:`.UploadCheckpoint` so a later call only sends the missing parts.
+    """
+
+    def __init__(
+        self,
+        file: "File",
+        part_size: int = MULTIPART_PART_SIZE,
+        workers: int = 4,
+        retries: int = MULTIPART_RETRIES,
+    ):
+        self.file = file
+        self.part_size = part_size
+        self.workers = workers
+        self.retries = retries
+        self.upload_id = None
+        # part number -> ETag of stored parts
+        self.parts: Dict[int, str] = {}
+        self.checkpoint: Optional[UploadCheckpoint] = None
+        self.checkpoint_path: Optional[str] = None
+        self._lock = threading.Lock()
+
+    @property
+    def _tekdrive(self):
+        return self.file._tekdrive
+
+    def _request(self, route: Route, **kwargs):
+        return self._tekdrive.request(route, **kwargs)
+
+    def create(self) -> str:
+        route = Route("POST", ENDPOINTS["file_uploads"], file_id=self.file.id)
+        self.upload_id = self._request(route)["upload_id"]
+        return self.upload_id
+
+    def _part_url(self, part_number: int) -> str:
+        route = Route(
+            "GET",
+            ENDPOINTS["file_upload_part"],
+            file_id=self.file.id,
+            upload_id=self.upload_id,
+            part_number=part_number,
+        )
+        return self._request(route)["upload_url"]
+
+    def upload_part(self, part_number: int, data) -> str:
+        """Store one part, retrying failures, and return its ETag."""
+        urls = [self._part_url(part_number)]
+
+        def refresh_url():
+            urls[0] = self._part_url(part_number)
+
+        response = with_retries(
+            lambda: self._tekdrive._storage.put(urls[0], data),
+            self.retries,
+            refresh_url,
+        )
+        etag = response.headers.get("ETag")
+        with self._lock:
+            self.parts[part_number] = etag
+            if self.checkpoint is not None:
+                self.checkpoint.parts[part_number] = etag
+                self.checkpoint.save(self.checkpoint_path)
+        return etag
+
+    def complete(self):
+        route = Route(
+            "POST",
+            ENDPOINTS["file_upload_session"],
+            file_id=self.file.id,
+            upload_id=self.upload_id,
+        )
+        parts = [
+            dict(partNumber=part_number, etag=etag)
+            for part_number, etag in sorted(self.parts.items())
+        ]
+        self._request(route, json=dict(parts=parts))
+
+    def abort(self):
+        route = Route(
+            "DELETE",
+            ENDPOINTS["file_upload_session"],
+            file_id=self.file.id,
+            upload_id=self.upload_id,
+        )
+        self._request(route)
+
+    def _resume(self, checkpoint_path: str, size: int, file_fingerprint: str) -> bool:
+        checkpoint = UploadCheckpoint.load(checkpoint_path)
+        resumed = checkpoint is not None and checkpoint.matches(
+            self.file.id, self.part_size, size, file_fingerprint
+        )
+        if resumed:
+            log.debug(
+                f"Resuming upload {checkpoint.upload_id} "
+                f"with {len(checkpoint.parts)} parts stored"
+            )
+            self.upload_id = checkpoint.upload_id
+            self.parts = dict(checkpoint.parts)
+        else:
+            self.create()
+            self.parts = {}
+            checkpoint = UploadCheckpoint(
+                self.file.id, self.upload_id, self.part_size, size, file_fingerprint
+            )
+            checkpoint.save(checkpoint_path)
+        self.checkpoint = checkpoint
+        self.checkpoint_path = checkpoint_path
+        return resumed
+
+    def upload_parts(self, parts: Iterable[Tuple[int, bytes]]):
+        """Upload numbered parts concurrently, reading ahead only as workers free up."""
+        parts = iter(parts)
+        executor = ThreadPoolExecutor(max_workers=self.workers)
+        pending = set()
+        try:
+            while True:
+                while len(pending) < self.workers:
+                    part = next(parts, None)
+                    if part is None:
+                        break
+                    pending.add(executor.submit(self.upload_part, *part))
+                if not pending:
+                    return
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    future.result()
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
+
+    def _iter_parts(self, contents: Union[IO, memoryview], skip: Container[int] = ()):
+        if isinstance(contents, memoryview):
+            return iter_buffer_parts(contents, self.part_size, skip)
+        return iter_parts(contents, self.part_size, skip)
+
+    def upload(self, contents: Union[IO, memoryview]):
+        """
+        Upload the contents of a readable, or of a byte view without copying it,
+        and commit them to the file.
+        """
+        self.create()
+        try:
+            self.upload_parts(self._iter_parts(contents))
+            self.complete()
+        except BaseException:
+            try:
+                self.abort()
+            except Exception:
+                log.debug("Aborting multipart upload failed", exc_info=True)
+            raise
+
+    def upload_resumable(self, path: str, checkpoint_path: Optional[str] = None):
+        """
+        Upload a local file, saving progress to ``checkpoint_path`` after every
+        part. If the checkpoint belongs to an earlier upload of the same file
+        contents, only the parts it does not list are sent. The checkpoint is
+        removed once the upload is committed and kept if it fails. By default
+        the checkpoint is saved next to ``path`` with a ``.tekdrive-upload``
+        suffix.
+        """
+        if checkpoint_path is None:
+            checkpoint_path = path + UPLOAD_CHECKPOINT_SUFFIX
+        size = os.path.getsize(path)
+        resumed = self._resume(checkpoint_path, size, fingerprint(path))
+        try:
+            with map_file(path) as contents:
+                self.upload_parts(self._iter_parts(contents, skip=set(self.parts)))
+            self.complete()
+        except TekDriveAPIException:
+            if not resumed:
+                raise
+            # the saved session has expired or been aborted, start over
+            log.debug(
+                f"Restarting upload after resuming {self.upload_id} failed",
+                exc_info=True,
+            )
+            UploadCheckpoint.remove(checkpoint_path)
+            return self.upload_resumable(path, checkpoint_path)
+        UploadCheckpoint.remove(checkpoint_path)
@@ -0,0 +1,173 @@
+"""Provide the RangedDownload class."""
+import logging
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import IO, TYPE_CHECKING, List, Optional, Tuple
+
+from requests.status_codes import codes as http_codes
+
+from ..exceptions import TekDriveStorageException
+from ..settings import DOWNLOAD_CHUNK_SIZE, DOWNLOAD_PART_SIZE, DOWNLOAD_RETRIES
+from .storage import status_code, with_retries
+
+if TYPE_CHECKING:
+    from ..models.drive.base import Downloadable
+
+log = logging.getLogger(__name__)
+
+CONTENT_RANGE = re.compile(r"bytes (\d+)-(\d+)/(\d+|\*)")
+
+
+def parse_content_range(
+    value: Optional[str],
+) -> Optional[Tuple[int, int, Optional[int]]]:
+    """Return ``(start, end, total)`` of a ``Content-Range`` header, if valid."""
+    match = CONTENT_RANGE.fullmatch((value or "").strip())
+    if match is None:
+        return None
+    start, end, total = match.groups()
+    return int(start), int(end), None if total == "*" else int(total)
+
+
+def split_ranges(size: int, part_size: int) -> List[Tuple[int, int]]:
+    """Split ``size`` bytes into inclusive ``(start, end)`` ranges."""
+    return [
+        (start, min(start + part_size, size) - 1) for start in range(0, size, part_size)
+    ]
+
+
+class RangedDownload:
+    """
+    Downloads contents as byte ranges fetched concurrently.
+
+    A one byte ``Range`` request first checks that storage supports ranges and
+    finds the size. The target file is then extended to its final size and
+    ``workers`` threads write their ranges into it at their own offsets. Each
+    range is retried on its own and continues from the last byte it wrote. An
+    expired download URL is fetched again for every range that needs it.
+    """
+
+    def __init__(
+        self,
+        downloadable: "Downloadable",
+        workers: int = 4,
+        part_size: int = DOWNLOAD_PART_SIZE,
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+        retries: int = DOWNLOAD_RETRIES,
+    ):
+        self.downloadable = downloadable
+        self.workers = workers
+        self.part_size = part_size
+        self.chunk_size = chunk_size
+        self.retries = retries
+        self.url: Optional[str] = None
+        self._url_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+
+    @property
+    def _storage(self):
+        return self.downloadable._tekdrive._storage
+
+    def refresh_url(self):
+        with self._url_lock:
+            self.url = self.downloadable._fetch_download_url()
+
+    def probe(self) -> Optional[int]:
+        """Return the size of the contents, or ``None`` if ranges are not supported."""
+        if self.url is None:
+            self.refresh_url()
+
+        def attempt():
+            return self._storage.get(
+                self.url, headers={"Range": "bytes=0-0"}, stream=True
+            )
+
+        try:
+            response = with_retries(attempt, self.retries, self.refresh_url)
+        except TekDriveStorageException as exception:
+            if status_code(exception) == http_codes.REQUESTED_RANGE_NOT_SATISFIABLE:
+                # empty contents have no byte 0
+                return None
+            raise
+        response.close()
+        content_range = parse_content_range(response.headers.get("Content-Range"))
+        if response.status_code != http_codes.PARTIAL_CONTENT or content_range is None:
+            return None
+        return content_range[2]
+
+    def _write_at(self, file: IO, data: bytes, offset: int):
+        if hasattr(os, "pwrite"):
+            view = memoryview(data)
+            while view:
+                written = os.pwrite(file.fileno(), view, offset)
+                view, offset = view[written:], offset + written
+        else:
+            with self._write_lock:
+                file.seek(offset)
+                file.write(data)
+
+    def fetch_range(self, file: IO, start: int, end: int):
+        """Write bytes ``start`` to ``end`` (inclusive) into ``file`` at that offset."""
+        offsets = [start]
+
+        def attempt():
+            offset = offsets[0]
+            if offset > end:
+                # the previous attempt failed after receiving everything
+                return
+            response = self._storage.get(
+                self.url, headers={"Range": f"bytes={offset}-{end}"}, stream=True
+            )
+            try:
+                content_range = parse_content_range(
+                    response.headers.get("Content-Range")
+                )
+                if response.status_code != http_codes.PARTIAL_CONTENT or (
+                    content_range is None or content_range[0] != offset
+                ):
+                    raise TekDriveStorageException(
+                        f"Invalid response to range {offset}-{end}"
+                    )
+                for chunk in response.iter_content(self.chunk_size):
+                    chunk = chunk[: end + 1 - offsets[0]]
+                    self._write_at(file, chunk, offsets[0])
+                    offsets[0] += len(chunk)
+                    if offsets[0] > end:
+                        break
+            finally:
+                response.close()
+            if offsets[0] <= end:
+                raise TekDriveStorageException(
+                    f"Range {start}-{end} ended at {offsets[0]}"
+                )
+
+        with_retries(attempt, self.retries, self.refresh_url)
+
+    def download(self, file: IO) -> bool:
+        """
+        Download into ``file``, a binary file opened for writing.
+
+        Returns:
+            ``False`` if storage does not support ranges and nothing was written.
+        """
+        size = self.probe()
+        if size is None:
+            return False
+
+        file.truncate(size)
+        ranges = split_ranges(size, self.part_size)
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            futures = [
+                executor.submit(self.fetch_range, file, *byte_range)
+                for byte_range in ranges
+            ]
+            try:
+                for future in futures:
+                    future.result()
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+        return True
@@ -0,0 +1,203 @@
+"""Provide the RangeReader class."""
+import io
+import logging
+from typing import TYPE_CHECKING, Optional, Tuple
+
+from requests.status_codes import codes as http_codes
+
+from ..exceptions import TekDriveStorageException
+from ..settings import (
+    DOWNLOAD_RETRIES,
+    READER_BLOCK_SIZE,
+    READER_CACHE_BLOCKS,
+    READER_READ_AHEAD,
+)
+from ..utils.cache import LRUCache
+from .ranged import parse_content_range
+from .storage import status_code, with_retries
+
+if TYPE_CHECKING:
+    from ..models.drive.base import Downloadable
+
+log = logging.getLogger(__name__)
+
+
+class RangeReader(io.RawIOBase):
+    """
+    Read-only, seekable file over contents in storage.
+
+    Contents are fetched in blocks of ``block_size`` bytes with ``Range``
+    requests as they are read, and the last ``cache_blocks`` blocks are kept in
+    memory. Reading blocks one after another doubles the number of blocks
+    fetched per request, up to ``read_ahead`` blocks past the one being read,
+    while a seek elsewhere goes back to fetching one block at a time. Opening
+    the reader fetches the first block, which also gives the size of the
+    contents. If storage does not support ranges, the whole contents are
+    downloaded once instead.
+    """
+
+    def __init__(
+        self,
+        downloadable: "Downloadable",
+        block_size: int = READER_BLOCK_SIZE,
+        cache_blocks: int = READER_CACHE_BLOCKS,
+        read_ahead: int = READER_READ_AHEAD,
+        retries: int = DOWNLOAD_RETRIES,
+    ):
+        super().__init__()
+        self.downloadable = downloadable
+        self.block_size = block_size
+        self.retries = retries
+        self.url: Optional[str] = None
+        self.size = 0
+        self._blocks = LRUCache(max(1, cache_blocks))
+        self._max_window = max(1, min(1 + read_ahead, cache_blocks))
+        self._window = 1
+        self._last_block: Optional[int] = None
+        self._position = 0
+        # whole contents, when storage does not support ranges
+        self._contents: Optional[bytes] = None
+        self._open()
+
+    @property
+    def _storage(self):
+        return self.downloadable._tekdrive._storage
+
+    def refresh_url(self):
+        self.url = self.downloadable._fetch_download_url()
+
+    def _fetch(self, start: int, end: int) -> Tuple[Optional[int], bytes]:
+        """
+        Return the total size and bytes ``start`` to ``end`` (inclusive), or
+        ``None`` and the whole contents if storage ignored the range.
+        """
+
+        def attempt():
+            response = self._storage.get(
+                self.url, headers={"Range": f"bytes={start}-{end}"}, stream=True
+            )
+            try:
+                if response.status_code != http_codes.PARTIAL_CONTENT:
+                    return None, response.content
+                content_range = parse_content_range(
+                    response.headers.get("Content-Range")
+                )
+                if content_range is None or content_range[0] != start:
+                    raise TekDriveStorageException(
+                        f"Invalid response to range {start}-{end}"
+                    )
+                data = response.content
+            finally:
+                response.close()
+            if len(data) != content_range[1] + 1 - start:
+                raise TekDriveStorageException(
+                    f"Range {start}-{end} ended at {start + len(data)}"
+                )
+            return content_range[2], data
+
+        return with_retries(attempt, self.retries, self.refresh_url)
+
+    def _open(self):
+        self.refresh_url()
+        try:
+            size, data = self._fetch(0, self.block_size - 1)
+        except TekDriveStorageException as exception:
+            if status_code(exception) == http_codes.REQUESTED_RANGE_NOT_SATISFIABLE:
+                # empty contents have no byte 0
+                self._contents = b""
+                return
+            raise
+        if size is None:
+            log.debug("Storage does not support ranges, reading the whole contents")
+            self._contents = data
+            self.size = len(data)
+            return
+        self.size = size
+        self._blocks.put(0, data)
+        self._last_block = 0
+
+    def _block_count(self) -> int:
+        return -(-self.size // self.block_size)
+
+    def _block(self, index: int) -> bytes:
+        if self._last_block is not None and index == self._last_block + 1:
+            self._window = min(2 * self._window, self._max_window)
+        elif index != self._last_block:
+            self._window = 1
+        self._last_block = index
+
+        block = self._blocks.get(index)
+        if block is not None:
+            return block
+
+        # fetch the run of missing blocks that fits in the read-ahead window
+        stop = min(index + self._window, self._block_count())
+        count = 1
+        while index + count < stop and (index + count) not in self._blocks:
+            count += 1
+        start = index * self.block_size
+        end = min(start + count * self.block_size, self.size) - 1
+        size, data = self._fetch(start, end)
+        if size is None:
+            raise TekDriveStorageException(f"Invalid response to range {start}-{end}")
+        for offset in range(count - 1, -1, -1):
+            # the requested block is stored last, as the most recently used
+            self._blocks.put(
+                index + offset,
+                data[offset * self.block_size : (offset + 1) * self.block_size],
+            )
+        return data[: self.block_size]
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        if self.closed:
+            raise ValueError("I/O operation on closed file.")
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if self.closed:
+            raise ValueError("I/O operation on closed file.")
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = self.size + offset
+        else:
+            raise ValueError(f"invalid whence ({whence!r})")
+        if position < 0:
+            raise ValueError(f"negative seek position {position}")
+        self._position = position
+        return position
+
+    def readinto(self, buffer) -> int:
+        if self.closed:
+            raise ValueError("I/O operation on closed file.")
+        view = memoryview(buffer).cast("B")
+        if self._contents is not None:
+            data = self._contents[self._position : self._position + len(view)]
+            view[: len(data)] = data
+            self._position += len(data)
+            return len(data)
+
+        count = 0
+        while count < len(view) and self._position < self.size:
+            index, offset = divmod(self._position, self.block_size)
+            data = memoryview(self._block(index))[offset : offset + len(view) - count]
+            view[count : count + len(data)] = data
+            count += len(data)
+            self._position += len(data)
+        return count
+
+    def readall(self) -> bytes:
+        return self.read(max(0, self.size - self.tell()))
+
+    def close(self):
+        self._blocks.clear()
+        self._contents = None
+        super().close()
@@ -0,0 +1,106 @@
+"""Provide the ResumableDownload class."""
+import logging
+import os
+import shutil
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from ..settings import DOWNLOAD_CHUNK_SIZE, DOWNLOAD_PARTIAL_SUFFIX, DOWNLOAD_RETRIES
+from .checkpoint import DownloadCheckpoint
+from .ranged import RangedDownload
+
+if TYPE_CHECKING:
+    from ..models.drive.base import Downloadable
+
+log = logging.getLogger(__name__)
+
+
+class ResumableDownload:
+    """
+    Downloads to a partial file next to the target that survives interruptions.
+
+    The partial file is named after the target with a ``.tekdrive-part``
+    suffix, and a JSON sidecar records the id, size and update time of the
+    contents being downloaded. A later download continues the partial file with
+    a ``Range`` request if the contents did not change, and starts over
+    otherwise. Once complete, the partial file replaces the target.
+    """
+
+    def __init__(
+        self,
+        downloadable: "Downloadable",
+        path: str,
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+        retries: int = DOWNLOAD_RETRIES,
+    ):
+        self.downloadable = downloadable
+        self.path = path
+        self.partial_path = path + DOWNLOAD_PARTIAL_SUFFIX
+        self.checkpoint_path = self.partial_path + ".json"
+        self.chunk_size = chunk_size
+        self.retries = retries
+
+    def _version(self) -> DownloadCheckpoint:
+        size = getattr(self.downloadable, "bytes", None)
+        updated_at = getattr(self.downloadable, "updated_at", None)
+        if isinstance(updated_at, datetime):
+            updated_at = updated_at.isoformat()
+        return DownloadCheckpoint(
+            self.downloadable.id, None if size is None else int(size), updated_at
+        )
+
+    def _offset(self, version: DownloadCheckpoint) -> int:
+        """Bytes of the partial file that can be kept."""
+        if DownloadCheckpoint.load(self.checkpoint_path) == version:
+            try:
+                return os.path.getsize(self.partial_path)
+            except FileNotFoundError:
+                pass
+        # new or changed contents
+        open(self.partial_path, "wb").close()
+        version.save(self.checkpoint_path)
+        return 0
+
+    def _restart(self):
+        log.debug(
+            f"Storage does not support ranges, downloading {self.path} from the start"
+        )
+        with open(self.partial_path, "wb") as file:
+            self.downloadable.download(file, chunk_size=self.chunk_size)
+
+    def download(self) -> int:
+        """
+        Download, continuing a previous partial download when possible.
+
+        Returns:
+            Number of bytes that were already downloaded and kept.
+        """
+        version = self._version()
+        offset = self._offset(version)
+        ranged = RangedDownload(
+            self.downloadable,
+            workers=1,
+            chunk_size=self.chunk_size,
+            retries=self.retries,
+        )
+        size = ranged.probe()
+
+        if (
+            size is None
+            or offset > size
+            or (version.bytes is not None and size != version.bytes)
+        ):
+            offset = 0
+            self._restart()
+        elif offset < size:
+            log.debug(f"Resuming download of {self.path} at byte {offset} of {size}")
+            with open(self.partial_path, "r+b") as file:
+                ranged.fetch_range(file, offset, size - 1)
+
+        with open(self.partial_path, "rb+") as file:
+            os.fsync(file.fileno())
+        if os.path.exists(self.path):
+            shutil.copymode(self.path, self.partial_path)
+        os.replace(self.partial_path, self.path)
+        DownloadCheckpoint.remove(self.checkpoint_path)
+        return offset
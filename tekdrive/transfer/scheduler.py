@@ -0,0 +1,260 @@
+"""Provide the TransferScheduler class."""
+import io
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Iterator, List, NamedTuple, Optional
+
+from ..settings import (
+    STREAM_CHUNK_SIZE,
+    TRANSFER_MAX_API_REQUESTS,
+    TRANSFER_MAX_BYTES_IN_FLIGHT,
+)
+from .bulk import UploadResult
+from .streams import map_file
+
+if TYPE_CHECKING:
+    from .. import TekDrive
+
+log = logging.getLogger(__name__)
+
+
+class ByteBudget:
+    """
+    Counting semaphore over bytes. A request larger than the whole budget is
+    let through alone, so it can not wait forever.
+    """
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._condition = threading.Condition()
+
+    def acquire(self, size: int):
+        with self._condition:
+            while self.in_flight and self.in_flight + size > self.limit:
+                self._condition.wait()
+            self.in_flight += size
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+    def release(self, size: int):
+        with self._condition:
+            self.in_flight -= size
+            self._condition.notify_all()
+
+    @contextmanager
+    def reserve(self, size: int) -> Iterator[None]:
+        self.acquire(size)
+        try:
+            yield
+        finally:
+            self.release(size)
+
+
+class _BudgetedReader:
+    """
+    Seekable reader over contents to upload that reserves each chunk from a
+    :class:`ByteBudget` until the next one is read. Chunks are slices of the
+    contents, not copies, and the size is known so the upload is not chunked.
+    """
+
+    def __init__(
+        self,
+        contents: memoryview,
+        budget: ByteBudget,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+    ):
+        self._contents = contents
+        self._budget = budget
+        self._chunk_size = chunk_size
+        self._position = 0
+        self._reserved = 0
+
+    def __len__(self) -> int:
+        return len(self._contents)
+
+    def _release(self):
+        if self._reserved:
+            self._budget.release(self._reserved)
+            self._reserved = 0
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence == io.SEEK_END:
+            offset += len(self._contents)
+        self._position = max(0, offset)
+        return self._position
+
+    def read(self, size: int = -1) -> memoryview:
+        self._release()
+        if size is None or size < 0:
+            size = self._chunk_size
+        size = min(size, self._chunk_size, len(self._contents) - self._position)
+        if size <= 0:
+            return memoryview(b"")
+        self._budget.acquire(size)
+        self._reserved = size
+        chunk = self._contents[self._position : self._position + size]
+        self._position += size
+        return chunk
+
+    def close(self):
+        self._release()
+
+
+class _Job(NamedTuple):
+    path: str
+    name: str
+    parent_folder_id: Optional[str]
+    size: int
+
+
+class TransferScheduler:
+    """
+    Uploads many local files at once.
+
+    Files are started largest first, so long uploads overlap with the many
+    small files that fill the remaining workers. Each file is sent in a single
+    request to the upload URL returned when it is created; files are not split
+    into parts until the TekDrive API supports upload sessions. Two limits
+    apply across all files:
+
+    - ``max_bytes_in_flight`` bounds the bytes being sent to storage at once.
+      Files are reserved chunk by chunk as they are sent, so a file larger
+      than the budget does not hold up the small files next to it.
+    - ``max_api_requests`` bounds concurrent TekDrive API requests. It is
+      lowered to the remaining request count reported by the API's rate limit
+      headers, so a burst of uploads does not run into throttling.
+
+    Examples:
+        Upload a mixed batch of small CSVs and large waveforms::
+
+            scheduler = TransferScheduler(td, workers=16, max_bytes_in_flight=512 * 1024 * 1024)
+            for path in glob.glob("./captures/*"):
+                scheduler.add(path, parent_folder_id=folder.id)
+            for result in scheduler.run():
+                if not result.ok:
+                    print(result.path, result.error)
+    """
+
+    def __init__(
+        self,
+        tekdrive: "TekDrive",
+        workers: int = 8,
+        max_bytes_in_flight: int = TRANSFER_MAX_BYTES_IN_FLIGHT,
+        max_api_requests: int = TRANSFER_MAX_API_REQUESTS,
+    ):
+        """
+        Initialize a TransferScheduler instance.
+
+        Args:
+            tekdrive: An instance of :class:`.TekDrive`.
+            workers: Maximum number of files transferred at once.
+            max_bytes_in_flight: Maximum number of bytes being sent at once.
+            max_api_requests: Maximum number of concurrent API requests.
+        """
+        self._tekdrive = tekdrive
+        self.workers = workers
+        self.max_api_requests = max_api_requests
+        self._jobs: List[_Job] = []
+        self._bytes = ByteBudget(max_bytes_in_flight)
+        self._api_in_flight = 0
+        self._api_condition = threading.Condition()
+
+    def __len__(self) -> int:
+        return len(self._jobs)
+
+    def add(
+        self,
+        path: str,
+        name: Optional[str] = None,
+        parent_folder_id: Optional[str] = None,
+    ):
+        """
+        Queue a local file to be created and uploaded by :meth:`run`.
+
+        Args:
+            path: Path to the local file.
+            name: Name of the new file. Default: the name of the local file.
+            parent_folder_id: Unique ID of the folder to create the file in.
+        """
+        self._jobs.append(
+            _Job(
+                path,
+                name or os.path.basename(path),
+                parent_folder_id,
+                os.path.getsize(path),
+            )
+        )
+
+    def _api_limit(self) -> int:
+        remaining = self._tekdrive._session._rate_limit.remaining
+        if remaining is None:
+            return self.max_api_requests
+        # with no requests remaining one at a time waits for the reset
+        return max(1, min(self.max_api_requests, remaining))
+
+    @contextmanager
+    def _api_slot(self) -> Iterator[None]:
+        with self._api_condition:
+            while self._api_in_flight >= self._api_limit():
+                self._api_condition.wait()
+            self._api_in_flight += 1
+        try:
+            yield
+        finally:
+            with self._api_condition:
+                self._api_in_flight -= 1
+                self._api_condition.notify_all()
+
+    def _upload(self, job: _Job) -> UploadResult:
+        try:
+            with self._api_slot():
+                file = self._tekdrive.file.create(
+                    name=job.name, parent_folder_id=job.parent_folder_id
+                )
+        except Exception as exception:
+            log.debug(f"Creating {job.path} failed", exc_info=True)
+            return UploadResult(job.path, error=exception)
+
+        try:
+            if file._upload_url is None:
+                with self._api_slot():
+                    file._upload_url = file._fetch_upload_url()
+            with map_file(job.path) as contents:
+                # small enough chunks that every worker can hold one at once
+                chunk_size = min(
+                    STREAM_CHUNK_SIZE, max(1, self._bytes.limit // self.workers)
+                )
+                reader = _BudgetedReader(contents, self._bytes, chunk_size)
+                try:
+                    file._upload_to_storage(reader)
+                finally:
+                    reader.close()
+        except Exception as exception:
+            log.debug(f"Uploading {job.path} failed", exc_info=True)
+            return UploadResult(job.path, file, exception)
+        return UploadResult(job.path, file)
+
+    def run(self) -> List[UploadResult]:
+        """
+        Upload every queued file.
+
+        Returns:
+            List [ :class:`.UploadResult` ] in the order the files were added.
+        """
+        jobs, self._jobs = self._jobs, []
+        order = sorted(range(len(jobs)), key=lambda idx: jobs[idx].size, reverse=True)
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            futures = {idx: executor.submit(self._upload, jobs[idx]) for idx in order}
+        return [futures[idx].result() for idx in range(len(jobs))]
@@ -0,0 +1,86 @@
+"""Provide the StorageClient class."""
+import logging
+from time import sleep
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+import requests
+from requests.status_codes import codes as http_codes
+
+from ..exceptions import TekDriveStorageException
+from ..retry import RetryPolicy
+from ..settings import TIMEOUT
+from ..status_codes import RETRY_EXCEPTIONS, RETRY_STATUS_CODES
+
+log = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class StorageClient:
+    """
+    Sends file contents to and from the presigned storage URLs handed out by
+    the TekDrive API.
+
+    A single pooled ``requests.Session`` is shared by all transfers of a client,
+    so concurrent part uploads and range downloads reuse connections.
+    """
+
+    def __init__(self, session: Optional[requests.Session] = None):
+        self._http = session or requests.Session()
+
+    def close(self):
+        self._http.close()
+
+    def _call(self, method: str, url: str, error: str, **kwargs) -> requests.Response:
+        response = self._http.request(method, url, timeout=TIMEOUT, **kwargs)
+        try:
+            response.raise_for_status()
+        except requests.exceptions.HTTPError as exception:
+            raise TekDriveStorageException(error) from exception
+        return response
+
+    def put(
+        self, url: str, data: Any, headers: Optional[Dict[str, str]] = None
+    ) -> requests.Response:
+        """Upload ``data`` to a presigned URL."""
+        return self._call("PUT", url, "Upload failed", data=data, headers=headers)
+
+    def get(
+        self, url: str, headers: Optional[Dict[str, str]] = None, stream: bool = False
+    ) -> requests.Response:
+        """Download from a presigned URL."""
+        return self._call("GET", url, "Download failed", headers=headers, stream=stream)
+
+
+def status_code(exception: BaseException) -> Optional[int]:
+    """Return the HTTP status code behind a storage exception, if any."""
+    cause = exception.__cause__
+    response = getattr(cause, "response", None)
+    return getattr(response, "status_code", None)
+
+
+def with_retries(
+    attempt: Callable[[], T], retries: int, refresh_url: Callable[[], None]
+) -> T:
+    """
+    Call ``attempt`` until it succeeds, retrying connection errors and
+    retryable status codes with backoff. A ``403`` means the presigned URL
+    expired, so ``refresh_url`` is called before the next attempt instead.
+    """
+    retry_policy = RetryPolicy(retries=retries)
+    while True:
+        try:
+            return attempt()
+        except (TekDriveStorageException, *RETRY_EXCEPTIONS) as exception:
+            status = status_code(exception)
+            retryable = status is None or status in RETRY_STATUS_CODES
+            if not retry_policy.retries_remaining or not (
+                retryable or status == http_codes.FORBIDDEN
+            ):
+                raise
+            retry_policy.decrement_retries()
+            log.debug(f"Retrying storage request after {exception!r}")
+            if status == http_codes.FORBIDDEN:
+                refresh_url()
+            else:
+                sleep(retry_policy.seconds_to_sleep())
@@ -0,0 +1,132 @@
+"""Adapters between readables, iterables, buffers and request bodies."""
+import io
+import mmap
+import os
+import shutil
+import tempfile
+from contextlib import contextmanager
+from typing import IO, Any, Iterable, Iterator, Optional
+
+from ..settings import STREAM_CHUNK_SIZE
+
+
+def to_buffer(obj: Any) -> Optional[memoryview]:
+    """
+    Return a flat byte view of an object supporting the buffer protocol, such
+    as ``bytes``, ``bytearray``, ``memoryview`` or a NumPy array, without
+    copying it. Returns ``None`` for other objects.
+    """
+    try:
+        view = memoryview(obj)
+    except TypeError:
+        return None
+    if not view.c_contiguous:
+        # strided views can not be sent as is
+        view = memoryview(view.tobytes())
+    return view.cast("B")
+
+
+@contextmanager
+def map_file(path: str) -> Iterator[memoryview]:
+    """Map a local file into memory read-only and yield a byte view of it."""
+    with open(path, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            # empty files can not be mapped
+            yield memoryview(b"")
+            return
+        mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    view = memoryview(mapping)
+    try:
+        yield view
+    finally:
+        view.release()
+        try:
+            mapping.close()
+        except BufferError:
+            # slices of the view are still referenced, the mapping is closed
+            # once they are collected
+            pass
+
+
+@contextmanager
+def atomic_writer(path: str) -> Iterator[IO]:
+    """
+    Yield a binary file that replaces ``path`` once the block exits without an
+    error. Readers of ``path`` never see partially written contents, and a
+    failed write leaves the original file untouched.
+    """
+    directory, name = os.path.split(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(prefix=f".{name}.", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, "wb") as file:
+            yield file
+            file.flush()
+            os.fsync(file.fileno())
+        if os.path.exists(path):
+            shutil.copymode(path, temp_path)
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def is_seekable(readable: IO) -> bool:
+    try:
+        return readable.seekable()
+    except (AttributeError, ValueError):
+        return False
+
+
+def read_exactly(readable: IO, size: int) -> bytes:
+    """
+    Read ``size`` bytes, or fewer only at the end of the stream. Pipes, sockets
+    and raw streams may return short reads, which are joined here.
+    """
+    data = readable.read(size)
+    if data is None or len(data) == size or not data:
+        return data or b""
+    buffer = bytearray(data)
+    while len(buffer) < size:
+        data = readable.read(size - len(buffer))
+        if not data:
+            break
+        buffer += data
+    return bytes(buffer)
+
+
+def iter_chunks(readable: IO, chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[bytes]:
+    """Yield the contents of a readable in chunks of up to ``chunk_size`` bytes."""
+    while True:
+        data = readable.read(chunk_size)
+        if not data:
+            return
+        yield data
+
+
+class IterableReader(io.RawIOBase):
+    """
+    A read-only stream over an iterable of bytes-like chunks, such as a
+    generator producing data while it is being uploaded. Chunks are consumed
+    only as they are read.
+    """
+
+    def __init__(self, iterable: Iterable[bytes]):
+        self._chunks = iter(iterable)
+        self._pending = memoryview(b"")
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while not self._pending:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return 0
+            self._pending = memoryview(chunk).cast("B")
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
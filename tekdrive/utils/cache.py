@@ -0,0 +1,90 @@
+"""Small in-memory caches shared by a client's threads."""
+import threading
+from collections import OrderedDict
+from time import monotonic
+from typing import Any, Hashable, Optional
+
+_MISSING = object()
+
+
+class LRUCache:
+    """
+    Thread-safe mapping that holds at most ``maxsize`` items, evicting the least
+    recently used item first. With a ``ttl``, items also expire that many
+    seconds after they were stored, and expired items are dropped whenever an
+    item is stored.
+    """
+
+    def __init__(self, maxsize: int, ttl: Optional[float] = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        # key -> (expiry time or None, value)
+        self._items = OrderedDict()
+        # key -> expiry time, in the order items were stored
+        self._expiries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._items)
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        with self._lock:
+            try:
+                self._items.move_to_end(key)
+            except KeyError:
+                return default
+            expires, value = self._items[key]
+            if expires is not None and expires <= monotonic():
+                del self._items[key]
+                del self._expiries[key]
+                return default
+            return value
+
+    def _purge_expired(self, now: float):
+        # with a single ttl, items stored earlier expire earlier
+        while self._expiries:
+            key, expires = next(iter(self._expiries.items()))
+            if expires > now:
+                return
+            del self._expiries[key]
+            del self._items[key]
+
+    def put(self, key: Hashable, value: Any):
+        expires = None
+        with self._lock:
+            if self.ttl is not None:
+                now = monotonic()
+                self._purge_expired(now)
+                expires = now + self.ttl
+                self._expiries.pop(key, None)
+                self._expiries[key] = expires
+            self._items[key] = (expires, value)
+            self._items.move_to_end(key)
+            while len(self._items) > self.maxsize:
+                evicted, _ = self._items.popitem(last=False)
+                self._expiries.pop(evicted, None)
+
+    def pop(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        with self._lock:
+            if key not in self._items:
+                return default
+            self._expiries.pop(key, None)
+            return self._items.pop(key)[1]
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self._expiries.clear()
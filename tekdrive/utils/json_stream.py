@@ -0,0 +1,178 @@
+"""Incremental parsing of large JSON responses."""
+import codecs
+import json
+import re
+from typing import Any, Dict, Iterable, Iterator, Tuple
+
+WHITESPACE_RE = re.compile(r"[ \t\n\r]*")
+
+# objects up to this many characters are decoded in one go
+SMALL_OBJECT_SIZE = 16 * 1024
+
+
+class JSONStream:
+    """
+    Pull parser over JSON text that arrives in chunks.
+
+    Containers are walked with :meth:`iter_object` and :meth:`iter_array`; any
+    other value is decoded at once with :meth:`value`. Only the unread part of
+    the input is buffered.
+    """
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._decoder = json.JSONDecoder()
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def _error(self, message: str) -> json.JSONDecodeError:
+        return json.JSONDecodeError(message, self._buffer, self._pos)
+
+    def _fill(self) -> bool:
+        """Append the next chunk to the buffer. Return ``False`` at end of input."""
+        while not self._eof:
+            try:
+                text = self._text_decoder.decode(next(self._chunks))
+            except StopIteration:
+                self._eof = True
+                text = self._text_decoder.decode(b"", final=True)
+            if text:
+                self._buffer = self._buffer[self._pos :] + text
+                self._pos = 0
+                return True
+        return False
+
+    def _ensure(self, size: int):
+        while len(self._buffer) - self._pos < size and self._fill():
+            pass
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character, or ``""`` at end of input."""
+        while True:
+            self._pos = WHITESPACE_RE.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                return ""
+
+    def _expect(self, char: str):
+        if self.peek() != char:
+            raise self._error(f"Expecting {char!r}")
+        self._pos += 1
+
+    def value(self) -> Any:
+        """Decode the next complete value."""
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            if end == len(self._buffer) and self._fill():
+                # a number could continue in the next chunk
+                continue
+            self._pos = end
+            return value
+
+    def small_value(self, size: int = SMALL_OBJECT_SIZE) -> Tuple[bool, Any]:
+        """
+        Decode the next value if it fits within ``size`` characters.
+
+        Returns a ``(decoded, value)`` tuple. Nothing is consumed if the value is
+        larger than ``size``.
+        """
+        if self.peek() not in "{[":
+            return True, self.value()
+        self._ensure(size)
+        window = self._buffer[self._pos : self._pos + size]
+        try:
+            value, end = self._decoder.raw_decode(window)
+        except json.JSONDecodeError:
+            return False, None
+        self._pos += end
+        return True, value
+
+    def iter_object(self) -> Iterator[str]:
+        """
+        Walk an object, yielding its keys. The value of each key must be consumed
+        before advancing.
+        """
+        self._expect("{")
+        if self.peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            key = self.value()
+            if not isinstance(key, str):
+                raise self._error("Expecting property name")
+            self._expect(":")
+            yield key
+
+            char = self.peek()
+            self._pos += 1
+            if char == "}":
+                return
+            if char != ",":
+                raise self._error("Expecting ',' delimiter")
+
+    def iter_array(self) -> Iterator[None]:
+        """
+        Walk an array, yielding once per element. Each element must be consumed
+        before advancing.
+        """
+        self._expect("[")
+        if self.peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            yield
+
+            char = self.peek()
+            self._pos += 1
+            if char == "]":
+                return
+            if char != ",":
+                raise self._error("Expecting ',' delimiter")
+
+
+def _flatten(node: Dict[str, Any], key: str) -> Iterator[Dict[str, Any]]:
+    for child in node.pop(key, None) or []:
+        yield from _flatten(child, key)
+    yield node
+
+
+def iter_nested(stream: JSONStream, key: str = "children") -> Iterator[Dict[str, Any]]:
+    """
+    Yield every object of a nested structure where child objects are listed
+    under ``key``. Children are yielded before their parent and without ``key``.
+    """
+    decoded, node = stream.small_value()
+    if decoded:
+        yield from _flatten(node, key)
+        return
+
+    node = {}
+    for name in stream.iter_object():
+        if name == key:
+            for _ in stream.iter_array():
+                yield from iter_nested(stream, key)
+        else:
+            node[name] = stream.value()
+    yield node
+
+
+def iter_list(stream: JSONStream, other: Dict[str, Any]) -> Iterator[Any]:
+    """
+    Yield the items of every array in a top level object, such as a paginated
+    list response. The remaining keys, such as ``meta``, are stored in ``other``.
+    """
+    for name in stream.iter_object():
+        if stream.peek() == "[":
+            for _ in stream.iter_array():
+                yield stream.value()
+        else:
+            other[name] = stream.value()
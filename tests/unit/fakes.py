@@ -0,0 +1,508 @@
+"""In-process stand-ins for the TekDrive API used by unit tests."""
+import hashlib
+import io
+import itertools
+import json
+import re
+import threading
+from urllib.parse import urlparse
+
+from requests import Response
+from requests.exceptions import ChunkedEncodingError
+from requests.structures import CaseInsensitiveDict
+
+
+def make_response(status_code=200, body=None, headers=None, url="https://fake"):
+    """Build a real ``requests.Response`` without touching the network."""
+    response = Response()
+    response.status_code = status_code
+    response.url = url
+    response.reason = "FAKE"
+    response.headers = CaseInsensitiveDict(headers or {})
+    if body is None:
+        content = b""
+    elif isinstance(body, (bytes, bytearray)):
+        content = bytes(body)
+    else:
+        content = json.dumps(body).encode("utf-8")
+        response.headers.setdefault("Content-Type", "application/json")
+    response._content = content
+    response._content_consumed = True
+    return response
+
+
+def make_stream_response(status_code=200, body=b"", headers=None, url="https://fake"):
+    """Build a ``requests.Response`` whose body is read as it is iterated."""
+    response = make_response(status_code, None, headers, url=url)
+    response.raw = io.BytesIO(body)
+    response._content = False
+    response._content_consumed = False
+    return response
+
+
+class CutBody(io.BytesIO):
+    """A response body that breaks off after ``after`` bytes, like a lost connection."""
+
+    def __init__(self, body, after):
+        super().__init__(body[:after])
+
+    def read(self, size=-1):
+        data = super().read(size)
+        if not data:
+            raise ChunkedEncodingError("Connection broken")
+        return data
+
+
+class FakeAPI:
+    """
+    Replaces the ``requests.Session`` used by the TekDrive client.
+
+    Handlers are registered per ``(method, path)`` and are called with the
+    request's ``params``, ``json`` and ``headers``. They return either a JSON
+    serializable body or a ``(status_code, body, headers)`` tuple. Paths may
+    contain ``{name}`` placeholders, which are passed to the handler as keyword
+    arguments.
+    """
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.calls = []
+        self.headers = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._routes = {}
+        self._patterns = []
+        self._lock = threading.Lock()
+
+    def route(self, method, path, handler):
+        if "{" in path:
+            pattern = re.sub(r"{(\w+)}", r"(?P<\1>[^/]+)", path)
+            self._patterns.append((method, re.compile(f"^{pattern}$"), handler))
+        else:
+            self._routes[(method, path)] = handler
+
+    def _match(self, method, path):
+        handler = self._routes.get((method, path))
+        if handler is not None:
+            return handler, {}
+        for route_method, pattern, handler in self._patterns:
+            match = pattern.match(path)
+            if route_method == method and match:
+                return handler, match.groupdict()
+        return None, {}
+
+    def close(self):
+        pass
+
+    def request(self, method, url, *, params=None, json=None, headers=None, **kwargs):
+        path = urlparse(url).path
+        with self._lock:
+            self.calls.append((method, path, dict(params or {})))
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if self.latency:
+                threading.Event().wait(self.latency)
+
+            handler, path_params = self._match(method, path)
+            if handler is None:
+                return make_response(
+                    404, {"message": f"No route for {method} {path}"}, url=url
+                )
+
+            result = handler(
+                params=params or {},
+                json=json,
+                headers=dict(headers or {}),
+                **path_params,
+            )
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+        if isinstance(result, tuple):
+            status_code, body, response_headers = result
+        else:
+            status_code, body, response_headers = 200, result, None
+        return make_response(status_code, body, response_headers, url=url)
+
+
+def paginated_handler(items, list_attribute="results", max_limit=None):
+    """Return a handler serving ``items`` with the API's page/limit semantics."""
+
+    def handler(params, **_kwargs):
+        limit = int(params.get("limit", 100))
+        if max_limit is not None:
+            limit = min(limit, max_limit)
+        page = int(params.get("page", 1))
+        offset = (page - 1) * limit
+        return {
+            list_attribute: items[offset : offset + limit],
+            "meta": {"page": page, "limit": limit, "offset": offset},
+        }
+
+    return handler
+
+
+def make_files(count, parent_folder_id="fol_root"):
+    return [
+        {
+            "id": f"file_{idx}",
+            "name": f"file_{idx}.wfm",
+            "type": "FILE",
+            "fileType": "WFM",
+            "bytes": str(idx),
+            "parentFolderId": parent_folder_id,
+        }
+        for idx in range(count)
+    ]
+
+
+class FakeDrive:
+    """A folder hierarchy served through the ``/tree`` endpoint of a FakeAPI."""
+
+    def __init__(self, api=None, root_id="fol_root"):
+        self.api = api
+        self.root_id = root_id
+        self.nodes = {}
+        # (params, status code, headers) of every tree request
+        self.tree_requests = []
+        self._lock = threading.Lock()
+        self.add_folder(root_id, None, "My Files", folder_type="PERSONAL")
+        if api is not None:
+            api.route("GET", "/tree", self.tree)
+            api.route("POST", "/folder", self.create_folder)
+            api.route("POST", "/file", self.create_file)
+
+    def _route_details(self, id, path):
+        """Serve ``GET``, ``PUT`` and ``DELETE`` of a node's details endpoint."""
+        if self.api is None:
+            return
+
+        def get(**_kwargs):
+            if id not in self.nodes:
+                return 404, {"errorCode": "FOLDER_NOT_FOUND"}, None
+            return self.nodes[id]
+
+        def put(json, **_kwargs):
+            self.nodes[id].update(json)
+            return 204, None, None
+
+        def delete(**_kwargs):
+            for child in self.children_of(id):
+                delete_child = self.api._routes[
+                    ("DELETE", f"/{child['type'].lower()}/{child['id']}")
+                ]
+                delete_child()
+            del self.nodes[id]
+            return 204, None, None
+
+        self.api.route("GET", path, get)
+        self.api.route("PUT", path, put)
+        self.api.route("DELETE", path, delete)
+
+    def add_folder(self, id, parent_id, name, folder_type="STANDARD", **fields):
+        self.nodes[id] = dict(
+            id=id,
+            name=name,
+            type="FOLDER",
+            folderType=folder_type,
+            parentFolderId=parent_id,
+            **fields,
+        )
+        self._route_details(id, f"/{self.nodes[id]['type'].lower()}/{id}")
+        return self.nodes[id]
+
+    def add_file(self, id, parent_id, name, bytes=0, file_type="WFM", **fields):
+        self.nodes[id] = dict(
+            id=id,
+            name=name,
+            type="FILE",
+            fileType=file_type,
+            bytes=str(bytes),
+            parentFolderId=parent_id,
+            **fields,
+        )
+        self._route_details(id, f"/{self.nodes[id]['type'].lower()}/{id}")
+        return self.nodes[id]
+
+    def create_folder(self, json, **_kwargs):
+        parent_id = json.get("parentFolderId") or self.root_id
+        with self._lock:
+            return self.add_folder(f"new_{len(self.nodes)}", parent_id, json["name"])
+
+    def create_file(self, json, **_kwargs):
+        parent_id = json.get("parentFolderId") or self.root_id
+        with self._lock:
+            node = self.add_file(f"new_{len(self.nodes)}", parent_id, json["name"])
+        return {"file": node, "uploadUrl": f"https://storage.fake/{node['id']}"}
+
+    def children_of(self, id):
+        return [node for node in self.nodes.values() if node["parentFolderId"] == id]
+
+    def subtree(self, id, depth, folders_only=False):
+        node = dict(self.nodes[id])
+        if node["type"] == "FOLDER" and depth > 0:
+            node["children"] = [
+                self.subtree(child["id"], depth - 1, folders_only)
+                for child in self.children_of(id)
+                if not (folders_only and child["type"] == "FILE")
+            ]
+        return node
+
+    def tree(self, params, headers, **_kwargs):
+        folder_id = params.get("folderId") or self.root_id
+        if folder_id not in self.nodes:
+            return 404, {"errorCode": "FOLDER_NOT_FOUND"}, None
+        depth = int(params.get("depth") or 1)
+        folders_only = str(params.get("foldersOnly")).lower() == "true"
+        body = {"tree": self.subtree(folder_id, depth, folders_only)}
+        etag = (
+            '"%s"' % hashlib.md5(json.dumps(body, sort_keys=True).encode()).hexdigest()
+        )
+        status_code = 304 if headers.get("If-None-Match") == etag else 200
+        self.tree_requests.append((params, status_code, headers))
+        return status_code, None if status_code == 304 else body, {"ETag": etag}
+
+    def build(
+        self, levels, folders_per_folder, files_per_folder, parent_id=None, prefix="f"
+    ):
+        """Add a uniform hierarchy below ``parent_id`` (the root by default)."""
+        parent_id = parent_id or self.root_id
+        for idx in range(files_per_folder):
+            self.add_file(
+                f"{prefix}{idx}.wfm", parent_id, f"{prefix}{idx}.wfm", bytes=idx + 1
+            )
+        if levels == 0:
+            return
+        for idx in range(folders_per_folder):
+            folder_id = f"{prefix}{idx}"
+            self.add_folder(folder_id, parent_id, folder_id)
+            self.build(
+                levels - 1,
+                folders_per_folder,
+                files_per_folder,
+                folder_id,
+                f"{folder_id}_",
+            )
+
+
+def iter_body(data, chunk_size=64 * 1024):
+    """Yield a request body given as bytes, a buffer, a readable or an iterable."""
+    if data is None:
+        return
+    if hasattr(data, "read"):
+        while True:
+            chunk = data.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+    elif isinstance(data, (bytes, bytearray, memoryview)):
+        yield data
+    else:
+        yield from data
+
+
+class FakeStorage:
+    """
+    Replaces the ``requests.Session`` used for presigned storage URLs.
+
+    Objects are kept in memory by URL path, and every stored object gets the
+    md5 of its contents as its ``ETag``. ``latency`` is added to every request
+    and ``bandwidth`` (bytes/s) limits each transfer, which makes throughput
+    comparable between sequential and concurrent transfers. With
+    ``store=False`` uploads are only hashed, not kept, so memory benchmarks
+    measure the client alone. ``GET`` requests honor a single ``Range`` header
+    unless ``ranges=False``.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        bandwidth: float = None,
+        store: bool = True,
+        ranges: bool = True,
+    ):
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self.store = store
+        self.ranges = ranges
+        # Range header of every GET request, None for whole objects
+        self.range_requests = []
+        self.objects = {}
+        # path -> ETag of every uploaded object
+        self.etags = {}
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        # [predicate(method, path), status code, remaining times]
+        self._failures = []
+        # [predicate(method, path), bytes sent before the cut, remaining times]
+        self._cuts = []
+        self._lock = threading.Lock()
+
+    def close(self):
+        pass
+
+    def fail(self, predicate, status_code=500, times=1):
+        """Fail the next ``times`` requests matching ``predicate(method, path)``."""
+        self._failures.append([predicate, status_code, times])
+
+    def cut(self, predicate, after, times=1):
+        """Cut the next ``times`` downloads matching ``predicate`` after ``after``."""
+        self._cuts.append([predicate, after, times])
+
+    def _injected(self, injected, method, path):
+        with self._lock:
+            for injection in injected:
+                predicate, value, remaining = injection
+                if remaining and predicate(method, path):
+                    injection[2] -= 1
+                    return value
+        return None
+
+    def _get(self, path, headers, stream, url):
+        if path not in self.objects:
+            return make_response(404, b"", url=url)
+        body = self.objects[path]
+        size = len(body)
+        status_code = 200
+        response_headers = {"Accept-Ranges": "bytes"} if self.ranges else {}
+        range_header = (headers or {}).get("Range")
+        with self._lock:
+            self.range_requests.append(range_header)
+        if range_header and self.ranges:
+            start, _, end = range_header.replace("bytes=", "").partition("-")
+            start, end = int(start), min(int(end) if end else size - 1, size - 1)
+            if start >= size:
+                return make_response(
+                    416, b"", {"Content-Range": f"bytes */{size}"}, url=url
+                )
+            body = body[start : end + 1]
+            status_code = 206
+            response_headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+        response_headers["Content-Length"] = str(len(body))
+        self._transfer(len(body))
+
+        response = make_stream_response(status_code, body, response_headers, url=url)
+        after = self._injected(self._cuts, "GET", path)
+        if after is not None:
+            response.raw = CutBody(body, after)
+        if not stream:
+            # read the whole body, like requests does
+            response.content
+        return response
+
+    def _transfer(self, size):
+        seconds = self.latency
+        if self.bandwidth:
+            seconds += size / self.bandwidth
+        if seconds:
+            threading.Event().wait(seconds)
+
+    def request(self, method, url, *, data=None, headers=None, stream=False, **kwargs):
+        path = urlparse(url).path
+        with self._lock:
+            self.calls.append((method, path))
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            status_code = self._injected(self._failures, method, path)
+            if status_code is not None:
+                self._transfer(0)
+                return make_response(status_code, b"", url=url)
+
+            if method == "PUT":
+                digest = hashlib.md5()
+                chunks = [] if self.store else None
+                size = 0
+                for chunk in iter_body(data):
+                    digest.update(chunk)
+                    size += len(chunk)
+                    if chunks is not None:
+                        chunks.append(bytes(chunk))
+                self._transfer(size)
+                etag = '"%s"' % digest.hexdigest()
+                with self._lock:
+                    self.etags[path] = etag
+                    if chunks is not None:
+                        self.objects[path] = b"".join(chunks)
+                return make_response(200, None, {"ETag": etag}, url=url)
+
+            if method == "GET":
+                return self._get(path, headers, stream, url)
+
+            return make_response(405, b"", url=url)
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+class FakeTransfers:
+    """Upload, download and multipart upload endpoints backed by a FakeStorage."""
+
+    def __init__(self, api, storage, base_url="https://storage.fake"):
+        self.api = api
+        self.storage = storage
+        self.base_url = base_url
+        # upload id -> file id
+        self.uploads = {}
+        self.completed = []
+        self.aborted = []
+        self._upload_ids = itertools.count(1)
+        api.route("GET", "/file/{file_id}/uploadUrl", self.upload_url)
+        api.route("GET", "/file/{file_id}/contents", self.download_url)
+        api.route(
+            "GET",
+            "/file/{file_id}/artifacts/{artifact_id}/contents",
+            self.artifact_download_url,
+        )
+        api.route("POST", "/file/{file_id}/uploads", self.create_upload)
+        api.route(
+            "GET",
+            "/file/{file_id}/uploads/{upload_id}/parts/{part_number}",
+            self.part_url,
+        )
+        api.route("POST", "/file/{file_id}/uploads/{upload_id}", self.complete_upload)
+        api.route("DELETE", "/file/{file_id}/uploads/{upload_id}", self.abort_upload)
+
+    def contents(self, file_id):
+        return self.storage.objects.get(f"/{file_id}")
+
+    def upload_url(self, file_id, **_kwargs):
+        return {"uploadUrl": f"{self.base_url}/{file_id}"}
+
+    def download_url(self, file_id, **_kwargs):
+        return {"downloadUrl": f"{self.base_url}/{file_id}"}
+
+    def artifact_download_url(self, artifact_id, **_kwargs):
+        return {"downloadUrl": f"{self.base_url}/artifacts/{artifact_id}"}
+
+    def create_upload(self, file_id, **_kwargs):
+        upload_id = f"upload_{next(self._upload_ids)}"
+        self.uploads[upload_id] = file_id
+        return {"uploadId": upload_id}
+
+    def part_url(self, upload_id, part_number, **_kwargs):
+        if upload_id not in self.uploads:
+            return 404, {"errorCode": "UPLOAD_NOT_FOUND"}, None
+        return {"uploadUrl": f"{self.base_url}/uploads/{upload_id}/{part_number}"}
+
+    def complete_upload(self, file_id, upload_id, json, **_kwargs):
+        if self.uploads.get(upload_id) != file_id:
+            return 404, {"errorCode": "UPLOAD_NOT_FOUND"}, None
+        paths = [f"/uploads/{upload_id}/{part['partNumber']}" for part in json["parts"]]
+        for path, part in zip(paths, json["parts"]):
+            if self.storage.etags.get(path) != part["etag"]:
+                return 400, {"errorCode": "INVALID_PART"}, None
+        if self.storage.store:
+            self.storage.objects[f"/{file_id}"] = b"".join(
+                self.storage.objects[path] for path in paths
+            )
+        del self.uploads[upload_id]
+        self.completed.append(upload_id)
+        return 204, None, None
+
+    def abort_upload(self, upload_id, **_kwargs):
+        self.uploads.pop(upload_id, None)
+        self.aborted.append(upload_id)
+        return 204, None, None
@@ -1,10 +1,19 @@
+import array
+import io
+import mmap
+import os
 import pickle
+import threading
 
 import pytest
-from tekdrive.exceptions import ClientException
-from tekdrive.models import File
+import requests
+from tekdrive.exceptions import ClientException, TekDriveStorageException
+from tekdrive.models import Artifact, File
+from tekdrive.settings import DOWNLOAD_PART_SIZE
+from tekdrive.transfer.ranged import split_ranges
 
 from ...base import UnitTest
+from ...fakes import FakeAPI, FakeStorage, FakeTransfers
 
 
 class TestFileModel(UnitTest):
@@ -79,3 +88,451 @@ class TestFileModel(UnitTest):
         with pytest.raises(ClientException) as e:
             file.add_member()
         assert str(e.value) == "Must supply `username` or `user_id`."
+
+
+class TransferTest(UnitTest):
+    def setup(self):
+        super().setup()
+        self.api = FakeAPI()
+        self.tekdrive._session._request_wrapper._http = self.api
+        self.storage = FakeStorage()
+        self.tekdrive._storage._http = self.storage
+        self.transfers = FakeTransfers(self.api, self.storage)
+        self.file = File(self.tekdrive, _data=dict(id="file1", name="capture.wfm"))
+
+
+class TestFileUpload(TransferTest):
+    def test_upload(self):
+        self.file.upload(io.BytesIO(b"abc"))
+        assert self.transfers.contents("file1") == b"abc"
+        assert self.transfers.completed == []
+        assert not any("/uploads" in call[1] for call in self.api.calls)
+
+
+class TestFileStreamingUpload(TransferTest):
+    def _pipe(self, contents, chunk_size=1000):
+        read_fd, write_fd = os.pipe()
+
+        def produce():
+            with os.fdopen(write_fd, "wb") as writer:
+                for offset in range(0, len(contents), chunk_size):
+                    writer.write(contents[offset : offset + chunk_size])
+
+        thread = threading.Thread(target=produce)
+        thread.start()
+        return os.fdopen(read_fd, "rb", buffering=0), thread
+
+    def _encode_bodies(self, monkeypatch):
+        request = self.storage.request
+
+        def encoded_request(method, url, *, data=None, headers=None, **kwargs):
+            # encode the body the way requests does before sending it
+            prepared = requests.Request(
+                method, url, data=data, headers=headers
+            ).prepare()
+            return request(method, url, data=prepared.body, headers=headers, **kwargs)
+
+        monkeypatch.setattr(self.storage, "request", encoded_request)
+
+    def test_upload_generator(self, monkeypatch):
+        self._encode_bodies(monkeypatch)
+        self.file.upload(chunk for chunk in [b"abc", b"", b"def"])
+        assert self.transfers.contents("file1") == b"abcdef"
+
+    @pytest.mark.parametrize("chunks", [[b"abc", b"", b"def"], (b"abc", b"def")])
+    def test_upload_chunk_sequence(self, chunks, monkeypatch):
+        self._encode_bodies(monkeypatch)
+        self.file.upload(chunks)
+        assert self.transfers.contents("file1") == b"abcdef"
+
+    def test_upload_pipe(self):
+        contents = os.urandom(100_000)
+        reader, thread = self._pipe(contents)
+        with reader:
+            self.file.upload(reader)
+        thread.join()
+        assert self.transfers.contents("file1") == contents
+
+
+class TestFileBufferUpload(TransferTest):
+    def _record_bodies(self, monkeypatch):
+        bodies = []
+        request = self.storage.request
+
+        def record(method, url, *, data=None, **kwargs):
+            bodies.append(data)
+            return request(method, url, data=data, **kwargs)
+
+        monkeypatch.setattr(self.storage, "request", record)
+        return bodies
+
+    @pytest.mark.parametrize("make_buffer", [bytes, bytearray, memoryview])
+    def test_upload_buffer(self, make_buffer):
+        self.file.upload(make_buffer(b"abcdef"))
+        assert self.transfers.contents("file1") == b"abcdef"
+
+    def test_upload_typed_buffer(self):
+        samples = array.array("d", [0.5, -1.25, 3.0])
+        self.file.upload(samples)
+        assert self.transfers.contents("file1") == samples.tobytes()
+
+    def test_upload_strided_buffer(self):
+        self.file.upload(memoryview(b"a-b-c-")[::2])
+        assert self.transfers.contents("file1") == b"abc"
+
+    def test_upload_path_is_memory_mapped(self, tmp_path, monkeypatch):
+        bodies = self._record_bodies(monkeypatch)
+        path = tmp_path / "capture.wfm"
+        path.write_bytes(b"x" * 5000)
+        self.file.upload(str(path))
+        assert self.transfers.contents("file1") == b"x" * 5000
+        assert len(bodies) == 1
+        assert all(
+            isinstance(body, memoryview) and isinstance(body.obj, mmap.mmap)
+            for body in bodies
+        )
+
+    def test_upload_empty_path(self, tmp_path):
+        path = tmp_path / "empty.wfm"
+        path.write_bytes(b"")
+        self.file.upload(str(path))
+        assert self.transfers.contents("file1") == b""
+
+
+class TestFileDownload(TransferTest):
+    def setup(self):
+        super().setup()
+        self.contents = os.urandom(10_000)
+        self.storage.objects["/file1"] = self.contents
+
+    def test_download_contents(self):
+        assert self.file.download() == self.contents
+
+    def test_download_writable_in_chunks(self):
+        writes = []
+
+        class Writable:
+            def write(self, data):
+                writes.append(len(data))
+
+        self.file.download(Writable(), chunk_size=4096)
+        assert writes == [4096, 4096, 10_000 - 2 * 4096]
+
+    def test_download_path(self, tmp_path):
+        path = tmp_path / "capture.wfm"
+        path.write_bytes(b"old")
+        os.chmod(path, 0o644)
+        self.file.download(str(path))
+        assert path.read_bytes() == self.contents
+        assert os.stat(path).st_mode & 0o777 == 0o644
+        assert os.listdir(tmp_path) == ["capture.wfm"]
+
+    def test_download_path_failure_keeps_original(self, tmp_path):
+        path = tmp_path / "capture.wfm"
+        path.write_bytes(b"old")
+        self.storage.fail(lambda method, path: True, status_code=500)
+        with pytest.raises(TekDriveStorageException):
+            self.file.download(str(path))
+        assert path.read_bytes() == b"old"
+        assert os.listdir(tmp_path) == ["capture.wfm"]
+
+    def test_download_missing_path(self, tmp_path):
+        missing = str(tmp_path / "missing.wfm")
+        with pytest.raises(ClientException) as e:
+            self.file.download(missing)
+        assert str(e.value) == f"File '{missing}' does not exist."
+
+    def test_download_artifact(self, tmp_path):
+        self.storage.objects["/artifacts/art1"] = b"settings"
+        artifact = Artifact(self.tekdrive, dict(id="art1", file_id="file1"))
+        path = tmp_path / "settings.set"
+        path.write_bytes(b"")
+        artifact.download(str(path))
+        assert path.read_bytes() == b"settings"
+
+
+class TestFileParallelDownload(TransferTest):
+    def setup(self):
+        super().setup()
+        self.contents = os.urandom(50_000)
+        self.storage.objects["/file1"] = self.contents
+
+    def _download(self, tmp_path, **kwargs):
+        path = tmp_path / "capture.wfm"
+        path.write_bytes(b"")
+        self.file.download(str(path), parallel=4, **kwargs)
+        return path
+
+    def test_parallel_download(self, tmp_path):
+        self.contents = os.urandom(3 * DOWNLOAD_PART_SIZE + 1000)
+        self.storage.objects["/file1"] = self.contents
+        self.storage.latency = 0.01
+        path = self._download(tmp_path)
+        assert path.read_bytes() == self.contents
+        assert self.storage.range_requests[0] == "bytes=0-0"
+        assert sorted(self.storage.range_requests[1:]) == sorted(
+            f"bytes={start}-{end}"
+            for start, end in split_ranges(len(self.contents), DOWNLOAD_PART_SIZE)
+        )
+        assert self.storage.max_in_flight > 1
+
+    def test_parallel_download_without_range_support(self, tmp_path):
+        self.storage.ranges = False
+        path = self._download(tmp_path)
+        assert path.read_bytes() == self.contents
+        assert self.storage.range_requests == ["bytes=0-0", None]
+
+    def test_parallel_download_empty(self, tmp_path):
+        self.storage.objects["/file1"] = b""
+        path = self._download(tmp_path)
+        assert path.read_bytes() == b""
+
+    def test_parallel_download_retries_range(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("tekdrive.transfer.storage.sleep", lambda seconds: None)
+        self.storage.fail(
+            lambda method, path: method == "GET", status_code=503, times=3
+        )
+        path = self._download(tmp_path)
+        assert path.read_bytes() == self.contents
+
+    def test_parallel_download_continues_cut_range(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("tekdrive.transfer.storage.sleep", lambda seconds: None)
+        self.storage.objects["/file1"] = self.contents[:8192]
+        self.storage.cut(lambda method, path: True, after=1000, times=2)
+        path = self._download(tmp_path)
+        assert path.read_bytes() == self.contents[:8192]
+        assert self.storage.range_requests == [
+            "bytes=0-0",
+            "bytes=0-8191",
+            "bytes=1000-8191",
+        ]
+
+    def test_parallel_download_refreshes_expired_url(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("tekdrive.transfer.storage.sleep", pytest.fail)
+        self.storage.fail(lambda method, path: method == "GET", status_code=403)
+        path = self._download(tmp_path)
+        assert path.read_bytes() == self.contents
+        assert (
+            sum(1 for call in self.api.calls if call[1] == "/file/file1/contents") == 2
+        )
+
+    def test_parallel_download_failure_keeps_original(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("tekdrive.transfer.storage.sleep", lambda seconds: None)
+        path = tmp_path / "capture.wfm"
+        path.write_bytes(b"old")
+        self.storage.fail(
+            lambda method, path: method == "GET", status_code=500, times=100
+        )
+        with pytest.raises(TekDriveStorageException):
+            self.file.download(str(path), parallel=4)
+        assert path.read_bytes() == b"old"
+        assert os.listdir(tmp_path) == ["capture.wfm"]
+
+
+class TestFileResumableDownload(TransferTest):
+    def setup(self):
+        super().setup()
+        self.contents = os.urandom(10_000)
+        self.storage.objects["/file1"] = self.contents
+        self.file = File(
+            self.tekdrive,
+            _data=dict(
+                id="file1", bytes="10000", updated_at="2026-10-19T10:00:00.000Z"
+            ),
+        )
+
+    def _interrupted_download(self, path, monkeypatch):
+        def interrupt(seconds):
+            raise KeyboardInterrupt
+
+        # the probe and the first range request are cut, then the process is
+        # interrupted while waiting to retry
+        monkeypatch.setattr("tekdrive.transfer.storage.sleep", interrupt)
+        self.storage.cut(lambda method, path: True, after=4000, times=2)
+        with pytest.raises(KeyboardInterrupt):
+            self.file.download(str(path), resume=True, chunk_size=1000)
+        self.storage.range_requests.clear()
+
+    def _path(self, tmp_path):
+        path = tmp_path / "capture.wfm"
+        path.write_bytes(b"old")
+        return path
+
+    def test_resume_continues_partial_file(self, tmp_path, monkeypatch):
+        path = self._path(tmp_path)
+        self._interrupted_download(path, monkeypatch)
+        assert path.read_bytes() == b"old"
+        partial = tmp_path / "capture.wfm.tekdrive-part"
+        assert partial.read_bytes() == self.contents[:4000]
+
+        self.file.download(str(path), resume=True)
+        assert path.read_bytes() == self.contents
+        assert self.storage.range_requests == ["bytes=0-0", "bytes=4000-9999"]
+        assert os.listdir(tmp_path) == ["capture.wfm"]
+
+    def test_resume_changed_contents_starts_over(self, tmp_path, monkeypatch):
+        path = self._path(tmp_path)
+        self._interrupted_download(path, monkeypatch)
+        self.contents = os.urandom(10_000)
+        self.storage.objects["/file1"] = self.contents
+        self.file.updated_at = "2026-10-19T11:00:00.000Z"
+        self.file.download(str(path), resume=True)
+        assert path.read_bytes() == self.contents
+        assert self.storage.range_requests == ["bytes=0-0", "bytes=0-9999"]
+
+    def test_resume_without_range_support(self, tmp_path, monkeypatch):
+        path = self._path(tmp_path)
+        self._interrupted_download(path, monkeypatch)
+        self.storage.ranges = False
+        self.file.download(str(path), resume=True)
+        assert path.read_bytes() == self.contents
+        assert os.listdir(tmp_path) == ["capture.wfm"]
+
+    def test_resume_refreshes_expired_url(self, tmp_path, monkeypatch):
+        path = self._path(tmp_path)
+        self._interrupted_download(path, monkeypatch)
+        monkeypatch.setattr("tekdrive.transfer.storage.sleep", pytest.fail)
+        self.storage.fail(
+            lambda method, path: method == "GET", status_code=403, times=2
+        )
+        self.api.calls.clear()
+        self.file.download(str(path), resume=True)
+        assert path.read_bytes() == self.contents
+        assert (
+            sum(1 for call in self.api.calls if call[1] == "/file/file1/contents") == 3
+        )
+
+    def test_resume_with_parallel(self, tmp_path):
+        with pytest.raises(ClientException) as e:
+            self.file.download(str(self._path(tmp_path)), resume=True, parallel=4)
+        assert str(e.value) == "Only supply one of: 'resume', 'parallel'."
+
+    def test_resume_writable(self):
+        with pytest.raises(ClientException) as e:
+            self.file.download(io.BytesIO(), resume=True)
+        assert str(e.value) == "Resuming a download requires a file path."
+
+
+class TestFileOpen(TransferTest):
+    def setup(self):
+        super().setup()
+        self.contents = os.urandom(10_000)
+        self.storage.objects["/file1"] = self.contents
+
+    def test_open_reads_header_only(self):
+        with self.file.open(block_size=1000) as f:
+            assert f.read(100) == self.contents[:100]
+            assert f.tell() == 100
+        assert self.storage.range_requests == ["bytes=0-999"]
+        assert f.closed
+
+    def test_open_seek_and_read(self):
+        with self.file.open(block_size=1000, read_ahead=0) as f:
+            assert f.seekable() and f.readable() and not f.writable()
+            assert f.seek(-500, io.SEEK_END) == 9500
+            assert f.read(1000) == self.contents[9500:]
+            assert f.read(10) == b""
+            f.seek(2500)
+            assert f.read(1000) == self.contents[2500:3500]
+            f.seek(-100, io.SEEK_CUR)
+            assert f.read(100) == self.contents[3400:3500]
+        assert self.storage.range_requests == [
+            "bytes=0-999",
+            "bytes=9000-9999",
+            "bytes=2000-2999",
+            "bytes=3000-3999",
+        ]
+
+    def test_open_caches_blocks(self):
+        with self.file.open(block_size=1000, cache_blocks=2, read_ahead=0) as f:
+            for _ in range(3):
+                f.seek(5000)
+                assert f.read(10) == self.contents[5000:5010]
+                f.seek(10)
+                assert f.read(10) == self.contents[10:20]
+            # evicts block 5, the least recently used
+            f.seek(8000)
+            f.read(10)
+            f.seek(10)
+            f.read(10)
+            f.seek(5000)
+            f.read(10)
+        assert self.storage.range_requests == [
+            "bytes=0-999",
+            "bytes=5000-5999",
+            "bytes=8000-8999",
+            "bytes=5000-5999",
+        ]
+
+    def test_open_reads_ahead_sequentially(self):
+        with self.file.open(block_size=1000, read_ahead=3) as f:
+            assert f.read() == self.contents
+        assert self.storage.range_requests == [
+            "bytes=0-999",
+            "bytes=1000-2999",
+            "bytes=3000-6999",
+            "bytes=7000-9999",
+        ]
+
+    def test_open_read_ahead_resets_on_seek(self):
+        with self.file.open(block_size=1000, read_ahead=3) as f:
+            f.read(3000)
+            f.seek(6000)
+            f.read(1000)
+        assert self.storage.range_requests == [
+            "bytes=0-999",
+            "bytes=1000-2999",
+            "bytes=6000-6999",
+        ]
+
+    def test_open_buffered(self):
+        self.storage.objects["/file1"] = b"header\nrow 1\nrow 2\n"
+        with io.TextIOWrapper(io.BufferedReader(self.file.open(block_size=4))) as f:
+            assert f.readlines() == ["header\n", "row 1\n", "row 2\n"]
+
+    def test_open_empty(self):
+        self.storage.objects["/file1"] = b""
+        with self.file.open() as f:
+            assert f.read() == b""
+            assert f.seek(0, io.SEEK_END) == 0
+
+    def test_open_without_range_support(self):
+        self.storage.ranges = False
+        with self.file.open(block_size=1000) as f:
+            f.seek(4000)
+            assert f.read(100) == self.contents[4000:4100]
+            assert f.seek(0, io.SEEK_END) == 10_000
+        assert self.storage.range_requests == ["bytes=0-999"]
+
+    def test_open_retries_cut_block(self, monkeypatch):
+        monkeypatch.setattr("tekdrive.transfer.storage.sleep", lambda seconds: None)
+        with self.file.open(block_size=1000, read_ahead=0) as f:
+            self.storage.cut(lambda method, path: True, after=500)
+            f.seek(3000)
+            assert f.read(1000) == self.contents[3000:4000]
+        assert self.storage.range_requests[1:] == ["bytes=3000-3999", "bytes=3000-3999"]
+
+    def test_open_refreshes_expired_url(self, monkeypatch):
+        monkeypatch.setattr("tekdrive.transfer.storage.sleep", pytest.fail)
+        with self.file.open(block_size=1000) as f:
+            self.storage.fail(lambda method, path: method == "GET", status_code=403)
+            f.seek(5000)
+            assert f.read(10) == self.contents[5000:5010]
+        assert (
+            sum(1 for call in self.api.calls if call[1] == "/file/file1/contents") == 2
+        )
+
+    def test_open_closed(self):
+        f = self.file.open()
+        f.close()
+        with pytest.raises(ValueError):
+            f.read(1)
+        with pytest.raises(ValueError):
+            f.seek(0)
+
+    def test_open_artifact(self):
+        self.storage.objects["/artifacts/art1"] = b"settings"
+        artifact = Artifact(self.tekdrive, dict(id="art1", file_id="file1"))
+        with artifact.open() as f:
+            f.seek(4)
+            assert f.read() == b"ings"
@@ -1,10 +1,13 @@
+import os
 import pickle
 
 import pytest
 from tekdrive.models import Folder
-from tekdrive.exceptions import ClientException
+from tekdrive.exceptions import ClientException, TekDriveStorageException
 
 from ...base import UnitTest
+from ...fakes import FakeStorage, FakeTransfers
+from ..test_tree import FakeDriveTest
 
 
 class TestFolderModel(UnitTest):
@@ -79,3 +82,279 @@ class TestFolderModel(UnitTest):
         with pytest.raises(ClientException) as e:
             folder.add_member()
         assert str(e.value) == "Must supply `username` or `user_id`."
+
+
+class TestFolderChildren(FakeDriveTest):
+    def _tree_calls(self):
+        return [call for call in self.api.calls if call[1] == "/tree"]
+
+    def test_children_are_cached(self):
+        folder = self.tekdrive.folder("f0")
+        first = [child.id for child in folder.children()]
+        assert [child.id for child in folder.children()] == first
+        assert [child.id for child in self.tekdrive.folder("f0").children()] == first
+        assert len(self._tree_calls()) == 1
+
+    def test_children_reuse_tree_payload(self):
+        self.tekdrive.tree.get(depth=3)
+        assert len(self.tekdrive.folder("f1_2").children()) == 5
+        assert len(self._tree_calls()) == 1
+
+    def test_partial_tree_payloads_are_not_cached(self):
+        self.tekdrive.tree.get(depth=3, folders_only=True)
+        assert len(self.tekdrive.folder("f1_2").children()) == 5
+        assert len(self._tree_calls()) == 2
+
+    def test_children_cache_expires(self, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr("tekdrive.utils.cache.monotonic", lambda: now[0])
+        folder = self.tekdrive.folder("f0")
+        folder.children()
+        now[0] += 29
+        folder.children()
+        assert len(self._tree_calls()) == 1
+        now[0] += 2
+        folder.children()
+        assert len(self._tree_calls()) == 2
+
+    def test_create_invalidates(self):
+        folder = self.tekdrive.folder("f0")
+        count = len(folder.children())
+        self.tekdrive.folder.create("new", parent_folder_id="f0")
+        self.tekdrive.file.create(name="new.wfm", parent_folder_id="f0")
+        assert len(folder.children()) == count + 2
+
+    def test_move_invalidates_both_parents(self):
+        source, target = self.tekdrive.folder("f0"), self.tekdrive.folder("f1")
+        source_ids = [child.id for child in source.children()]
+        target.children()
+
+        moved = [child for child in source.children() if child.id == "f0_0.wfm"][0]
+        moved.move("f1")
+        assert "f0_0.wfm" not in [child.id for child in source.children()]
+        assert "f0_0.wfm" in [child.id for child in target.children()]
+        assert len(source.children()) == len(source_ids) - 1
+
+    def test_delete_invalidates(self):
+        parent = self.tekdrive.folder("f0")
+        parent.children()
+        folder = self.tekdrive.resolve("/f0/f0_1")
+        folder.children()
+        folder.delete()
+        assert "f0_1" not in [child.id for child in parent.children()]
+        assert self.tekdrive._children_cache.get("f0_1") is None
+
+    def test_iter_children_streams(self):
+        folder = self.tekdrive.folder("f2")
+        assert sorted(child.id for child in folder.iter_children()) == sorted(
+            node["id"] for node in self.drive.children_of("f2")
+        )
+
+    def test_iter_children_uses_cache(self):
+        folder = self.tekdrive.folder("f2")
+        expected = [child.id for child in folder.children()]
+        assert [child.id for child in folder.iter_children()] == expected
+        assert len(self._tree_calls()) == 1
+
+
+class TestFolderDiskUsage(FakeDriveTest):
+    def _expected(self, id):
+        size, files, folders = 0, 0, 0
+        for child in self.drive.children_of(id):
+            if child["type"] == "FILE":
+                size, files = size + int(child["bytes"]), files + 1
+            else:
+                child_size, child_files, child_folders = self._expected(child["id"])
+                size += child_size
+                files += child_files
+                folders += child_folders + 1
+        return size, files, folders
+
+    def test_recursive_totals(self):
+        usage = self.tekdrive.folder("f0").disk_usage(workers=4)
+        assert (usage.bytes, usage.file_count, usage.folder_count) == self._expected(
+            "f0"
+        )
+        assert usage.bytes_by_file_type == {"WFM": usage.bytes}
+        assert usage.files_by_file_type == {"WFM": usage.file_count}
+
+    def test_totals_for_every_subfolder(self):
+        usage = self.tekdrive.folder("fol_root").disk_usage()
+        walked = list(usage.walk())
+        assert len(walked) == usage.folder_count + 1
+        for folder_usage in walked:
+            expected = self._expected(folder_usage.folder_id)
+            assert (
+                folder_usage.bytes,
+                folder_usage.file_count,
+                folder_usage.folder_count,
+            ) == expected
+        assert usage.subfolders["f1"].name == "f1"
+
+    def test_file_type_breakdown(self):
+        self.drive.add_file(
+            "scope.png", "f2_0", "scope.png", bytes=1000, file_type="PNG"
+        )
+        usage = self.tekdrive.folder("f2").disk_usage()
+        assert usage.bytes_by_file_type["PNG"] == 1000
+        assert usage.files_by_file_type["PNG"] == 1
+        assert usage.subfolders["f2_0"].bytes_by_file_type["PNG"] == 1000
+
+    def test_not_recursive(self):
+        usage = self.tekdrive.folder("f0").disk_usage(recursive=False)
+        assert (usage.bytes, usage.file_count, usage.folder_count) == (3, 2, 3)
+        assert usage.subfolders == {}
+
+    def test_reuses_cached_listings(self):
+        self.tekdrive.tree.get(folder_id="f0", depth=10)
+        self.api.calls.clear()
+        usage = self.tekdrive.folder("f0").disk_usage()
+        assert usage.bytes == self._expected("f0")[0]
+        assert self.api.calls == []
+
+    def test_repeated_calls_keep_root_name(self):
+        folder = self.tekdrive.folder("fol_root")
+        first = folder.disk_usage()
+        self.api.calls.clear()
+        second = folder.disk_usage()
+        assert self.api.calls == []
+        assert first.name == second.name == "My Files"
+        assert second.bytes == first.bytes
+        assert self.tekdrive.folder("f0").disk_usage().name == "f0"
+
+
+class TestFolderUploadTree(FakeDriveTest):
+    def setup(self):
+        super().setup()
+        self.storage = FakeStorage()
+        self.tekdrive._storage._http = self.storage
+        self.transfers = FakeTransfers(self.api, self.storage)
+        self.folder = Folder(
+            self.tekdrive, _data=self.drive.add_folder("target", "fol_root", "target")
+        )
+
+    def _make_local_tree(self, root):
+        contents = {}
+        for directory in ["", "run1", "run2", "run2/ch1"]:
+            (root / directory).mkdir(exist_ok=True)
+            for idx in range(3):
+                path = root / directory / f"capture{idx}.csv"
+                path.write_bytes(f"{directory}:{idx}".encode())
+                contents[os.path.relpath(path, root)] = path.read_bytes()
+        return contents
+
+    def _remote_contents(self, folder_id, prefix=""):
+        contents = {}
+        for child in self.drive.children_of(folder_id):
+            path = os.path.join(prefix, child["name"])
+            if child["type"] == "FOLDER":
+                contents.update(self._remote_contents(child["id"], path))
+            else:
+                contents[path] = self.transfers.contents(child["id"])
+        return contents
+
+    def test_upload_tree_mirrors_directory(self, tmp_path):
+        contents = self._make_local_tree(tmp_path)
+        results = self.folder.upload_tree(str(tmp_path), workers=4)
+
+        assert all(result.ok for result in results)
+        assert [result.path for result in results] == sorted(
+            result.path for result in results
+        )
+        assert len(results) == len(contents) + 3
+        assert self._remote_contents("target") == contents
+
+    def test_upload_tree_reuses_upload_urls(self, tmp_path):
+        self._make_local_tree(tmp_path)
+        self.folder.upload_tree(str(tmp_path))
+        assert not [call for call in self.api.calls if call[1].endswith("/uploadUrl")]
+
+    def test_upload_tree_is_concurrent(self, tmp_path):
+        self._make_local_tree(tmp_path)
+        self.storage.latency = 0.02
+        self.folder.upload_tree(str(tmp_path), workers=4)
+        assert self.storage.max_in_flight > 1
+
+    def test_upload_tree_reports_failures(self, tmp_path):
+        self._make_local_tree(tmp_path)
+        self.storage.fail(lambda method, path: True, status_code=403)
+        results = self.folder.upload_tree(str(tmp_path), workers=1)
+        failed = [result for result in results if not result.ok]
+        assert len(failed) == 1
+        assert isinstance(failed[0].error, TekDriveStorageException)
+        assert failed[0].item is not None
+        assert sum(1 for result in results if result.ok) == len(results) - 1
+
+    def test_upload_tree_skips_below_failed_folder(self, tmp_path):
+        contents = self._make_local_tree(tmp_path)
+
+        def create_folder(json, **kwargs):
+            if json["name"] == "run2":
+                return 409, {"errorCode": "FOLDER_ALREADY_EXISTS"}, None
+            return self.drive.create_folder(json, **kwargs)
+
+        self.api.route("POST", "/folder", create_folder)
+        results = self.folder.upload_tree(str(tmp_path), workers=2)
+
+        assert len(results) == len(contents) + 3
+        failed = {
+            os.path.relpath(result.path, tmp_path): result
+            for result in results
+            if not result.ok
+        }
+        assert sorted(failed) == [
+            "run2",
+            "run2/capture0.csv",
+            "run2/capture1.csv",
+            "run2/capture2.csv",
+            "run2/ch1",
+            "run2/ch1/capture0.csv",
+            "run2/ch1/capture1.csv",
+            "run2/ch1/capture2.csv",
+        ]
+        cause = failed["run2"].error
+        assert not isinstance(cause, ClientException)
+        for path, result in failed.items():
+            if path != "run2":
+                assert isinstance(result.error, ClientException)
+                assert result.error.__cause__ is cause
+                assert result.item is None
+
+    def test_upload_tree_reports_unreadable_directory(self, tmp_path, monkeypatch):
+        contents = self._make_local_tree(tmp_path)
+        unreadable = str(tmp_path / "run2")
+        scandir = os.scandir
+
+        def failing_scandir(path):
+            if path == unreadable:
+                raise PermissionError(13, "Permission denied", path)
+            return scandir(path)
+
+        monkeypatch.setattr(os, "scandir", failing_scandir)
+        results = self.folder.upload_tree(str(tmp_path), workers=2)
+
+        failed = [result for result in results if not result.ok]
+        assert [result.path for result in failed] == [unreadable]
+        assert isinstance(failed[0].error, PermissionError)
+        assert failed[0].item is not None
+        uploaded = {
+            path: data for path, data in contents.items() if not path.startswith("run2")
+        }
+        assert self._remote_contents("target") == uploaded
+
+    def test_upload_tree_reports_unreadable_root(self, tmp_path, monkeypatch):
+        def failing_scandir(path):
+            raise PermissionError(13, "Permission denied", path)
+
+        monkeypatch.setattr(os, "scandir", failing_scandir)
+        results = self.folder.upload_tree(str(tmp_path))
+        assert len(results) == 1
+        assert results[0].path == str(tmp_path)
+        assert results[0].item == self.folder
+        assert isinstance(results[0].error, PermissionError)
+
+    def test_upload_tree_missing_directory(self, tmp_path):
+        missing = str(tmp_path / "missing")
+        with pytest.raises(ClientException) as e:
+            self.folder.upload_tree(missing)
+        assert str(e.value) == f"Directory '{missing}' does not exist."
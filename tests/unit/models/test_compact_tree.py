@@ -0,0 +1,60 @@
+from tekdrive.models import CompactTree, File, Folder, Tree
+
+from .test_tree import FakeDriveTest
+
+
+class TestCompactTree(FakeDriveTest):
+    def setup(self):
+        super().setup()
+        self.tree = Tree(self.tekdrive).compact(depth=10)
+
+    def _subtree_ids(self, id):
+        ids = []
+        for child in self.drive.children_of(id):
+            ids.append(child["id"])
+            ids.extend(self._subtree_ids(child["id"]))
+        return ids
+
+    def test_holds_every_node(self):
+        assert len(self.tree) == len(self.drive.nodes)
+        assert self.tree.root == "fol_root"
+        assert set(self.tree) == set(self.drive.nodes)
+
+    def test_children_and_parent(self):
+        assert sorted(self.tree.children("f0")) == sorted(
+            node["id"] for node in self.drive.children_of("f0")
+        )
+        assert self.tree.parent("f0_1") == "f0"
+        assert self.tree.parent("fol_root") is None
+
+    def test_ancestors_and_descendants(self):
+        assert self.tree.ancestors("f0_1_1.wfm") == ["f0_1", "f0", "fol_root"]
+        assert sorted(self.tree.descendants("f1")) == sorted(self._subtree_ids("f1"))
+        assert self.tree.is_ancestor("f0", "f0_1_1.wfm")
+        assert not self.tree.is_ancestor("f1", "f0_1_1.wfm")
+        assert not self.tree.is_ancestor("f0", "f0")
+
+    def test_subtree_bytes(self):
+        expected = sum(
+            int(self.drive.nodes[id].get("bytes", 0)) for id in self._subtree_ids("f2")
+        )
+        assert self.tree.subtree_bytes("f2") == expected
+        assert self.tree.subtree_bytes("f2_0.wfm") == 1
+
+    def test_path(self):
+        assert self.tree.path("fol_root") == "/"
+        assert self.tree.path("f0_1_1.wfm") == "/f0/f0_1/f0_1_1.wfm"
+
+    def test_lazy_models(self):
+        file = self.tree["f0_1.wfm"]
+        assert isinstance(file, File)
+        assert (file.name, file.parent_folder_id, file.bytes) == ("f0_1.wfm", "f0", "2")
+        assert isinstance(self.tree["f0"], Folder)
+        assert len(self.api.calls) == 1
+
+    def test_from_folder(self):
+        folder = Tree(self.tekdrive).get(depth=10)
+        tree = CompactTree.from_folder(self.tekdrive, folder)
+        assert set(tree) == set(self.tree)
+        assert tree.subtree_bytes("fol_root") == self.tree.subtree_bytes("fol_root")
+        assert tree.path("f2_2_1") == "/f2/f2_2/f2_2_1"
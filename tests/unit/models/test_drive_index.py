@@ -0,0 +1,128 @@
+from datetime import datetime
+
+from tekdrive.enums import ObjectType
+from tekdrive.models import DriveIndex, File
+
+from .test_tree import FakeDriveTest
+
+
+class TestDriveIndex(FakeDriveTest):
+    def setup(self):
+        super().setup()
+        self.drive.add_file(
+            "big.wfm",
+            "f1_2",
+            "big.wfm",
+            bytes=500_000_000,
+            updatedAt="2026-10-05T10:00:00.000Z",
+        )
+        self.drive.add_file(
+            "old.wfm",
+            "f1_2_0",
+            "old.wfm",
+            bytes=400_000_000,
+            updatedAt="2026-08-01T10:00:00.000Z",
+        )
+        self.drive.add_file(
+            "big.png",
+            "f1",
+            "big.png",
+            bytes=300_000_000,
+            file_type="PNG",
+            updatedAt="2026-10-06T10:00:00.000Z",
+        )
+        self.index = DriveIndex(self.tekdrive)
+        self.index.refresh(workers=4)
+
+    def _ids(self, items):
+        return sorted(item.id for item in items)
+
+    def test_indexes_every_node(self):
+        assert len(self.index) == len(self.drive.nodes)
+
+    def test_query_without_requests(self):
+        self.api.calls.clear()
+        files = self.index.query(
+            file_type="WFM",
+            min_bytes=100_000_000,
+            updated_after=datetime(2026, 10, 1),
+            under="f1",
+        )
+        assert self._ids(files) == ["big.wfm"]
+        assert isinstance(files[0], File)
+        assert files[0].bytes == "500000000"
+        assert files[0].parent_folder_id == "f1_2"
+        assert self.api.calls == []
+
+    def test_query_under_folder(self):
+        below = self.index.query(under="f1_2", type=ObjectType.FILE)
+        assert self._ids(below) == sorted(
+            id
+            for id, node in self.drive.nodes.items()
+            if node["type"] == "FILE"
+            and (id.startswith("f1_2_") or id in ("big.wfm", "old.wfm"))
+        )
+        assert self._ids(self.index.query(name="big.%")) == ["big.png", "big.wfm"]
+        assert len(self.index.query(type=ObjectType.FOLDER, limit=3)) == 3
+
+    def test_refresh_writes_only_changes(self):
+        self.drive.nodes["f0_1"]["name"] = "renamed"
+        self.drive.nodes["old.wfm"]["parentFolderId"] = "f0"
+        del self.drive.nodes["big.png"]
+        self.drive.add_file("new.wfm", "f2", "new.wfm", bytes=10)
+
+        changes = self.index.refresh()
+        assert changes.renamed == ["f0_1"]
+        assert changes.moved == ["old.wfm"]
+        assert changes.deleted == ["big.png"]
+        assert changes.created == ["new.wfm"]
+        assert len(self.index) == len(self.drive.nodes)
+        assert self._ids(self.index.query(under="f0", name="old%")) == ["old.wfm"]
+        assert not self.index.refresh()
+
+    def _stamp_folders(self, updated_at="2026-10-01T10:00:00.000Z"):
+        for node in self.drive.nodes.values():
+            if node["type"] == "FOLDER":
+                node["updatedAt"] = updated_at
+        self.index.refresh()
+
+    def test_refresh_notices_changes_below_unchanged_folders(self):
+        self._stamp_folders()
+        self.drive.add_file("new.wfm", "f1_2_0", "new.wfm", bytes=10)
+        del self.drive.nodes["f2_0_0.wfm"]
+
+        changes = self.index.refresh()
+        assert changes.created == ["new.wfm"]
+        assert changes.deleted == ["f2_0_0.wfm"]
+        assert changes.modified == []
+        assert len(self.index) == len(self.drive.nodes)
+
+    def test_refresh_skip_unchanged_folders(self):
+        self._stamp_folders()
+        self.api.calls.clear()
+        assert not self.index.refresh(skip_unchanged_folders=True)
+        # only the root listing is requested
+        assert len(self.api.calls) == 1
+        assert len(self.index) == len(self.drive.nodes)
+
+        self.drive.add_file("new.wfm", "f1", "new.wfm", bytes=10)
+        self.drive.nodes["f1"]["updatedAt"] = "2026-10-19T10:00:00.000Z"
+        self.api.calls.clear()
+        changes = self.index.refresh(skip_unchanged_folders=True)
+        assert changes.created == ["new.wfm"]
+        assert changes.modified == ["f1"]
+        # the root listing covers f1's files, its unchanged subfolders are skipped
+        assert len(self.api.calls) == 1
+
+    def test_persists_to_disk(self, tmp_path):
+        path = str(tmp_path / "drive.sqlite")
+        with DriveIndex(self.tekdrive, path) as index:
+            index.refresh()
+        with DriveIndex(self.tekdrive, path) as index:
+            assert len(index) == len(self.drive.nodes)
+            assert not index.refresh()
+
+    def test_add_search_results(self):
+        index = DriveIndex(self.tekdrive)
+        index.add(self.tekdrive.folder("f2").children())
+        assert len(index) == 5
@@ -0,0 +1,249 @@
+import json
+import threading
+import time
+
+import pytest
+from tekdrive.exceptions import ClientException, ForbiddenAPIException
+from tekdrive.models import Search, Trashcan
+from tekdrive.models.paginator import PaginatedListGenerator
+from tekdrive.routing import Route, ENDPOINTS
+
+from ..base import UnitTest
+from ..fakes import FakeAPI, make_files, make_stream_response, paginated_handler
+
+
+class TestPaginatedListGenerator(UnitTest):
+    def setup(self):
+        super().setup()
+        self.api = FakeAPI()
+        self.tekdrive._session._request_wrapper._http = self.api
+        self.items = make_files(95)
+        self.api.route("GET", "/search", paginated_handler(self.items))
+
+    def _generator(self, **kwargs):
+        route = Route("GET", ENDPOINTS["search"])
+        return PaginatedListGenerator(self.tekdrive, route, **kwargs)
+
+    def _pages_requested(self):
+        return [params.get("page", 1) for _, _, params in self.api.calls]
+
+    def test_iterates_all_pages(self):
+        results = self._generator(limit=None, limit_per_page=10)
+        assert [file.id for file in results] == [item["id"] for item in self.items]
+        assert self._pages_requested() == list(range(1, 11))
+
+    def test_stops_at_limit(self):
+        results = self._generator(limit=25, limit_per_page=10)
+        assert len(list(results)) == 25
+        assert self._pages_requested() == [1, 2, 3]
+
+    def test_prefetch_yields_same_items(self):
+        results = self._generator(limit=None, limit_per_page=10, prefetch=3)
+        assert [file.id for file in results] == [item["id"] for item in self.items]
+        assert sorted(self._pages_requested()) == list(range(1, 11))
+
+    def test_prefetch_is_bounded(self):
+        results = self._generator(limit=None, limit_per_page=10, prefetch=2)
+        next(results)
+        threading.Event().wait(0.2)
+        # first page in hand, two buffered, one waiting for buffer space
+        assert len(self.api.calls) <= 4
+        results.close()
+
+    def _prefetch_threads(self, timeout=2.0):
+        # stopped threads notice within one buffer wait
+        deadline = time.monotonic() + timeout
+        while True:
+            threads = [
+                t for t in threading.enumerate() if t.name == "tekdrive-prefetch"
+            ]
+            if not threads or time.monotonic() > deadline:
+                return threads
+            threading.Event().wait(0.05)
+
+    def test_prefetch_stops_when_dropped_early(self):
+        for _ in range(5):
+            for file in self._generator(limit=None, limit_per_page=10, prefetch=2):
+                break
+        assert self._prefetch_threads() == []
+
+    def test_prefetch_stops_on_context_exit(self):
+        with self._generator(limit=None, limit_per_page=10, prefetch=2) as results:
+            next(results)
+            assert self._prefetch_threads(timeout=0)
+        assert self._prefetch_threads() == []
+        # the generator is still referenced, but its thread has stopped
+        assert results.yielded == 1
+
+    def test_prefetch_raises_errors_in_consumer(self):
+        self.api.route(
+            "GET",
+            "/trash",
+            lambda **_kwargs: (403, {"errorCode": "FORBIDDEN"}, None),
+        )
+        with pytest.raises(ForbiddenAPIException):
+            list(Trashcan(self.tekdrive).get(prefetch=2))
+
+    def test_search_prefetch(self):
+        results = Search(self.tekdrive).files(name="file", limit=50, prefetch=1)
+        assert len(list(results)) == 50
+
+    def test_workers_yield_in_order(self):
+        results = self._generator(limit=None, limit_per_page=10, workers=4)
+        assert [file.id for file in results] == [item["id"] for item in self.items]
+        # the short 10th page ends the listing; at most workers - 1 extra requests
+        assert len(self.api.calls) <= 10 + 3
+
+    def test_workers_stop_at_limit(self):
+        results = self._generator(limit=25, limit_per_page=10, workers=8)
+        assert len(list(results)) == 25
+        assert sorted(self._pages_requested()) == [1, 2, 3]
+
+    def test_workers_are_faster_with_latency(self):
+        self.api.latency = 0.02
+
+        started = time.perf_counter()
+        assert len(list(self._generator(limit=None, limit_per_page=10))) == 95
+        sequential = time.perf_counter() - started
+
+        started = time.perf_counter()
+        assert (
+            len(list(self._generator(limit=None, limit_per_page=10, workers=5))) == 95
+        )
+        concurrent = time.perf_counter() - started
+
+        assert concurrent < sequential / 2
+
+    def test_prefetch_and_workers_conflict(self):
+        with pytest.raises(ClientException) as e:
+            self._generator(prefetch=2, workers=2)
+        assert str(e.value) == "Only supply one of: 'prefetch', 'workers'."
+
+    def test_adaptive_page_size_grows_when_fast(self):
+        items = make_files(1000)
+        self.api.route("GET", "/search", paginated_handler(items))
+        results = self._generator(
+            limit=None, limit_per_page=100, adaptive_page_size=True
+        )
+        assert [file.id for file in results] == [item["id"] for item in items]
+        limits = [params["limit"] for _, _, params in self.api.calls]
+        assert limits == [100, 100, 200, 400, 800]
+
+    def test_adaptive_page_size_respects_api_cap(self):
+        items = make_files(1000)
+        self.api.route("GET", "/search", paginated_handler(items, max_limit=150))
+        results = self._generator(
+            limit=None, limit_per_page=100, adaptive_page_size=True
+        )
+        assert [file.id for file in results] == [item["id"] for item in items]
+
+    def test_adaptive_page_size_shrinks_on_server_error(self, monkeypatch):
+        monkeypatch.setattr("tekdrive.session.sleep", lambda _seconds: None)
+        serve = paginated_handler(self.items)
+
+        def handler(params, **kwargs):
+            if int(params["limit"]) > 25:
+                return 503, {"message": "Service Unavailable"}, None
+            return serve(params, **kwargs)
+
+        self.api.route("GET", "/search", handler)
+        results = self._generator(
+            limit=None, limit_per_page=100, adaptive_page_size=True
+        )
+        assert [file.id for file in results] == [item["id"] for item in self.items]
+
+    def test_adaptive_page_size_and_workers_conflict(self):
+        with pytest.raises(ClientException):
+            self._generator(adaptive_page_size=True, workers=2)
+
+    def test_resume_from_cursor(self):
+        results = self._generator(limit=80, limit_per_page=10)
+        first = [next(results).id for _ in range(37)]
+        cursor = json.loads(json.dumps(results.cursor))
+        assert cursor["page"] == 4
+        assert cursor["index"] == 7
+        assert cursor["yielded"] == 37
+
+        self.api.calls.clear()
+        resumed = PaginatedListGenerator.from_cursor(self.tekdrive, cursor)
+        rest = [file.id for file in resumed]
+        assert first + rest == [item["id"] for item in self.items[:80]]
+        assert self._pages_requested() == [4, 5, 6, 7, 8]
+
+    def test_resume_from_cursor_at_page_boundary(self):
+        results = self._generator(limit=None, limit_per_page=10, workers=3)
+        first = [next(results).id for _ in range(30)]
+        cursor = results.cursor
+        results.close()
+        assert (cursor["page"], cursor["index"]) == (4, 0)
+
+        resumed = PaginatedListGenerator.from_cursor(self.tekdrive, cursor, workers=3)
+        assert first + [file.id for file in resumed] == [
+            item["id"] for item in self.items
+        ]
+
+    def test_iter_pages(self):
+        pages = list(self._generator(limit=None, limit_per_page=10).iter_pages())
+        assert [len(page) for page in pages] == [10] * 9 + [5]
+        assert [page.page for page in pages] == list(range(1, 11))
+        assert [file.id for page in pages for file in page] == [
+            item["id"] for item in self.items
+        ]
+
+    def test_iter_pages_after_next_and_limit(self):
+        results = Trashcan(self.tekdrive).get(limit=25, limit_per_page=10)
+        self.api.route(
+            "GET",
+            "/trash",
+            paginated_handler(
+                [{"trasher": {}, "item": item} for item in self.items],
+                list_attribute="trash",
+            ),
+        )
+        first = next(results)
+        pages = list(results.iter_pages())
+        assert [len(page) for page in pages] == [9, 10, 5]
+        assert pages[0][0].item.id == "file_1"
+        assert first.item.id == "file_0"
+        assert results.yielded == 25
+
+    def test_stream(self):
+        results = self._generator(limit=None, limit_per_page=10, stream=True)
+        assert [file.id for file in results] == [item["id"] for item in self.items]
+        assert self._pages_requested() == list(range(1, 11))
+
+    def test_stream_closes_retried_responses(self, monkeypatch):
+        monkeypatch.setattr("tekdrive.session.sleep", lambda seconds: None)
+        request = self.api.request
+        retried = []
+
+        def busy_once(method, url, **kwargs):
+            if not retried:
+                retried.append(make_stream_response(503, b"busy"))
+                return retried[-1]
+            return request(method, url, **kwargs)
+
+        monkeypatch.setattr(self.api, "request", busy_once)
+        results = self._generator(limit=None, limit_per_page=10, stream=True)
+        assert [file.id for file in results] == [item["id"] for item in self.items]
+        assert retried[0].raw.closed
+
+    def test_stream_cursor(self):
+        results = Search(self.tekdrive).files(
+            name="file", limit=None, limit_per_page=10, stream=True
+        )
+        first = [next(results).id for _ in range(20)]
+        cursor = results.cursor
+        results.close()
+        assert (cursor["page"], cursor["index"]) == (2, 10)
+
+        resumed = PaginatedListGenerator.from_cursor(self.tekdrive, cursor, stream=True)
+        assert first + [file.id for file in resumed] == [
+            item["id"] for item in self.items
+        ]
+
+    def test_stream_conflicts(self):
+        with pytest.raises(ClientException):
+            self._generator(stream=True, workers=2)
+        with pytest.raises(ClientException):
+            self._generator(stream=True).iter_pages().__next__()
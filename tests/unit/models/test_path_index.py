@@ -0,0 +1,79 @@
+import pytest
+from tekdrive.exceptions import ClientException
+from tekdrive.models import File, Folder
+
+from .test_tree import FakeDriveTest
+
+
+class TestPathIndex(FakeDriveTest):
+    def test_resolve_file(self):
+        file = self.tekdrive.resolve("/f0/f0_1/f0_1_1.wfm")
+        assert isinstance(file, File)
+        assert file.id == "f0_1_1.wfm"
+        assert file.parent_folder_id == "f0_1"
+
+    def test_resolve_folder_and_root(self):
+        assert isinstance(self.tekdrive.resolve("/f2/f2_0/"), Folder)
+        assert self.tekdrive.resolve("/").id == "fol_root"
+
+    def test_repeated_resolve_is_cached(self):
+        self.tekdrive.resolve("/f0/f0_1/f0_1_1.wfm")
+        calls = len(self.api.calls)
+        assert calls == 3
+
+        self.tekdrive.resolve("/f0/f0_1/f0_1_1.wfm")
+        self.tekdrive.resolve("/f0/f0_1")
+        assert len(self.api.calls) == calls
+
+    def test_resolve_uses_tree_responses(self):
+        self.tekdrive.tree.get(depth=3)
+        self.api.calls.clear()
+        assert self.tekdrive.resolve("/f1/f1_2/f1_2_0").id == "f1_2_0"
+        # only the silo root lookup
+        assert len(self.api.calls) == 1
+
+    def test_resolve_missing(self):
+        with pytest.raises(ClientException) as e:
+            self.tekdrive.resolve("/f0/nope")
+        assert str(e.value) == "Path '/f0/nope' does not exist."
+        with pytest.raises(ClientException):
+            self.tekdrive.resolve("/f0/f0_0.wfm/f0")
+
+    def test_path(self):
+        self.tekdrive.tree.get(depth=3)
+        self.api.calls.clear()
+        folder = self.tekdrive.tree.get(folder_id="f0_1_0")
+        assert folder.path == "/f0/f0_1/f0_1_0"
+        assert folder.children()[0].path == "/f0/f0_1/f0_1_0/f0_1_0_0.wfm"
+        assert len(self.api.calls) == 1
+
+    def test_path_fetches_unknown_parents(self):
+        file = self.tekdrive.file("f2_1_0.wfm")
+        assert file.path == "/f2/f2_1/f2_1_0.wfm"
+        assert self.tekdrive.folder("fol_root").path == "/"
+
+    def test_rename_and_move_invalidate(self):
+        folder = self.tekdrive.resolve("/f0/f0_1")
+        folder.name = "renamed"
+        folder.save()
+        assert self.tekdrive.resolve("/f0/renamed").id == "f0_1"
+        with pytest.raises(ClientException):
+            self.tekdrive.resolve("/f0/f0_1")
+
+        folder.move("f1")
+        assert self.tekdrive.resolve("/f1/renamed/f0_1_0.wfm").id == "f0_1_0.wfm"
+        with pytest.raises(ClientException):
+            self.tekdrive.resolve("/f0/renamed")
+
+    def test_delete_invalidates(self):
+        file = self.tekdrive.resolve("/f0/f0_0.wfm")
+        file.delete()
+        with pytest.raises(ClientException):
+            self.tekdrive.resolve("/f0/f0_0.wfm")
+
+    def test_eviction(self):
+        index = self.tekdrive._path_index
+        index._entries.maxsize = index._ids.maxsize = 5
+        self.tekdrive.tree.get(depth=3)
+        assert len(index._entries) == 5
+        assert self.tekdrive.resolve("/f0/f0_1").id == "f0_1"
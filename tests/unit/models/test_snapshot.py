@@ -0,0 +1,63 @@
+from tekdrive.models import Tree, TreeSnapshot
+
+from .test_tree import FakeDriveTest
+
+
+class TestTreeSnapshot(FakeDriveTest):
+    def _snapshot(self):
+        return Tree(self.tekdrive).snapshot(workers=4)
+
+    def test_holds_every_node(self):
+        snapshot = self._snapshot()
+        assert set(snapshot.entries) == set(self.drive.nodes)
+        entry = snapshot.entries["f0_1_1.wfm"]
+        assert (entry.parent_id, entry.name, entry.bytes, entry.is_folder) == (
+            "f0_1",
+            "f0_1_1.wfm",
+            2,
+            False,
+        )
+        assert snapshot.path("f0_1_1.wfm") == "/f0/f0_1/f0_1_1.wfm"
+
+    def test_matches_tree_get(self):
+        snapshot = TreeSnapshot.from_folder(Tree(self.tekdrive).get(depth=10))
+        assert snapshot.entries == self._snapshot().entries
+
+    def test_matches_raw_nodes(self):
+        for node in self.drive.nodes.values():
+            node["updatedAt"] = "2021-04-21T14:34:14.053Z"
+        snapshot = self._snapshot()
+        assert snapshot.entries["f0_1"].updated_at == "2021-04-21T14:34:14.053000Z"
+        assert not TreeSnapshot.from_nodes(self.drive.nodes.values()).diff(snapshot)
+
+    def test_save_and_load(self, tmp_path):
+        snapshot = self._snapshot()
+        path = str(tmp_path / "drive.snapshot")
+        snapshot.save(path)
+        loaded = TreeSnapshot.load(path)
+        assert loaded.entries == snapshot.entries
+        assert not snapshot.diff(loaded)
+
+    def test_diff(self):
+        before = self._snapshot()
+        self.drive.nodes["f0_1"]["name"] = "renamed"
+        self.drive.nodes["f1_0.wfm"]["parentFolderId"] = "f2"
+        self.drive.nodes["f2_2_0.wfm"]["bytes"] = "1000"
+        self.drive.add_file("new.wfm", "f1_1", "new.wfm")
+        deleted = ["f0_2"] + [id for id in self.drive.nodes if id.startswith("f0_2_")]
+        for id in deleted:
+            del self.drive.nodes[id]
+
+        changes = self._snapshot().diff(before)
+        assert changes.renamed == ["f0_1"]
+        assert changes.moved == ["f1_0.wfm"]
+        assert changes.modified == ["f2_2_0.wfm"]
+        assert changes.created == ["new.wfm"]
+        assert sorted(changes.deleted) == sorted(deleted)
+
+    def test_diff_skips_unchanged_subtrees(self):
+        before = self._snapshot()
+        self.drive.nodes["f2_2_0.wfm"]["bytes"] = "1000"
+        after = self._snapshot()
+        changed = after._changed(before)
+        assert sorted(changed) == ["f2", "f2_2", "f2_2_0.wfm", "fol_root"]
@@ -0,0 +1,110 @@
+from tekdrive.models import File, Folder, Tree
+
+from ..base import UnitTest
+from ..fakes import FakeAPI, FakeDrive
+
+
+class FakeDriveTest(UnitTest):
+    def setup(self):
+        super().setup()
+        self.api = FakeAPI()
+        self.tekdrive._session._request_wrapper._http = self.api
+        self.drive = FakeDrive(self.api)
+        self.drive.build(levels=4, folders_per_folder=3, files_per_folder=2)
+
+    def _expected_listings(self):
+        return {
+            node["id"]: sorted(
+                child["id"] for child in self.drive.children_of(node["id"])
+            )
+            for node in self.drive.nodes.values()
+            if node["type"] == "FOLDER"
+        }
+
+
+class TestTreeWalk(FakeDriveTest):
+    def test_walk_visits_every_folder_once(self):
+        listings = {}
+        for folder, subfolders, files in Tree(self.tekdrive).walk(
+            silo="PERSONAL", depth=1
+        ):
+            assert folder.id not in listings
+            listings[folder.id] = sorted(child.id for child in subfolders + files)
+        assert listings == self._expected_listings()
+
+    def test_walk_deep_requests_reduce_round_trips(self):
+        folder_count = len(self._expected_listings())
+        list(Tree(self.tekdrive).walk(depth=1, nodes_per_request=10_000))
+        assert len(self.api.calls) < folder_count / 4
+
+    def test_walk_max_depth(self):
+        walked = [folder.id for folder, _, _ in Tree(self.tekdrive).walk(max_depth=2)]
+        assert sorted(walked) == sorted(["fol_root", "f0", "f1", "f2"])
+
+    def test_walk_prunes_subfolders(self):
+        walked = []
+        for folder, subfolders, _ in Tree(self.tekdrive).walk(folder_id="f0", depth=1):
+            walked.append(folder.id)
+            subfolders[:] = [sub for sub in subfolders if sub.id != "f0_1"]
+        assert not any(id.startswith("f0_1") for id in walked)
+        assert "f0_2_0" in walked
+
+    def test_walk_from_cache_keeps_root_details(self):
+        list(Tree(self.tekdrive).walk(folder_id="f1"))
+        self.api.calls.clear()
+        root, _, _ = next(Tree(self.tekdrive).walk(folder_id="f1"))
+        assert (root.name, root.parent_folder_id) == ("f1", "fol_root")
+        assert self.api.calls == []
+
+    def test_walk_without_cache_does_not_fill_it(self):
+        list(Tree(self.tekdrive).walk(use_cache=False))
+        self.tekdrive.tree.snapshot(folder_id="f1")
+        assert len(self.tekdrive._children_cache) == 0
+
+
+class TestTreeGetSplit(FakeDriveTest):
+    def _structure(self, folder):
+        if folder._children is None:
+            return None
+        return {
+            child.id: self._structure(child)
+            if isinstance(child, Folder)
+            else child.name
+            for child in folder._children
+        }
+
+    def test_split_matches_single_request(self):
+        single = Tree(self.tekdrive).get(depth=4)
+        self.api.calls.clear()
+        split = Tree(self.tekdrive).get(depth=4, split_depth=1, workers=3)
+        assert self._structure(split) == self._structure(single)
+        assert len(self.api.calls) > 1
+
+    def test_split_keeps_depth_boundary(self):
+        split = Tree(self.tekdrive).get(folder_id="f0", depth=2, split_depth=1)
+        f0_0 = next(child for child in split._children if child.id == "f0_0")
+        assert f0_0._children is not None
+        assert all(
+            child._children is None
+            for child in f0_0._children
+            if isinstance(child, Folder)
+        )
+
+    def test_no_split_when_shallow(self):
+        Tree(self.tekdrive).get(depth=2, split_depth=2)
+        assert len(self.api.calls) == 1
+
+
+class TestTreeStream(FakeDriveTest):
+    def test_stream_yields_every_node(self):
+        items = list(Tree(self.tekdrive).stream(depth=10))
+        assert sorted(item.id for item in items) == sorted(self.drive.nodes)
+        assert items[-1].id == "fol_root"
+        assert all(isinstance(item, (File, Folder)) for item in items)
+        assert all(item._children is None for item in items if isinstance(item, Folder))
+
+    def test_stream_respects_depth(self):
+        items = list(
+            Tree(self.tekdrive).stream(folder_id="f0", depth=1, folders_only=True)
+        )
+        assert sorted(item.id for item in items) == ["f0", "f0_0", "f0_1", "f0_2"]
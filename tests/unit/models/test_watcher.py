@@ -0,0 +1,73 @@
+import threading
+
+from tekdrive.enums import ChangeType
+
+from .test_tree import FakeDriveTest
+
+
+class TestWatcher(FakeDriveTest):
+    def setup(self):
+        super().setup()
+        self.watcher = self.tekdrive.watch(
+            "f0", depth=2, min_interval=1, max_interval=8
+        )
+
+    def test_first_poll_records_baseline(self):
+        assert self.watcher.poll() == []
+        assert "f0_1_0.wfm" in self.watcher.snapshot
+
+    def test_reports_changes(self):
+        self.watcher.poll()
+        self.drive.add_file("capture.wfm", "f0_1", "capture.wfm", bytes=100)
+        self.drive.nodes["f0_0.wfm"]["bytes"] = "50"
+        del self.drive.nodes["f0_2_1.wfm"]
+        self.drive.nodes["f0_1_0.wfm"]["name"] = "renamed.wfm"
+        self.drive.nodes["f0_1_1.wfm"]["parentFolderId"] = "f0_2"
+
+        events = {(event.type, event.id) for event in self.watcher.poll()}
+        assert events == {
+            (ChangeType.CREATED, "capture.wfm"),
+            (ChangeType.MODIFIED, "f0_0.wfm"),
+            (ChangeType.DELETED, "f0_2_1.wfm"),
+            (ChangeType.RENAMED, "f0_1_0.wfm"),
+            (ChangeType.MOVED, "f0_1_1.wfm"),
+        }
+
+    def test_unchanged_polls_are_conditional(self):
+        self.watcher.poll()
+        self.watcher.poll()
+        _, _, first_headers = self.drive.tree_requests[0]
+        _, status, second_headers = self.drive.tree_requests[1]
+        assert "If-None-Match" not in first_headers
+        assert second_headers["If-None-Match"]
+        assert status == 304
+
+    def test_interval_adapts(self):
+        self.watcher.poll()
+        intervals = []
+        for _ in range(5):
+            self.watcher.poll()
+            intervals.append(self.watcher.interval)
+        assert intervals == [2, 4, 8, 8, 8]
+
+        self.drive.add_file("capture.wfm", "f0", "capture.wfm")
+        assert self.watcher.poll()
+        assert self.watcher.interval == 1
+
+    def test_iterate_until_stopped(self):
+        watcher = self.tekdrive.watch("f0", min_interval=0.01, max_interval=0.01)
+        events = []
+
+        def consume():
+            for event in watcher:
+                events.append(event)
+                watcher.stop()
+
+        thread = threading.Thread(target=consume)
+        thread.start()
+        threading.Event().wait(0.05)
+        self.drive.add_file("capture.wfm", "f0", "capture.wfm")
+        thread.join(timeout=5)
+        assert [(event.type, event.id) for event in events] == [
+            (ChangeType.CREATED, "capture.wfm")
+        ]
@@ -0,0 +1,230 @@
+import io
+import mmap
+import os
+import threading
+
+import pytest
+from tekdrive.exceptions import TekDriveStorageException
+from tekdrive.models import File
+from tekdrive.transfer import IterableReader
+from tekdrive.transfer.checkpoint import UploadCheckpoint
+from tekdrive.transfer.multipart import MultipartUpload
+from tekdrive.transfer.streams import map_file
+
+from ..base import UnitTest
+from ..fakes import FakeAPI, FakeStorage, FakeTransfers
+
+
+class MultipartTest(UnitTest):
+    def setup(self):
+        super().setup()
+        self.api = FakeAPI()
+        self.tekdrive._session._request_wrapper._http = self.api
+        self.storage = FakeStorage()
+        self.tekdrive._storage._http = self.storage
+        self.transfers = FakeTransfers(self.api, self.storage)
+        self.file = File(self.tekdrive, _data=dict(id="file1", name="capture.wfm"))
+
+    def _upload(self, contents, **kwargs):
+        MultipartUpload(self.file, **kwargs).upload(contents)
+
+
+class TestMultipartUpload(MultipartTest):
+    def test_upload(self):
+        contents = os.urandom(10_000)
+        self._upload(io.BytesIO(contents), part_size=1024, workers=4)
+        assert self.transfers.contents("file1") == contents
+        assert len(self.transfers.completed) == 1
+        part_puts = [path for method, path in self.storage.calls if method == "PUT"]
+        assert len(part_puts) == 10
+
+    def test_upload_empty(self):
+        self._upload(io.BytesIO(b""))
+        assert self.transfers.contents("file1") == b""
+
+    def test_upload_bounded_concurrency(self):
+        self.storage.latency = 0.01
+        self._upload(io.BytesIO(b"x" * 2000), part_size=100, workers=3)
+        assert self.storage.max_in_flight == 3
+
+    def test_upload_retries_part(self, monkeypatch):
+        monkeypatch.setattr("tekdrive.transfer.storage.sleep", lambda seconds: None)
+        self.storage.fail(
+            lambda method, path: path.endswith("/2"), status_code=503, times=2
+        )
+        self._upload(io.BytesIO(b"0123456789"), part_size=4)
+        assert self.transfers.contents("file1") == b"0123456789"
+        assert [path for _, path in self.storage.calls].count(
+            "/uploads/upload_1/2"
+        ) == 3
+
+    def test_upload_refreshes_expired_url(self, monkeypatch):
+        monkeypatch.setattr("tekdrive.transfer.storage.sleep", pytest.fail)
+        self.storage.fail(lambda method, path: path.endswith("/1"), status_code=403)
+        self._upload(io.BytesIO(b"0123456789"), part_size=4)
+        assert self.transfers.contents("file1") == b"0123456789"
+        part_url_calls = [
+            call for call in self.api.calls if call[1].endswith("/parts/1")
+        ]
+        assert len(part_url_calls) == 2
+
+    def test_upload_aborts_on_failure(self, monkeypatch):
+        monkeypatch.setattr("tekdrive.transfer.storage.sleep", lambda seconds: None)
+        self.storage.fail(
+            lambda method, path: path.endswith("/3"), status_code=500, times=10
+        )
+        with pytest.raises(TekDriveStorageException):
+            self._upload(io.BytesIO(b"x" * 100), part_size=10)
+        assert self.transfers.aborted == ["upload_1"]
+        assert self.transfers.completed == []
+        assert self.transfers.contents("file1") is None
+
+    def test_upload_does_not_retry_client_errors(self):
+        self.storage.fail(lambda method, path: True, status_code=400)
+        with pytest.raises(TekDriveStorageException):
+            self._upload(io.BytesIO(b"x"))
+        assert len(self.storage.calls) == 1
+
+    def test_upload_pipe_full_parts(self):
+        contents = os.urandom(10_000)
+        read_fd, write_fd = os.pipe()
+
+        def produce():
+            with os.fdopen(write_fd, "wb") as writer:
+                for offset in range(0, len(contents), 300):
+                    writer.write(contents[offset : offset + 300])
+
+        thread = threading.Thread(target=produce)
+        thread.start()
+        with os.fdopen(read_fd, "rb", buffering=0) as reader:
+            self._upload(reader, part_size=4096)
+        thread.join()
+        assert self.transfers.contents("file1") == contents
+        part_sizes = sorted(
+            len(body)
+            for path, body in self.storage.objects.items()
+            if "uploads" in path
+        )
+        assert part_sizes == [10_000 - 2 * 4096, 4096, 4096]
+
+    def test_upload_generator_bounded_memory(self):
+        part_size, workers = 100, 2
+        self.storage.latency = 0.005
+        produced = []
+
+        def produce():
+            for idx in range(50):
+                stored = sum(1 for path in self.storage.objects if "uploads" in path)
+                produced.append(len(produced) * 50 - stored * part_size)
+                yield bytes([idx]) * 50
+
+        self._upload(IterableReader(produce()), part_size=part_size, workers=workers)
+        assert self.transfers.contents("file1") == b"".join(
+            bytes([idx]) * 50 for idx in range(50)
+        )
+        assert max(produced) <= (workers + 1) * part_size
+
+
+class TestMultipartBufferUpload(MultipartTest):
+    def _record_bodies(self, monkeypatch):
+        bodies = []
+        request = self.storage.request
+
+        def record(method, url, *, data=None, **kwargs):
+            bodies.append(data)
+            return request(method, url, data=data, **kwargs)
+
+        monkeypatch.setattr(self.storage, "request", record)
+        return bodies
+
+    def test_upload_buffer_without_copies(self, monkeypatch):
+        bodies = self._record_bodies(monkeypatch)
+        contents = bytearray(os.urandom(1000))
+        self._upload(memoryview(contents), part_size=300)
+        assert self.transfers.contents("file1") == contents
+        assert len(bodies) == 4
+        assert all(
+            isinstance(body, memoryview) and body.obj is contents for body in bodies
+        )
+
+    def test_upload_mapped_file(self, tmp_path, monkeypatch):
+        bodies = self._record_bodies(monkeypatch)
+        path = tmp_path / "capture.wfm"
+        path.write_bytes(b"x" * 5000)
+        with map_file(str(path)) as contents:
+            self._upload(contents, part_size=1000)
+        assert self.transfers.contents("file1") == b"x" * 5000
+        assert len(bodies) == 5
+        assert all(
+            isinstance(body, memoryview) and isinstance(body.obj, mmap.mmap)
+            for body in bodies
+        )
+
+
+class TestMultipartResumableUpload(MultipartTest):
+    def setup(self):
+        super().setup()
+        self.contents = os.urandom(1000)
+
+    def _interrupted_upload(self, path, monkeypatch):
+        monkeypatch.setattr("tekdrive.transfer.storage.sleep", lambda seconds: None)
+        self.storage.fail(
+            lambda method, path: path.endswith("/4"), status_code=500, times=4
+        )
+        with pytest.raises(TekDriveStorageException):
+            MultipartUpload(self.file, part_size=100, workers=1).upload_resumable(
+                str(path)
+            )
+
+    def test_resume_sends_missing_parts(self, tmp_path, monkeypatch):
+        path = tmp_path / "capture.wfm"
+        path.write_bytes(self.contents)
+        self._interrupted_upload(path, monkeypatch)
+        checkpoint = UploadCheckpoint.load(str(path) + ".tekdrive-upload")
+        assert sorted(checkpoint.parts) == [1, 2, 3]
+        assert self.transfers.aborted == []
+
+        self.storage.calls.clear()
+        MultipartUpload(self.file, part_size=100).upload_resumable(str(path))
+        assert self.transfers.contents("file1") == self.contents
+        assert self.transfers.completed == ["upload_1"]
+        assert sorted(path for _, path in self.storage.calls) == sorted(
+            f"/uploads/upload_1/{part_number}" for part_number in range(4, 11)
+        )
+        assert not os.path.exists(str(path) + ".tekdrive-upload")
+
+    def test_resume_changed_contents_starts_over(self, tmp_path, monkeypatch):
+        path = tmp_path / "capture.wfm"
+        path.write_bytes(self.contents)
+        self._interrupted_upload(path, monkeypatch)
+        path.write_bytes(os.urandom(1000))
+        MultipartUpload(self.file, part_size=100).upload_resumable(str(path))
+        assert self.transfers.completed == ["upload_2"]
+        assert self.transfers.contents("file1") == path.read_bytes()
+
+    def test_resume_expired_session_starts_over(self, tmp_path, monkeypatch):
+        path = tmp_path / "capture.wfm"
+        path.write_bytes(self.contents)
+        self._interrupted_upload(path, monkeypatch)
+        self.transfers.uploads.clear()
+        MultipartUpload(self.file, part_size=100).upload_resumable(str(path))
+        assert self.transfers.completed == ["upload_2"]
+        assert self.transfers.contents("file1") == self.contents
+
+    def test_resume_custom_checkpoint_path(self, tmp_path):
+        path = tmp_path / "capture.wfm"
+        path.write_bytes(self.contents)
+        checkpoint_path = str(tmp_path / "checkpoint.json")
+        MultipartUpload(self.file).upload_resumable(str(path), checkpoint_path)
+        assert self.transfers.contents("file1") == self.contents
+        assert not os.path.exists(checkpoint_path)
+
+    def test_checkpoint_roundtrip(self, tmp_path):
+        path = str(tmp_path / "checkpoint.json")
+        checkpoint = UploadCheckpoint(
+            "file1", "upload_1", 100, 1000, "abc", {1: '"etag"'}
+        )
+        checkpoint.save(path)
+        assert UploadCheckpoint.load(path) == checkpoint
+        assert os.listdir(tmp_path) == ["checkpoint.json"]
+        assert UploadCheckpoint.load(str(tmp_path / "missing.json")) is None
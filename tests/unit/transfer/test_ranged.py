@@ -0,0 +1,14 @@
+from tekdrive.transfer.ranged import parse_content_range, split_ranges
+
+
+def test_parse_content_range():
+    assert parse_content_range("bytes 0-0/1234") == (0, 0, 1234)
+    assert parse_content_range("bytes 100-199/*") == (100, 199, None)
+    assert parse_content_range("bytes */1234") is None
+    assert parse_content_range(None) is None
+
+
+def test_split_ranges():
+    assert split_ranges(10, 4) == [(0, 3), (4, 7), (8, 9)]
+    assert split_ranges(8, 4) == [(0, 3), (4, 7)]
+    assert split_ranges(0, 4) == []
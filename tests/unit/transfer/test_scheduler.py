@@ -0,0 +1,120 @@
+import threading
+
+from tekdrive.exceptions import TekDriveStorageException
+from tekdrive.transfer import TransferScheduler
+from tekdrive.transfer.scheduler import ByteBudget
+
+from ..base import UnitTest
+from ..fakes import FakeAPI, FakeDrive, FakeStorage, FakeTransfers
+
+
+class TestByteBudget:
+    def test_oversized_request_runs_alone(self):
+        budget = ByteBudget(10)
+        budget.acquire(25)
+        acquired = threading.Event()
+
+        def acquire():
+            budget.acquire(1)
+            acquired.set()
+
+        thread = threading.Thread(target=acquire)
+        thread.start()
+        assert not acquired.wait(0.05)
+        budget.release(25)
+        assert acquired.wait(1)
+        thread.join()
+        assert budget.in_flight == 1
+
+
+class TestTransferScheduler(UnitTest):
+    def setup(self):
+        super().setup()
+        self.api = FakeAPI()
+        self.tekdrive._session._request_wrapper._http = self.api
+        self.drive = FakeDrive(self.api)
+        self.storage = FakeStorage()
+        self.tekdrive._storage._http = self.storage
+        self.transfers = FakeTransfers(self.api, self.storage)
+
+    def _add_files(self, scheduler, tmp_path, sizes):
+        contents = {}
+        for idx, size in enumerate(sizes):
+            path = tmp_path / f"file{idx}.bin"
+            path.write_bytes(bytes([idx]) * size)
+            contents[str(path)] = path.read_bytes()
+            scheduler.add(str(path), parent_folder_id="fol_root")
+        return contents
+
+    def test_run_mixed_sizes(self, tmp_path):
+        scheduler = TransferScheduler(self.tekdrive)
+        contents = self._add_files(scheduler, tmp_path, [10, 2500, 20, 0, 1000])
+        results = scheduler.run()
+
+        assert [result.path for result in results] == list(contents)
+        assert all(result.ok for result in results)
+        for result in results:
+            assert self.transfers.contents(result.item.id) == contents[result.path]
+            assert result.item.name == result.path.rsplit("/", 1)[-1]
+        assert not any("/uploads" in call[1] for call in self.api.calls)
+        assert len(scheduler) == 0
+
+    def test_run_largest_first(self, tmp_path):
+        scheduler = TransferScheduler(self.tekdrive, workers=1)
+        self._add_files(scheduler, tmp_path, [10, 30, 20])
+        scheduler.run()
+        created = [
+            node["name"] for node in self.drive.nodes.values() if node["type"] == "FILE"
+        ]
+        assert created == ["file1.bin", "file2.bin", "file0.bin"]
+
+    def test_run_limits_bytes_in_flight(self, tmp_path):
+        self.storage.latency = 0.01
+        scheduler = TransferScheduler(
+            self.tekdrive, workers=8, max_bytes_in_flight=1000
+        )
+        self._add_files(scheduler, tmp_path, [400, 400, 300, 300, 300, 300])
+        results = scheduler.run()
+        assert all(result.ok for result in results)
+        assert scheduler._bytes.max_in_flight <= 1000
+        assert scheduler._bytes.in_flight == 0
+
+    def test_run_large_file_overlaps_small_files(self, tmp_path):
+        self.storage.latency = 0.05
+        scheduler = TransferScheduler(
+            self.tekdrive, workers=4, max_bytes_in_flight=1000
+        )
+        contents = self._add_files(scheduler, tmp_path, [100_000, 10, 10, 10])
+        results = scheduler.run()
+        assert all(result.ok for result in results)
+        for result in results:
+            assert self.transfers.contents(result.item.id) == contents[result.path]
+        assert self.storage.max_in_flight == 4
+        assert scheduler._bytes.max_in_flight <= 1000
+        assert scheduler._bytes.in_flight == 0
+
+    def test_run_limits_api_requests(self, tmp_path):
+        self.api.latency = 0.01
+        scheduler = TransferScheduler(self.tekdrive, workers=8, max_api_requests=2)
+        self._add_files(scheduler, tmp_path, [10] * 10)
+        scheduler.run()
+        assert self.api.max_in_flight == 2
+
+    def test_run_honors_rate_limit(self, tmp_path):
+        self.api.latency = 0.01
+        rate_limit = self.tekdrive._session._rate_limit
+        rate_limit.remaining, rate_limit.used = 1, 0
+        scheduler = TransferScheduler(self.tekdrive, workers=8, max_api_requests=8)
+        self._add_files(scheduler, tmp_path, [10] * 10)
+        scheduler.run()
+        assert self.api.max_in_flight == 1
+
+    def test_run_reports_failures(self, tmp_path):
+        scheduler = TransferScheduler(self.tekdrive)
+        self._add_files(scheduler, tmp_path, [10, 20])
+        self.storage.fail(lambda method, path: True, status_code=400)
+        results = scheduler.run()
+        assert sum(1 for result in results if result.ok) == 1
+        failed = next(result for result in results if not result.ok)
+        assert isinstance(failed.error, TekDriveStorageException)
+        assert failed.item is not None
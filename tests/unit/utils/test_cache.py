@@ -0,0 +1,45 @@
+import pickle
+
+from tekdrive.utils.cache import LRUCache
+
+from ..base import UnitTest
+
+
+class TestLRUCache(UnitTest):
+    def test_evicts_least_recently_used(self):
+        cache = LRUCache(2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        assert cache.get("a") == 1
+        cache.put("c", 3)
+        assert "b" not in cache
+        assert (cache.get("a"), cache.get("c")) == (1, 3)
+        assert len(cache) == 2
+
+    def test_put_drops_expired_items(self, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr("tekdrive.utils.cache.monotonic", lambda: now[0])
+        cache = LRUCache(10, ttl=30)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        now[0] += 10
+        cache.put("a", 3)
+        now[0] += 25
+        cache.put("c", 4)
+        assert len(cache) == 2
+        assert (cache.get("a"), cache.get("b"), cache.get("c")) == (3, None, 4)
+
+    def test_pop_and_default(self):
+        cache = LRUCache(2)
+        cache.put("a", 1)
+        assert cache.pop("a") == 1
+        assert cache.pop("a") is None
+        assert cache.get("a", "missing") == "missing"
+
+    def test_pickle(self):
+        cache = LRUCache(2)
+        cache.put("a", 1)
+        other = pickle.loads(pickle.dumps(cache))
+        assert other.get("a") == 1
+        other.put("b", 2)
+        assert len(other) == 2
@@ -0,0 +1,52 @@
+import json
+
+import pytest
+from tekdrive.utils.json_stream import JSONStream, iter_list, iter_nested
+
+from ..base import UnitTest
+
+
+def chunked(data, size):
+    text = json.dumps(data).encode("utf-8")
+    return [text[idx : idx + size] for idx in range(0, len(text), size)]
+
+
+def nested(depth, prefix="n"):
+    node = {"id": prefix, "name": f"näme {prefix}", "bytes": "12345"}
+    if depth:
+        node["children"] = [nested(depth - 1, f"{prefix}{idx}") for idx in range(3)]
+    return node
+
+
+class TestJSONStream(UnitTest):
+    @pytest.mark.parametrize("chunk_size", [1, 3, 64, 1 << 20])
+    def test_values_across_chunk_boundaries(self, chunk_size):
+        data = {"a": 12345, "b": [1.5, -2e10, 'x"y'], "c": {"d": None, "e": True}}
+        stream = JSONStream(chunked(data, chunk_size))
+        assert {key: stream.value() for key in stream.iter_object()} == data
+        assert stream.peek() == ""
+
+    @pytest.mark.parametrize("chunk_size", [1, 7, 1 << 20])
+    def test_iter_list(self, chunk_size):
+        data = {"results": [{"id": idx} for idx in range(50)], "meta": {"limit": 100}}
+        other = {}
+        items = list(iter_list(JSONStream(chunked(data, chunk_size)), other))
+        assert items == data["results"]
+        assert other == {"meta": {"limit": 100}}
+
+    @pytest.mark.parametrize("small_object_size", [16, 1 << 20])
+    def test_iter_nested_children_first(self, monkeypatch, small_object_size):
+        monkeypatch.setattr(
+            "tekdrive.utils.json_stream.SMALL_OBJECT_SIZE", small_object_size
+        )
+        stream = JSONStream(chunked(nested(3), 5))
+        nodes = list(iter_nested(stream))
+        assert len(nodes) == 1 + 3 + 9 + 27
+        assert nodes[-1]["id"] == "n"
+        assert nodes[0]["id"] == "n000"
+        assert all("children" not in node for node in nodes)
+        assert nodes[0]["name"] == "näme n000"
+
+    def test_invalid_json(self):
+        with pytest.raises(json.JSONDecodeError):
+            list(iter_list(JSONStream([b'{"results": [1 2]}']), {}))